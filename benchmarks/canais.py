@@ -0,0 +1,289 @@
+"""
+Benchmark de vazão e latência dos transportes de canal em loopback.
+
+Compara channels.Canal (minipar_full) com send_data/receive_data do
+interpretador legado (minipar/exec.py). Para cada combinação de transporte,
+tamanho de mensagem e concorrência (pares de canais em paralelo), sobe o lado
+receptor e o emissor em processos próprios e mede:
+
+- fluxo: o emissor envia `--mensagens` mensagens e espera uma confirmação
+  (mensagens/s e MB/s);
+- ida e volta: o receptor devolve cada mensagem (latência p50/p99).
+
+Uso: python benchmarks/canais.py [--tamanhos 16,4096,...] [--concorrencias 1,4]
+                                 [--json] [--saida resultado.json] [--base anterior.json]
+"""
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import threading
+import time
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(RAIZ, 'minipar_full', 'src'))
+
+from channels import Canal  # noqa: E402
+
+HOST = '127.0.0.1'
+TAMANHOS = (16, 256, 4096, 65536, 1 << 20, 16 << 20)  # 16 B a 16 MB
+LIMITE_LEGADO = 1024  # receive_data faz um único recv(1024)
+
+def carregar_legado():
+    """Importa minipar/exec.py sem conflitar com os módulos de minipar_full."""
+    spec = importlib.util.spec_from_file_location('exec_legado', os.path.join(RAIZ, 'minipar', 'exec.py'))
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+# --------------------------------------
+# Transportes
+# --------------------------------------
+class ParCanal:
+    """Um par de channels.Canal numa porta (a conexão serve aos dois sentidos)."""
+    @staticmethod
+    def portas(mensagens):
+        return 1
+
+    def __init__(self, porta, capacidade, mensagens):
+        self.porta = porta
+        self.capacidade = capacidade
+        self.canal = None
+
+    def abrir(self, papel):
+        self.canal = Canal(f"bench-{self.porta}", HOST, self.porta, capacidade=self.capacidade)
+        if papel == 'cliente':
+            self.canal._destino('cliente', prazo=5)  # O receptor só escuta ao chegar em accept
+
+    def enviar(self, carga):
+        self.canal.enviar_bytes(carga)
+
+    def receber(self):
+        return self.canal.receber_bytes()
+
+    def fechar(self):
+        self.canal.fechar()
+
+class ParLegado:
+    """
+    send_data/receive_data do interpretador legado: uma conexão por mensagem,
+    com portas separadas para cada sentido (como 9999/9998 no legado).
+    receive_data não usa SO_REUSEADDR, então a porta de uma mensagem fica
+    presa em TIME_WAIT; cada mensagem usa a próxima porta da sua faixa.
+    """
+    @staticmethod
+    def portas(mensagens):
+        return 2 * mensagens
+
+    def __init__(self, porta, capacidade, mensagens):
+        self.legado = carregar_legado()
+        ida, volta = porta, porta + mensagens
+        self.faixas = {'cliente': (ida, volta), 'servidor': (volta, ida)}
+        self.saida = self.entrada = None
+        self.enviadas = self.recebidas = 0
+
+    def abrir(self, papel):
+        self.saida, self.entrada = self.faixas[papel]
+
+    def enviar(self, carga):
+        dados = carga.decode() if isinstance(carga, bytes) else carga
+        porta = self.saida + self.enviadas
+        self.enviadas += 1
+        while True:  # O receptor só escuta ao chegar em receive_data
+            try:
+                return self.legado.send_data(HOST, porta, dados)
+            except ConnectionRefusedError:
+                time.sleep(0.0005)
+
+    def receber(self):
+        porta = self.entrada + self.recebidas
+        self.recebidas += 1
+        return self.legado.receive_data(HOST, porta)
+
+    def fechar(self):
+        pass
+
+TRANSPORTES = {'canal': ParCanal, 'legado': ParLegado}
+
+# --------------------------------------
+# Os dois lados
+# --------------------------------------
+def receptor(transporte, porta, capacidade, mensagens, amostras):
+    par = TRANSPORTES[transporte](porta, capacidade, mensagens + amostras + 1)
+    par.abrir('servidor')
+    for _ in range(mensagens):
+        par.receber()
+    par.enviar(b'ok')
+    for _ in range(amostras):
+        par.enviar(par.receber())
+    par.fechar()
+
+def emissor(transporte, porta, capacidade, tamanho, mensagens, amostras, resultado):
+    par = TRANSPORTES[transporte](porta, capacidade, mensagens + amostras + 1)
+    par.abrir('cliente')
+    carga = b'x' * tamanho
+    inicio = time.perf_counter()
+    for _ in range(mensagens):
+        par.enviar(carga)
+    par.receber()  # Confirmação: tudo foi recebido
+    resultado['fluxo'] = time.perf_counter() - inicio
+    latencias = []
+    for _ in range(amostras):
+        inicio = time.perf_counter()
+        par.enviar(carga)
+        par.receber()
+        latencias.append(time.perf_counter() - inicio)
+    resultado['latencias'] = latencias
+    par.fechar()
+
+def _em_threads(alvo, argumentos_por_par):
+    threads = [threading.Thread(target=alvo, args=args) for args in argumentos_por_par]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def processo_receptor(transporte, portas, capacidade, mensagens, amostras):
+    sys.stdout = open(os.devnull, 'w')
+    _em_threads(receptor, [(transporte, p, capacidade, mensagens, amostras) for p in portas])
+
+def processo_emissor(transporte, portas, capacidade, tamanho, mensagens, amostras, fila):
+    sys.stdout = open(os.devnull, 'w')
+    resultados = [{} for _ in portas]
+    inicio = time.perf_counter()
+    _em_threads(emissor, [(transporte, p, capacidade, tamanho, mensagens, amostras, r)
+                          for p, r in zip(portas, resultados)])
+    fila.put((time.perf_counter() - inicio, resultados))
+
+# --------------------------------------
+# Medição
+# --------------------------------------
+def percentil(valores, p):
+    """Percentil por posição (nearest-rank)."""
+    ordenados = sorted(valores)
+    indice = max(0, min(len(ordenados) - 1, round(p / 100 * len(ordenados) + 0.5) - 1))
+    return ordenados[indice]
+
+def medir(transporte, tamanho, mensagens, concorrencia, porta, opcoes):
+    """Mede uma configuração; retorna (resultado, próxima porta livre)."""
+    resultado = {'transporte': transporte, 'tamanho': tamanho, 'concorrencia': concorrencia}
+    if transporte == 'legado' and tamanho > LIMITE_LEGADO:
+        resultado['erro'] = f"receive_data lê no máximo {LIMITE_LEGADO} bytes por mensagem"
+        return resultado, porta
+    # Mensagens grandes: limita o volume por par para o benchmark terminar
+    mensagens = max(1, min(mensagens, opcoes.volume * (1 << 20) // tamanho))
+    amostras = max(1, min(opcoes.amostras, mensagens))
+    resultado.update(mensagens=mensagens, amostras=amostras)
+    largura = TRANSPORTES[transporte].portas(mensagens + amostras + 1)
+    if porta + largura * concorrencia > 65535:
+        resultado['erro'] = "portas insuficientes (reduza --mensagens ou use outra --porta)"
+        return resultado, porta
+    portas = [porta + largura * i for i in range(concorrencia)]
+    fila = multiprocessing.Queue()
+    lado_receptor = multiprocessing.Process(
+        target=processo_receptor, args=(transporte, portas, opcoes.capacidade, mensagens, amostras))
+    lado_emissor = multiprocessing.Process(
+        target=processo_emissor,
+        args=(transporte, portas, opcoes.capacidade, tamanho, mensagens, amostras, fila))
+    lado_receptor.start()
+    lado_emissor.start()
+    proxima = porta + largura * concorrencia
+    try:
+        duracao, pares = fila.get(timeout=opcoes.limite)
+    except Exception:
+        resultado['erro'] = f"tempo esgotado ({opcoes.limite}s)"
+        return resultado, proxima
+    finally:
+        for processo in (lado_emissor, lado_receptor):
+            processo.join(timeout=5)
+            if processo.is_alive():
+                processo.terminate()
+    fluxo = max(par['fluxo'] for par in pares)  # Os pares rodam ao mesmo tempo
+    total = mensagens * concorrencia
+    latencias = [latencia for par in pares for latencia in par['latencias']]
+    resultado.update(
+        segundos=round(duracao, 4),
+        mensagens_por_segundo=round(total / fluxo, 1),
+        mb_por_segundo=round(total * tamanho / fluxo / 1e6, 3),
+        latencia_p50_ms=round(percentil(latencias, 50) * 1000, 4),
+        latencia_p99_ms=round(percentil(latencias, 99) * 1000, 4),
+    )
+    return resultado, proxima
+
+def _chave(resultado):
+    return (resultado['transporte'], resultado['tamanho'], resultado['concorrencia'])
+
+def comparar(resultados, caminho, tolerancia):
+    """Lista as configurações cuja vazão caiu mais que `tolerancia` em relação à base."""
+    with open(caminho) as arquivo:
+        base = {_chave(r): r for r in json.load(arquivo)['resultados']}
+    regressoes = []
+    for atual in resultados:
+        anterior = base.get(_chave(atual))
+        if not anterior or 'erro' in atual or 'erro' in anterior:
+            continue
+        razao = atual['mensagens_por_segundo'] / anterior['mensagens_por_segundo']
+        if razao < 1 - tolerancia:
+            regressoes.append({'configuracao': _chave(atual), 'razao': round(razao, 3)})
+    return regressoes
+
+def _lista(texto):
+    return [int(valor) for valor in texto.split(',') if valor]
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    argumentos.add_argument('--transportes', default=','.join(TRANSPORTES))
+    argumentos.add_argument('--tamanhos', type=_lista, default=list(TAMANHOS), help="bytes por mensagem")
+    argumentos.add_argument('--mensagens', type=_lista, default=[1000], help="mensagens por par no fluxo")
+    argumentos.add_argument('--concorrencias', type=_lista, default=[1, 4], help="pares de canais em paralelo")
+    argumentos.add_argument('--amostras', type=int, default=200, help="idas e voltas para a latência")
+    argumentos.add_argument('--volume', type=int, default=64, help="MB máximos por par no fluxo")
+    argumentos.add_argument('--capacidade', type=int, default=0, help="buffer de channels.Canal")
+    argumentos.add_argument('--limite', type=float, default=120, help="segundos por configuração")
+    argumentos.add_argument('--porta', type=int, default=20000)
+    argumentos.add_argument('--json', action='store_true', help="uma linha JSON por configuração")
+    argumentos.add_argument('--saida', help="grava todos os resultados (com o ambiente) num arquivo JSON")
+    argumentos.add_argument('--base', help="resultado anterior (--saida) para detectar regressões")
+    argumentos.add_argument('--tolerancia', type=float, default=0.2, help="queda de vazão aceita (fração)")
+    opcoes = argumentos.parse_args()
+
+    resultados = []
+    porta = opcoes.porta
+    for transporte in opcoes.transportes.split(','):
+        for tamanho in opcoes.tamanhos:
+            for mensagens in opcoes.mensagens:
+                for concorrencia in opcoes.concorrencias:
+                    resultado, porta = medir(transporte, tamanho, mensagens, concorrencia, porta, opcoes)
+                    resultados.append(resultado)
+                    if opcoes.json:
+                        print(json.dumps(resultado), flush=True)
+                    else:
+                        _imprimir(resultado, cabecalho=len(resultados) == 1)
+
+    if opcoes.saida:
+        with open(opcoes.saida, 'w') as arquivo:
+            json.dump({'python': platform.python_version(), 'plataforma': platform.platform(),
+                       'data': time.strftime('%Y-%m-%dT%H:%M:%S'), 'resultados': resultados},
+                      arquivo, indent=2)
+    if opcoes.base:
+        regressoes = comparar(resultados, opcoes.base, opcoes.tolerancia)
+        for regressao in regressoes:
+            print(f"REGRESSÃO {regressao['configuracao']}: {regressao['razao']:.0%} da vazão anterior",
+                  file=sys.stderr)
+        sys.exit(1 if regressoes else 0)
+
+def _imprimir(r, cabecalho):
+    if cabecalho:
+        print(f"{'transporte':>10} {'tamanho':>9} {'conc':>4} {'msgs/s':>11} {'MB/s':>9} "
+              f"{'p50 ms':>9} {'p99 ms':>9}")
+    if 'erro' in r:
+        print(f"{r['transporte']:>10} {r['tamanho']:>9} {r['concorrencia']:>4}  {r['erro']}")
+        return
+    print(f"{r['transporte']:>10} {r['tamanho']:>9} {r['concorrencia']:>4} {r['mensagens_por_segundo']:>11.1f} "
+          f"{r['mb_por_segundo']:>9.2f} {r['latencia_p50_ms']:>9.3f} {r['latencia_p99_ms']:>9.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Benchmark de cargas reais: os programas de TO DO/ portados para MiniPar (e variantes maiores).
+
+Cada carga é uma pasta em benchmarks/programas/ com a saída esperada em
+`<carga>_expected.txt` e uma fonte por motor que consegue executá-la:
+`<carga>.mp` para o Executor de minipar_full e `<carga>.mpl` para o
+interpretador legado (minipar/exec.py), que só tem inteiros e não tem listas
+nem funções. Um motor novo entra em MOTORES com sua extensão e sua função de
+execução.
+
+Cada execução roda num processo novo (como `python main.py programa.mp`) e
+mede tempo total, tempo de execução (sem inicialização e análise), pico de
+memória (RSS) e nós visitados por segundo (contados numa execução à parte,
+para a contagem não pesar no tempo). A saída é comparada com a esperada e,
+com --historico, os resultados são acrescentados a um histórico JSON (fora da
+árvore ou num nome ignorado pelo git, como benchmarks/historico_cargas.json).
+
+Uso: python benchmarks/cargas.py [--cargas xor,quicksort] [--motores completo,generico,legado]
+                                 [--amostras 3] [--historico arquivo.json] [--base anterior.json]
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PROGRAMAS = os.path.join(RAIZ, 'benchmarks', 'programas')
+MARCA = '@@cargas '  # Prefixo da linha de medições que o processo filho escreve no stderr
+
+# --------------------------------------
+# Motores (executados no processo filho)
+# --------------------------------------
+def executar_completo(codigo, contar, especializar=True):
+    """Executor de minipar_full; retorna (segundos de análise, segundos de execução, nós visitados)."""
+    sys.path.insert(0, os.path.join(RAIZ, 'minipar_full', 'src'))
+    import parser as ps
+    import interpreter
+
+    inicio = time.perf_counter()
+    arvore = ps.analisar(codigo)
+    analise = time.perf_counter() - inicio
+    executor = interpreter.Executor(especializar=especializar)
+    nos = None
+    if contar:
+        nos = 0
+        visitar = executor.visitar
+
+        def visitar_contando(no):
+            nonlocal nos
+            nos += 1
+            return visitar(no)
+        executor.visitar = visitar_contando
+    inicio = time.perf_counter()
+    executor.executar(arvore)
+    return analise, time.perf_counter() - inicio, nos
+
+def executar_generico(codigo, contar):
+    """Executor de minipar_full sem a inferência de tipos (só nós genéricos), para comparação."""
+    return executar_completo(codigo, contar, especializar=False)
+
+def executar_legado(codigo, contar):
+    """minipar/exec.py; os "nós" são as chamadas de execute_stmt, evaluate_expr e execute_bool."""
+    sys.path.insert(0, os.path.join(RAIZ, 'minipar'))
+    import lexer
+    import parser as ps
+    import exec as legado
+
+    inicio = time.perf_counter()
+    arvore = ps.parser.parse(codigo, lexer=lexer.lexer)
+    analise = time.perf_counter() - inicio
+    if legado.has_error or not arvore:
+        raise RuntimeError("erro de análise")
+    contagem = [0]
+    if contar:
+        for nome in ('execute_stmt', 'evaluate_expr', 'execute_bool'):
+            original = getattr(legado, nome)
+
+            def contando(*args, _original=original):
+                contagem[0] += 1
+                return _original(*args)
+            setattr(legado, nome, contando)  # As chamadas recursivas passam pelo global do módulo
+    inicio = time.perf_counter()
+    legado.execute_stmt(arvore)
+    legado.flush_output()
+    return analise, time.perf_counter() - inicio, contagem[0] if contar else None
+
+# {nome: (extensão da fonte, função de execução)}
+MOTORES = {
+    'completo': ('.mp', executar_completo),
+    'generico': ('.mp', executar_generico),
+    'legado': ('.mpl', executar_legado),
+}
+
+def processo_filho(motor, caminho, contar):
+    """Executa um programa e escreve as medições numa linha do stderr (depois da saída do programa)."""
+    with open(caminho, 'r') as arquivo:
+        codigo = arquivo.read()
+    analise, execucao, nos = MOTORES[motor][1](codigo, contar)
+    sys.stdout.flush()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        rss *= 1024  # Linux informa em KB, macOS em bytes
+    print(MARCA + json.dumps({'segundos_analise': analise, 'segundos_execucao': execucao,
+                              'rss_bytes': rss, 'nos': nos}), file=sys.stderr)
+
+# --------------------------------------
+# Medição
+# --------------------------------------
+def normalizar(texto):
+    """Ignora espaços no fim das linhas e linhas vazias no final."""
+    linhas = [linha.rstrip() for linha in texto.splitlines()]
+    while linhas and not linhas[-1]:
+        linhas.pop()
+    return linhas
+
+def rodar(motor, caminho, limite, contar=False):
+    """Executa num processo novo; retorna (saída, medições, segundos totais)."""
+    comando = [sys.executable, os.path.abspath(__file__), '--filho', motor, caminho]
+    if contar:
+        comando.append('--contar')
+    inicio = time.perf_counter()
+    processo = subprocess.run(comando, capture_output=True, text=True, timeout=limite,
+                              cwd=os.path.dirname(caminho))
+    total = time.perf_counter() - inicio
+    linhas = processo.stderr.splitlines()
+    medicoes = next((json.loads(linha[len(MARCA):]) for linha in reversed(linhas) if linha.startswith(MARCA)), None)
+    if processo.returncode != 0 or medicoes is None:
+        erro = [linha for linha in linhas if not linha.startswith(MARCA)]
+        raise RuntimeError(erro[-1] if erro else f"código de saída {processo.returncode}")
+    return processo.stdout, medicoes, total
+
+def medir(carga, motor, opcoes):
+    extensao = MOTORES[motor][0]
+    pasta = os.path.join(PROGRAMAS, carga)
+    caminho = os.path.join(pasta, carga + extensao)
+    resultado = {'carga': carga, 'motor': motor}
+    if not os.path.exists(caminho):
+        resultado['estado'] = 'sem porte'
+        return resultado
+    with open(os.path.join(pasta, f"{carga}_expected.txt"), 'r') as arquivo:
+        esperada = normalizar(arquivo.read())
+    totais, execucoes, rss = [], [], []
+    try:
+        for _ in range(opcoes.amostras):
+            saida, medicoes, total = rodar(motor, caminho, opcoes.limite)
+            if normalizar(saida) != esperada:
+                resultado['estado'] = 'saída diferente'
+                return resultado
+            totais.append(total)
+            execucoes.append(medicoes['segundos_execucao'])
+            rss.append(medicoes['rss_bytes'])
+        _, contagem, _ = rodar(motor, caminho, opcoes.limite * 4, contar=True)
+    except subprocess.TimeoutExpired:
+        resultado['estado'] = f"tempo esgotado ({opcoes.limite}s)"
+        return resultado
+    except RuntimeError as e:
+        resultado['estado'] = f"erro: {e}"
+        return resultado
+    execucao = statistics.median(execucoes)
+    resultado.update(
+        estado='ok',
+        segundos=round(statistics.median(totais), 4),
+        segundos_execucao=round(execucao, 4),
+        rss_mb=round(max(rss) / (1 << 20), 1),
+        nos=contagem['nos'],
+        nos_por_segundo=round(contagem['nos'] / execucao) if execucao else None,
+    )
+    return resultado
+
+# --------------------------------------
+# Histórico
+# --------------------------------------
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=RAIZ, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+def registrar(caminho, resultados):
+    """Acrescenta a rodada ao histórico (uma lista de rodadas em JSON)."""
+    historico = []
+    if os.path.exists(caminho):
+        with open(caminho) as arquivo:
+            historico = json.load(arquivo)
+    historico.append({'data': time.strftime('%Y-%m-%dT%H:%M:%S'), 'commit': _commit(),
+                      'python': platform.python_version(), 'plataforma': platform.platform(),
+                      'resultados': resultados})
+    with open(caminho, 'w') as arquivo:
+        json.dump(historico, arquivo, indent=2)
+
+def comparar(resultados, caminho, tolerancia):
+    """Cargas cujo tempo de execução piorou mais que `tolerancia` em relação à última rodada do histórico."""
+    with open(caminho) as arquivo:
+        rodadas = json.load(arquivo)
+    if not rodadas:
+        return []
+    base = {(r['carga'], r['motor']): r for r in rodadas[-1]['resultados'] if r.get('estado') == 'ok'}
+    regressoes = []
+    for atual in resultados:
+        anterior = base.get((atual['carga'], atual['motor']))
+        if anterior and atual.get('estado') == 'ok':
+            razao = atual['segundos_execucao'] / anterior['segundos_execucao']
+            if razao > 1 + tolerancia:
+                regressoes.append({'carga': atual['carga'], 'motor': atual['motor'], 'razao': round(razao, 3)})
+    return regressoes
+
+def _imprimir(r, cabecalho):
+    if cabecalho:
+        print(f"{'carga':<22} {'motor':<9} {'total s':>8} {'exec s':>8} {'RSS MB':>7} {'nós/s':>11}")
+    if r['estado'] != 'ok':
+        print(f"{r['carga']:<22} {r['motor']:<9}  {r['estado']}")
+        return
+    print(f"{r['carga']:<22} {r['motor']:<9} {r['segundos']:>8.3f} {r['segundos_execucao']:>8.3f} "
+          f"{r['rss_mb']:>7.1f} {r['nos_por_segundo'] or 0:>11,}")
+
+def _imprimir_razoes(resultados):
+    """Tempo de execução de cada motor relativo ao primeiro, nas cargas que rodaram em mais de um."""
+    por_carga = {}
+    for r in resultados:
+        if r['estado'] == 'ok':
+            por_carga.setdefault(r['carga'], []).append(r)
+    for carga, medidos in por_carga.items():
+        if len(medidos) > 1:
+            base = medidos[0]
+            for outro in medidos[1:]:
+                print(f"{carga}: {outro['motor']} / {base['motor']} = "
+                      f"{outro['segundos_execucao'] / max(base['segundos_execucao'], 1e-9):.2f}x")
+
+def main():
+    if sys.argv[1:2] == ['--filho']:
+        return processo_filho(sys.argv[2], sys.argv[3], '--contar' in sys.argv[4:])
+
+    cargas = sorted(nome for nome in os.listdir(PROGRAMAS) if os.path.isdir(os.path.join(PROGRAMAS, nome)))
+    argumentos = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    argumentos.add_argument('--cargas', default=','.join(cargas))
+    argumentos.add_argument('--motores', default=','.join(MOTORES))
+    argumentos.add_argument('--amostras', type=int, default=3, help="execuções medidas por carga e motor")
+    argumentos.add_argument('--limite', type=float, default=300, help="segundos por execução")
+    argumentos.add_argument('--json', action='store_true', help="uma linha JSON por carga e motor")
+    argumentos.add_argument('--historico', metavar='ARQUIVO',
+                            help="acrescenta a rodada a este arquivo JSON (por padrão, nada é gravado)")
+    argumentos.add_argument('--base', help="histórico anterior: compara com a última rodada dele")
+    argumentos.add_argument('--tolerancia', type=float, default=0.2, help="aumento de tempo aceito (fração)")
+    opcoes = argumentos.parse_args()
+
+    resultados = []
+    for carga in opcoes.cargas.split(','):
+        for motor in opcoes.motores.split(','):
+            resultado = medir(carga, motor, opcoes)
+            resultados.append(resultado)
+            if opcoes.json:
+                print(json.dumps(resultado), flush=True)
+            else:
+                _imprimir(resultado, cabecalho=len(resultados) == 1)
+
+    if not opcoes.json:
+        _imprimir_razoes(resultados)
+    if opcoes.base:
+        regressoes = comparar(resultados, opcoes.base, opcoes.tolerancia)
+    if opcoes.historico:
+        registrar(opcoes.historico, resultados)
+    if opcoes.base:
+        for regressao in regressoes:
+            print(f"REGRESSÃO {regressao['carga']} ({regressao['motor']}): "
+                  f"{regressao['razao']:.2f}x o tempo anterior", file=sys.stderr)
+        sys.exit(1 if regressoes else 0)
+    sys.exit(0 if all(r['estado'] in ('ok', 'sem porte') for r in resultados) else 1)
+
+if __name__ == "__main__":
+    main()
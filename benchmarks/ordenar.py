@@ -0,0 +1,126 @@
+"""
+Benchmark da nativa sort contra um quicksort interpretado em MiniPar.
+
+Os dois programas geram a mesma List<Float> de n valores (mapa logístico,
+x = 3.99 * x * (1 - x): pseudoaleatório só com * e -) e a ordenam; o tempo
+de ordenação é o total menos o de um programa que só gera a lista. A saída
+dos dois (primeiro, do meio e último elementos) é conferida. O sort
+nativo roda num processo só e no modo paralelo (trechos em --processos
+processos + intercalação), forçado mesmo abaixo do limiar.
+
+Uso: python benchmarks/ordenar.py [--n 1000000] [--processos 4] [--sem-quicksort] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'minipar_full', 'src'))
+
+import interpreter  # noqa: E402
+import ordenacao  # noqa: E402
+import parser as ps  # noqa: E402
+from saida import SaidaLista  # noqa: E402
+
+GERAR = """
+    List<Float> v = [];
+    Float x = 0.1234;
+    Int i = 0;
+    while (i < {n}) {{
+        x = 3.99 * x * (1 - x);
+        append(v, x);
+        i += 1;
+    }}
+"""
+
+# Lomuto com o pivô no último elemento, trocando na própria lista
+QUICKSORT = """
+    def particionar(v, inicio, fim) {
+        Float pivo = v[fim];
+        Float troca = 0.0;
+        Int i = inicio - 1;
+        Int j = inicio;
+        while (j < fim) {
+            if (v[j] <= pivo) {
+                i += 1;
+                troca = v[i];
+                v[i] = v[j];
+                v[j] = troca;
+            }
+            j += 1;
+        }
+        troca = v[i + 1];
+        v[i + 1] = v[fim];
+        v[fim] = troca;
+        return i + 1;
+    }
+
+    def quicksort(v, inicio, fim) {
+        if (inicio < fim) {
+            Int p = particionar(v, inicio, fim);
+            quicksort(v, inicio, p - 1);
+            quicksort(v, p + 1, fim);
+        }
+    }
+
+    quicksort(v, 0, len(v) - 1);
+"""
+
+NATIVO = """
+    v = sort(v);
+"""
+
+CONFERIR = """
+    output(v[0], v[{meio}], v[{ultimo}]);
+"""
+
+def programa(n, ordenar):
+    corpo = GERAR.format(n=n) + ordenar + CONFERIR.format(meio=n // 2, ultimo=n - 1)
+    return "SEQ {\n" + corpo + "}\n"
+
+def executar(codigo):
+    """Segundos de execução (sem a análise) e a saída do programa."""
+    arvore = ps.analisar(codigo)
+    saida = SaidaLista()
+    executor = interpreter.Executor(saida=saida)
+    inicio = time.perf_counter()
+    executor.executar(arvore)
+    return time.perf_counter() - inicio, saida.valor()
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--n', type=int, default=10 ** 6)
+    argumentos.add_argument('--processos', type=int, default=max(os.cpu_count() or 1, 2))
+    argumentos.add_argument('--sem-quicksort', action='store_true', help="não roda o quicksort interpretado (lento)")
+    argumentos.add_argument('--json', action='store_true')
+    opcoes = argumentos.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100_000))  # Pior caso do quicksort: recursão profunda
+
+    geracao, _ = executar(programa(opcoes.n, ""))
+    resultados = {'n': opcoes.n, 'cpus': os.cpu_count(), 'segundos_geracao': geracao}
+    saidas = {}
+    medicoes = [('sort', NATIVO, 1, ordenacao.LIMIAR_PARALELO),
+                ('sort paralelo', NATIVO, opcoes.processos, 0)]
+    if not opcoes.sem_quicksort:
+        medicoes.append(('quicksort interpretado', QUICKSORT, 1, ordenacao.LIMIAR_PARALELO))
+    for nome, ordenar, processos, limiar in medicoes:
+        ordenacao.PROCESSOS, ordenacao.LIMIAR_PARALELO = processos, limiar
+        total, saidas[nome] = executar(programa(opcoes.n, ordenar))
+        resultados[nome] = max(total - geracao, 0.0)
+
+    if len(set(saidas.values())) != 1:
+        print(f"ERRO: saídas diferentes: {saidas}", file=sys.stderr)
+        sys.exit(1)
+    if opcoes.json:
+        print(json.dumps(resultados, indent=2))
+        return
+    print(f"n = {opcoes.n:,}  ({resultados['cpus']} CPUs; geração da lista: {geracao:.2f} s)")
+    for nome, *_ in medicoes:
+        print(f"{nome:<24} {resultados[nome]:10.3f} s")
+    if 'quicksort interpretado' in resultados:
+        razao = resultados['quicksort interpretado'] / max(resultados['sort'], 1e-9)
+        print(f"quicksort interpretado / sort = {razao:,.0f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark do pipeline de pedidos/respostas (channels.CanalPipeline) em loopback.
+
+Para cada profundidade, sobe um servidor em outro processo (que atende com
+tantas threads quanto a profundidade e simula `--atraso` ms de processamento
+por pedido) e mede quantos pedidos por segundo o cliente consegue completar.
+
+Uso: python benchmarks/pipeline.py [--pedidos 2000] [--atraso 1.0] [--json]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'minipar_full', 'src'))
+
+from channels import CanalPipeline  # noqa: E402
+
+PROFUNDIDADES = (1, 2, 4, 8, 16, 32, 64)
+
+def servidor(porta, profundidade, atraso, pronto):
+    canal = CanalPipeline('servidor', '127.0.0.1', porta, pipeline=profundidade)
+    pronto.set()
+
+    def calcular(dados):
+        time.sleep(atraso)
+        return dados
+
+    canal.servir(calcular, concorrencia=profundidade)
+
+def medir(porta, profundidade, pedidos, atraso):
+    pronto = multiprocessing.Event()
+    processo = multiprocessing.Process(target=servidor, args=(porta, profundidade, atraso, pronto))
+    processo.start()
+    pronto.wait()
+    canal = CanalPipeline('cliente', '127.0.0.1', porta, pipeline=profundidade)
+    canal._destino('cliente', prazo=5)  # O servidor só escuta ao chegar em accept
+    carga = b'x' * 64
+    inicio = time.perf_counter()
+    em_transito = 0
+    for _ in range(pedidos):
+        if em_transito == profundidade:
+            canal.receber_bytes()
+            em_transito -= 1
+        canal.enviar_bytes(carga)
+        em_transito += 1
+    for _ in range(em_transito):
+        canal.receber_bytes()
+    duracao = time.perf_counter() - inicio
+    canal.fechar()
+    processo.join()
+    return {'profundidade': profundidade, 'pedidos': pedidos, 'segundos': round(duracao, 4),
+            'pedidos_por_segundo': round(pedidos / duracao, 1)}
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    argumentos.add_argument('--pedidos', type=int, default=2000)
+    argumentos.add_argument('--atraso', type=float, default=1.0, help="processamento simulado por pedido (ms)")
+    argumentos.add_argument('--porta', type=int, default=19700)
+    argumentos.add_argument('--json', action='store_true', help="uma linha JSON por profundidade")
+    opcoes = argumentos.parse_args()
+
+    sys.stdout = open(os.devnull, 'w') if opcoes.json else sys.stdout
+    resultados = []
+    base = None
+    for i, profundidade in enumerate(PROFUNDIDADES):
+        resultado = medir(opcoes.porta + i, profundidade, opcoes.pedidos, opcoes.atraso / 1000)
+        base = base or resultado['pedidos_por_segundo']
+        resultado['ganho'] = round(resultado['pedidos_por_segundo'] / base, 2)
+        resultados.append(resultado)
+    sys.stdout = sys.__stdout__
+    if opcoes.json:
+        for resultado in resultados:
+            print(json.dumps(resultado))
+    else:
+        print(f"{'profundidade':>12} {'pedidos/s':>12} {'ganho':>7}")
+        for r in resultados:
+            print(f"{r['profundidade']:>12} {r['pedidos_por_segundo']:>12.1f} {r['ganho']:>6.2f}x")
+
+if __name__ == "__main__":
+    main()
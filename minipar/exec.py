@@ -1,9 +1,62 @@
 import socket
+import sys
 import threading
 
 has_error = False
 symbol_table = {}
 channels = {}
+output_sink = None  # Destino do output: qualquer objeto com write() (None = sys.stdout)
+output_buffer_size = 0  # 0 = sem buffer: cada output vai direto para o destino
+output_ordered = False  # PAR: saída de cada ramo contígua e na ordem dos ramos
+_output_local = threading.local()  # Buffer da thread atual
+_output_lock = threading.Lock()
+
+def set_output_sink(sink):
+    global output_sink
+    output_sink = sink
+
+def set_output_buffering(size, ordered=False):
+    """Liga o buffer por thread: entrega em blocos de `size` caracteres (linhas inteiras)."""
+    global output_buffer_size, output_ordered
+    output_buffer_size = size
+    output_ordered = ordered
+
+def write_output(text):
+    text = str(text)
+    if output_buffer_size <= 0 and not output_ordered:
+        (output_sink or sys.stdout).write(text)
+        return
+    if getattr(_output_local, 'buffer', None) is None:
+        _output_local.buffer, _output_local.held = [], False
+    _output_local.buffer.append(text)
+    _output_local.size = getattr(_output_local, 'size', 0) + len(text)
+    if not _output_local.held and _output_local.size >= output_buffer_size:
+        flush_output(whole_lines=True)
+
+def flush_output(whole_lines=False):
+    """Entrega o buffer da thread atual."""
+    buffer = getattr(_output_local, 'buffer', None)
+    if not buffer:
+        return
+    text = ''.join(buffer)
+    rest = ''
+    if whole_lines:
+        cut = text.rfind('\n') + 1
+        text, rest = text[:cut], text[cut:]
+    buffer[:] = [rest] if rest else []
+    _output_local.size = len(rest)
+    if text:
+        with _output_lock:
+            (output_sink or sys.stdout).write(text)
+
+def _execute_branch(stmt, buffer):
+    """Executa um ramo de PAR com seu próprio buffer de saída."""
+    _output_local.buffer, _output_local.held, _output_local.size = buffer, output_ordered, 0
+    try:
+        execute_stmt(stmt)
+    finally:
+        if not output_ordered:
+            flush_output()
 
 # Funções de execução para cada tipo de instrução
 def execute_stmt(stmt):     
@@ -15,13 +68,20 @@ def execute_stmt(stmt):
     
     elif stmt[0] == 'PAR':
         threads = []
+        buffers = [[] for _ in stmt[1]]
+        if not getattr(_output_local, 'held', False):
+            flush_output()  #o que foi escrito antes do PAR sai antes da saída dos ramos
         #para cada instrução no bloco PAR, coloque tem uma thread e execute.
-        for s in stmt[1]:
-            thread = threading.Thread(target=execute_stmt, args=(s,))
+        for s, buffer in zip(stmt[1], buffers):
+            thread = threading.Thread(target=_execute_branch, args=(s, buffer))
             threads.append(thread)
             thread.start()
         for thread in threads:
             thread.join()
+        if output_ordered:
+            #saída dos ramos, na ordem do código, segue para o buffer de quem executou o PAR
+            for buffer in buffers:
+                write_output(''.join(buffer))
             
     elif stmt[0] == 'IF':
         if execute_bool(stmt[1]):
@@ -33,6 +93,7 @@ def execute_stmt(stmt):
                 execute_stmt(s)
     elif stmt[0] == 'INPUT':
         var_name = stmt[1]
+        flush_output()  #o que foi escrito antes aparece antes de esperar a entrada
         var_value = input()
         symbol_table[var_name] = var_value
 
@@ -102,10 +163,10 @@ def execute_output(v):
     var_value = symbol_table.get(var_name, None)
     if var_value is not None:           #Se está na tabela de símbolos...
         formatted_output = var_value
-        print(formatted_output, end='')     #end='' garante que não pule linha automaticamente
+        write_output(formatted_output)     #sem quebra de linha automática, como print(..., end='')
     else:
         formatted_output = var_name.replace("\\n", "\n")    #substitui qualquer \n na string pela quebra de linha real
-        print(formatted_output, end='')
+        write_output(formatted_output)
 
 #executa expressões booleanas
 def execute_bool(expr):
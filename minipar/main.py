@@ -12,12 +12,17 @@ def read_program_from_file(file_path):
     return program
 
 def main():
+    #Opções de saída: --buffer (blocos por thread) e --ordenada (PAR com saída contígua, na ordem dos ramos)
+    options = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     #Verifica se comando no terminal numero de argumentos diferente do esperado (2)
-    if len(sys.argv) != 2:
-        print("Uso: python main.py <nome_do_program.mp> ou minipar <nome_do_programa>")
+    if len(args) != 1 or set(options) - {'--buffer', '--ordenada'}:
+        print("Uso: python main.py <nome_do_program.mp> [--buffer] [--ordenada] ou minipar <nome_do_programa>")
         sys.exit(1)
 
-    program_file = sys.argv[1]
+    program_file = args[0]
+    if options:
+        exec.set_output_buffering(64 * 1024 if '--buffer' in options else 0, '--ordenada' in options)
 
     # Verifica se o programa é inexistente
     if not os.path.exists(program_file):
@@ -33,6 +38,7 @@ def main():
     if result:
         if not exec.has_error:
             exec.execute_stmt(result)
+            exec.flush_output()
         else:
             pass
 
@@ -1,49 +1,574 @@
+import collections
+import itertools
+import queue
+import select
 import socket
+import struct
+import threading
+import time
+import metricas
+from compressao import Compressor, MINIMO_PADRAO, SEM_COMPRESSAO, descomprimir
+
+# Cada mensagem trafega como um quadro: tamanho (4 bytes, big-endian) + codec
+# (1 byte, ver compressao.CODECS) + dados. O enquadramento permite agrupar
+# várias mensagens num único sendall.
+_CABECALHO = struct.Struct('!IB')
+_NEGOCIACAO = 0x80         # Quadro de controle com os codecs aceitos por um lado
+_ESPERA_NEGOCIACAO = 2.0   # Segundos aguardando a oferta do outro lado
+_TAMANHO_LOTE = 64 * 1024  # Limite de bytes agrupados por sendall
+_FIM = object()            # Sentinela que encerra a thread de envio
+ESPERA_CONEXAO = 30.0      # Segundos tentando conectar em segundo plano (o servidor pode subir depois)
+
+def conectar_com_espera(host, port, prazo=0):
+    """Conecta a host:porta, repetindo enquanto a conexão for recusada por até `prazo` segundos."""
+    limite = time.monotonic() + prazo
+    espera = 0.01
+    while True:
+        try:
+            return socket.create_connection((host, port))
+        except ConnectionRefusedError:
+            if time.monotonic() >= limite:
+                raise
+            time.sleep(espera)
+            espera = min(espera * 2, 0.5)
+
+def conferir_opcao(canal_id, nome, valor, tipo, minimo=0):
+    """Valida o valor de uma opção de declaração: inteiro (>= minimo) ou bool."""
+    if tipo is bool:
+        valido = isinstance(valor, bool)
+    else:
+        valido = type(valor) is int and valor >= minimo
+    if not valido:
+        esperado = 'true ou false' if tipo is bool else f'um inteiro >= {minimo}'
+        raise ValueError(f"Opção {nome}={valor!r} inválida para o canal '{canal_id}' (use {esperado})")
+    return valor
 
 class Canal:
-    def __init__(self, id, host, port):
+    # Opções aceitas na declaração: c_channel = id "host" porta opcao=valor, ...;
+    OPCOES = ('capacidade', 'compressao', 'compressao_minima', 'keepalive', 'nodelay')
+
+    def __init__(self, id, host, port, capacidade=0, compressao=None,
+                 compressao_minima=MINIMO_PADRAO, keepalive=False, nodelay=False):
+        conferir_opcao(id, 'capacidade', capacidade, int)
+        conferir_opcao(id, 'compressao_minima', compressao_minima, int)
+        conferir_opcao(id, 'nodelay', nodelay, bool)
+        if not isinstance(keepalive, bool):
+            conferir_opcao(id, 'keepalive', keepalive, int, minimo=1)  # true/false ou segundos
+        if compressao is not None and not isinstance(compressao, str):
+            raise ValueError(f"Opção compressao={compressao!r} inválida para o canal '{id}'")
         self.id = id
         self.host = host
         self.port = port
         self.socket = None
         self.connection = None  # Usado no modo servidor
+        self.capacidade = capacidade
+        self.papel = None  # 'cliente' ou 'servidor', definido na primeira operação
+        self._trava_conexao = threading.Lock()
+        self._thread_conexao = None  # Conexão antecipada em segundo plano (preconectar)
+        self._erro_conexao = None
+        self.keepalive = keepalive  # True ou segundos de ociosidade antes das sondas
+        self.nodelay = nodelay
+        self._recebidos = bytearray()  # Bytes lidos do socket ainda não consumidos
+        # Canal com buffer: fila limitada + thread de E/S que esvazia a fila
+        self._fila = queue.Queue(maxsize=capacidade) if capacidade > 0 else None
+        self._thread_envio = None
+        self._erro_envio = None
+        # Compressão negociada ao conectar: 'zlib', 'lzma' ou 'auto'
+        self.compressor = Compressor(compressao, compressao_minima) if compressao else None
+        self._oferta_enviada = False
+        self._adiantados = collections.deque()  # Mensagens lidas durante a negociação
+        self._negociado = threading.Event()     # Leituras esperam a negociação terminar
+        if not self.compressor:
+            self._negociado.set()
+        self._trava_socket = threading.Lock()   # Toda escrita no socket (quadros não se misturam)
+        self.metricas = metricas.registrar(id)
+        self.metricas.compressor = self.compressor
 
     def iniciar_servidor(self):
         """Configura o servidor para receber conexões."""
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.socket.bind((self.host, self.port))
         self.socket.listen(1)
         print(f"[{self.id}] Servidor aguardando conexões em {self.host}:{self.port}...")
+        inicio = time.perf_counter()
         self.connection, addr = self.socket.accept()
+        self.metricas.registrar_accept(time.perf_counter() - inicio)
         print(f"[{self.id}] Conexão estabelecida com {addr}")
 
-    def conectar(self):
-        """Conecta ao servidor como cliente."""
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.connect((self.host, self.port))
+    def conectar(self, prazo=0):
+        """Conecta ao servidor como cliente (insistindo por até `prazo` segundos)."""
+        self.socket = conectar_com_espera(self.host, self.port, prazo)
         print(f"[{self.id}] Conectado a {self.host}:{self.port}")
 
+    def _destino(self, papel, prazo=0):
+        """
+        Retorna o socket conectado, estabelecendo a conexão se necessário.
+        Como no interpretador legado, quem envia primeiro conecta (cliente)
+        e quem recebe primeiro escuta (servidor).
+        """
+        antecipada = self._thread_conexao
+        if antecipada is not None and antecipada is not threading.current_thread():
+            antecipada.join()
+            self._thread_conexao = None
+            if self._erro_conexao:
+                erro, self._erro_conexao = self._erro_conexao, None
+                raise ConnectionError(f"[{self.id}] Falha ao conectar: {erro}")
+        negociar = False
+        with self._trava_conexao:
+            if self.connection is None and self.socket is None:
+                self.papel = papel
+                if papel == 'cliente':
+                    self.conectar(prazo)
+                else:
+                    self.iniciar_servidor()
+                self._configurar(self.connection if self.connection else self.socket)
+                negociar = self.compressor is not None
+        conexao = self.connection if self.connection else self.socket
+        if negociar:
+            self._negociar(conexao)  # Fora da trava: a espera pela oferta não segura as outras threads
+        return conexao
+
+    def preconectar(self, papel):
+        """
+        Estabelece a conexão (connect ou accept) em segundo plano, para que a
+        primeira operação a encontre pronta. Um erro aparece nessa operação.
+        """
+        if self._thread_conexao is not None or self.socket is not None:
+            return
+        self._thread_conexao = threading.Thread(
+            target=self._conectar_em_segundo_plano, args=(papel,),
+            name=f"canal-{self.id}-conexao", daemon=True
+        )
+        self._thread_conexao.start()
+
+    def _conectar_em_segundo_plano(self, papel):
+        try:
+            self._destino(papel, prazo=ESPERA_CONEXAO)
+        except OSError as e:
+            self._erro_conexao = e
+
+    def _configurar(self, conexao):
+        """Ajusta o socket recém-conectado e negocia a compressão."""
+        if self.nodelay:
+            conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.keepalive:
+            conexao.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # keepalive=N: primeira sonda após N segundos ociosos (onde o sistema permitir)
+            if not isinstance(self.keepalive, bool) and hasattr(socket, 'TCP_KEEPIDLE'):
+                conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, int(self.keepalive))
+                conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, int(self.keepalive))
+        if self.compressor:
+            self._enviar_oferta(conexao)
+
+    def _negociar(self, conexao):
+        """
+        Aguarda os codecs do outro lado (a oferta deste já foi enviada). Se
+        ele não responder a tempo (canal sem compressão do outro lado), segue
+        sem comprimir; uma oferta que chegue depois ainda é aproveitada.
+        Enquanto isso, envios de outras threads seguem sem compressão.
+        """
+        prazo = time.monotonic() + _ESPERA_NEGOCIACAO
+        try:
+            while True:
+                codec, carga = self._ler_quadro(conexao, prazo)
+                if codec == _NEGOCIACAO:
+                    self.compressor.combinar(carga.decode().split(','))
+                    break
+                self._adiantados.append(descomprimir(codec, carga))
+        except socket.timeout:
+            pass
+        finally:
+            self._negociado.set()
+
+    def _enviar_oferta(self, conexao):
+        """Envia os codecs aceitos por este lado, uma única vez."""
+        oferta = ','.join(self.compressor.oferta()) if self.compressor else ''
+        with self._trava_socket:
+            if not self._oferta_enviada:
+                conexao.sendall(_CABECALHO.pack(len(oferta), _NEGOCIACAO) + oferta.encode())
+                self._oferta_enviada = True
+
+    def _escrever(self, conexao, dados):
+        with self._trava_socket:
+            conexao.sendall(dados)
+
     def enviar(self, dados):
-        """Envia dados pelo socket."""
+        """Envia dados pelo socket (ou pela fila, se o canal tiver buffer)."""
         if isinstance(dados, (list, dict)):
             dados = str(dados)  # Serialização simplificada (pode usar JSON)
-        if self.connection:  # Modo servidor
-            self.connection.sendall(dados.encode())
-        elif self.socket:    # Modo cliente
-            self.socket.sendall(dados.encode())
-        print(f"[{self.id}] Dados enviados: {dados}")
+        self.enviar_bytes(dados.encode())
+
+    def enviar_bytes(self, carga):
+        """Envia um quadro com bytes já serializados."""
+        inicio = time.perf_counter()
+        codec = SEM_COMPRESSAO
+        if self.compressor:
+            self._destino('cliente')  # Conecta (e negocia) antes de escolher o codec
+            codec, carga = self.compressor.comprimir(carga)
+        quadro = _CABECALHO.pack(len(carga), codec) + carga
+        if self._fila is not None:
+            self._enfileirar(quadro)
+        else:
+            self._escrever(self._destino('cliente'), quadro)
+        self.metricas.registrar_envio(len(quadro), time.perf_counter() - inicio)
+
+    def _enfileirar(self, quadro):
+        """Coloca o quadro na fila; bloqueia apenas se o buffer estiver cheio."""
+        if self._erro_envio:
+            raise self._erro_envio
+        if self._thread_envio is None:
+            self._thread_envio = threading.Thread(
+                target=self._laco_envio, name=f"canal-{self.id}-envio", daemon=True
+            )
+            self._thread_envio.start()
+        self._fila.put(quadro)
+        self.metricas.registrar_fila(self._fila.qsize())
+
+    def _laco_envio(self):
+        """Thread de E/S: junta os quadros disponíveis e envia num único sendall."""
+        destino = None
+        while True:
+            item = self._fila.get()
+            self.metricas.registrar_fila(self._fila.qsize())
+            lote, tamanho, fim = [], 0, False
+            while True:
+                if item is _FIM:
+                    fim = True
+                    break
+                lote.append(item)
+                tamanho += len(item)
+                if tamanho >= _TAMANHO_LOTE:
+                    break
+                try:
+                    item = self._fila.get_nowait()
+                except queue.Empty:
+                    break
+            if lote and self._erro_envio is None:
+                try:
+                    if destino is None:
+                        destino = self._destino('cliente')
+                    self._escrever(destino, b''.join(lote))
+                except OSError as e:
+                    # Continua esvaziando a fila para não travar quem envia
+                    self._erro_envio = e
+            for _ in range(len(lote) + fim):
+                self._fila.task_done()
+            if fim:
+                self.metricas.registrar_fila(0)
+                return
+
+    def esvaziar(self):
+        """Aguarda até que todas as mensagens do buffer tenham sido enviadas."""
+        if self._thread_envio is not None:
+            self._fila.join()
+        if self._erro_envio:
+            raise self._erro_envio
 
     def receber(self):
         """Recebe dados do socket."""
-        origem = self.connection if self.connection else self.socket
-        dados = origem.recv(1024).decode()
-        print(f"[{self.id}] Dados recebidos: {dados}")
-        return dados
+        return self.receber_bytes().decode()
+
+    def receber_bytes(self):
+        """Recebe um quadro completo (já descomprimido), sem decodificar."""
+        inicio = time.perf_counter()
+        carga = self._receber_quadro()
+        self.metricas.registrar_recepcao(time.perf_counter() - inicio)
+        return carga
+
+    def _receber_quadro(self):
+        origem = self._destino('servidor')
+        self._negociado.wait()  # Quem negocia é o único a ler até lá
+        if self._adiantados:
+            return self._adiantados.popleft()
+        while True:
+            codec, carga = self._ler_quadro(origem)
+            if codec != _NEGOCIACAO:
+                break
+            # Oferta do outro lado: responde (se ainda não o fez) e continua lendo
+            if self.compressor:
+                self.compressor.combinar(carga.decode().split(','))
+            self._enviar_oferta(origem)
+        if self.compressor:
+            return self.compressor.descomprimir(codec, carga)
+        return descomprimir(codec, carga)
+
+    def _ler_quadro(self, origem, prazo=None):
+        """
+        Lê um quadro inteiro e retorna (codec, carga). Só consome os bytes
+        quando o quadro está completo, então um timeout (socket.timeout ao
+        passar de `prazo`, em time.monotonic) não perde dados.
+        """
+        self._garantir(origem, _CABECALHO.size, prazo)
+        tamanho, codec = _CABECALHO.unpack_from(self._recebidos)
+        self._garantir(origem, _CABECALHO.size + tamanho, prazo)
+        carga = bytes(self._recebidos[_CABECALHO.size:_CABECALHO.size + tamanho])
+        del self._recebidos[:_CABECALHO.size + tamanho]
+        return codec, carga
+
+    def _garantir(self, origem, n, prazo=None):
+        """Lê do socket até haver pelo menos n bytes no buffer de recepção."""
+        while len(self._recebidos) < n:
+            # Espera com select, sem settimeout: o socket é o mesmo dos envios de outras threads
+            if prazo is not None and not select.select([origem], [], [], max(0, prazo - time.monotonic()))[0]:
+                raise socket.timeout(f"[{self.id}] Tempo esgotado aguardando dados")
+            inicio = time.perf_counter()
+            bloco = origem.recv(max(_TAMANHO_LOTE, n - len(self._recebidos)))
+            self.metricas.registrar_leitura(len(bloco), time.perf_counter() - inicio)
+            if not bloco:
+                raise ConnectionError(f"[{self.id}] Conexão encerrada pelo outro lado")
+            self._recebidos += bloco
 
     def fechar(self):
-        """Fecha os sockets."""
+        """Fecha os sockets (após enviar o que restou no buffer)."""
+        if self._thread_envio is not None:
+            self._fila.put(_FIM)
+            self._thread_envio.join()
+            self._thread_envio = None
+        if self._thread_conexao is not None and self.connection is None and self.socket is not None:
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)  # Acorda o accept em segundo plano
+            except OSError:
+                pass
         if self.connection:
             self.connection.close()
         if self.socket:
             self.socket.close()
-        print(f"[{self.id}] Conexão fechada.")
\ No newline at end of file
+        print(f"[{self.id}] Conexão fechada.")
+
+# --------------------------------------
+# Pipeline de pedidos e respostas
+# --------------------------------------
+_ID_PEDIDO = struct.Struct('!Q')
+
+class ErroPedido(OSError):
+    """Canal de pedido/resposta usado fora de ordem (resposta sem pedido, receber sem pedido pendente)."""
+    pass
+
+class CanalPipeline(Canal):
+    """
+    Canal de pedido/resposta com pipeline: o cliente envia até `pipeline`
+    pedidos sem esperar as respostas, cada um marcado com um id. As respostas
+    podem chegar fora de ordem; receber devolve a do pedido mais antigo.
+    Com o pipeline cheio, o envio lê e guarda as respostas que chegam até
+    abrir uma vaga, então enviar mais que `pipeline` pedidos antes de
+    receber não trava.
+    No servidor, a resposta enviada por uma thread leva o id do último pedido
+    que ela recebeu, então várias threads (ex: ramos de um PAR) podem atender
+    pedidos ao mesmo tempo.
+    """
+    OPCOES = Canal.OPCOES + ('pipeline',)
+
+    def __init__(self, id, host, port, pipeline=16, **opcoes):
+        # Pedidos e respostas pequenos não podem esperar pelo algoritmo de Nagle
+        opcoes.setdefault('nodelay', True)
+        conferir_opcao(id, 'pipeline', pipeline, int, minimo=1)
+        super().__init__(id, host, port, **opcoes)
+        self.profundidade = pipeline
+        self._vagas = threading.BoundedSemaphore(pipeline)  # Pedidos cuja resposta ainda não chegou
+        self._ids = itertools.count(1)
+        self._pendentes = collections.deque()  # Ids enviados sem resposta, em ordem (cliente)
+        self._respostas = {}                    # Respostas já lidas, por id (cliente)
+        self._chegada = threading.Condition()
+        self._lendo = False                     # Alguma thread está lendo do socket
+        self._trava_leitura = threading.Lock()
+        self._trava_escrita = threading.Lock()
+        self._local = threading.local()         # Pedido em atendimento por thread (servidor)
+
+    def _servidor(self, papel_padrao):
+        return (self.papel or papel_padrao) == 'servidor'
+
+    def enviar_bytes(self, carga):
+        """Envia um pedido (cliente) ou a resposta ao pedido desta thread (servidor)."""
+        if self._servidor('cliente'):
+            pedido = getattr(self._local, 'pedido', None)
+            if pedido is None:
+                raise ErroPedido(f"[{self.id}] Resposta enviada sem pedido recebido")
+            self._local.pedido = None
+        else:
+            self._esperar(lambda: self._vagas.acquire(blocking=False))
+            with self._chegada:
+                pedido = next(self._ids)
+                self._pendentes.append(pedido)
+        with self._trava_escrita:
+            super().enviar_bytes(_ID_PEDIDO.pack(pedido) + carga)
+        return pedido
+
+    def pedir(self, dados):
+        """Envia um pedido e retorna seu id (para usar com aguardar)."""
+        return self.enviar_bytes(str(dados).encode())
+
+    def receber_bytes(self):
+        """Recebe o próximo pedido (servidor) ou a resposta do pedido mais antigo (cliente)."""
+        if self._servidor('servidor'):
+            pedido, carga = self._ler_marcado()
+            self._local.pedido = pedido
+            return carga
+        with self._chegada:
+            if not self._pendentes:
+                raise ErroPedido(f"[{self.id}] Nenhum pedido aguardando resposta")
+            pedido = self._pendentes.popleft()
+        return self._aguardar_bytes(pedido)
+
+    def aguardar(self, pedido):
+        """Aguarda a resposta de um pedido específico."""
+        with self._chegada:
+            if pedido not in self._pendentes:
+                raise ErroPedido(f"[{self.id}] Pedido {pedido} não está aguardando resposta")
+            self._pendentes.remove(pedido)
+        return self._aguardar_bytes(pedido).decode()
+
+    def _aguardar_bytes(self, pedido):
+        self._esperar(lambda: pedido in self._respostas)
+        with self._chegada:
+            return self._respostas.pop(pedido)
+
+    def _esperar(self, pronto):
+        """
+        Espera até pronto() (avaliado com _chegada travada) ser verdadeiro. Só
+        uma thread lê do socket por vez; cada resposta lida é guardada por id
+        e libera a vaga do seu pedido.
+        """
+        while True:
+            with self._chegada:
+                while not pronto():
+                    if not self._lendo:
+                        break
+                    self._chegada.wait()
+                else:
+                    return
+                self._lendo = True
+            lido = None
+            try:
+                lido = self._ler_marcado()
+            finally:
+                with self._chegada:
+                    self._lendo = False
+                    if lido is not None:
+                        self._respostas[lido[0]] = lido[1]
+                        self._vagas.release()
+                    self._chegada.notify_all()
+
+    def _ler_marcado(self):
+        """Lê um quadro e separa o id do pedido dos dados."""
+        with self._trava_leitura:
+            quadro = super().receber_bytes()
+        pedido, = _ID_PEDIDO.unpack_from(quadro)
+        return pedido, quadro[_ID_PEDIDO.size:]
+
+    def servir(self, funcao, concorrencia=4):
+        """Atende pedidos com `concorrencia` threads até o cliente fechar: funcao(dados) -> resposta."""
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(concorrencia) as pool:
+            while True:
+                try:
+                    pedido, carga = self._ler_marcado()
+                except ConnectionError:
+                    break
+                pool.submit(self._responder, pedido, funcao, carga.decode())
+
+    def _responder(self, pedido, funcao, dados):
+        self._local.pedido = pedido
+        resposta = funcao(dados)
+        self.enviar_bytes(str(resposta).encode())
+
+# --------------------------------------
+# Grupos de canais (scatter/gather/broadcast)
+# --------------------------------------
+_pool_conexoes = {}  # {(host, porta): Canal} compartilhado entre os grupos
+_trava_pool = threading.Lock()
+
+def obter_conexao(host, port, capacidade=0):
+    """Retorna o canal do pool para host:porta, criando-o na primeira vez."""
+    with _trava_pool:
+        canal = _pool_conexoes.get((host, port))
+        if canal is None:
+            canal = Canal(f"{host}:{port}", host, port, capacidade)
+            _pool_conexoes[(host, port)] = canal
+        return canal
+
+def fechar_pool():
+    """Fecha todas as conexões do pool."""
+    with _trava_pool:
+        canais = list(_pool_conexoes.values())
+        _pool_conexoes.clear()
+    for canal in canais:
+        canal.fechar()
+
+class GrupoCanais:
+    """
+    Canal ligado a um grupo de servidores (ex: uma calculadora por núcleo).
+    scatter envia para um membro, broadcast para todos e gather coleta as
+    respostas pendentes na ordem em que as requisições foram feitas.
+    """
+    OPCOES = ('politica', 'capacidade')
+    POLITICAS = ('rodizio', 'menor_carga')
+
+    def __init__(self, id, host, portas, politica='rodizio', capacidade=0):
+        if politica not in self.POLITICAS:
+            raise ValueError(f"Política '{politica}' inválida (use {' ou '.join(self.POLITICAS)})")
+        conferir_opcao(id, 'capacidade', capacidade, int)
+        self.id = id
+        self.politica = politica
+        self.membros = [obter_conexao(host, porta, capacidade) for porta in portas]
+        self.pendentes = [0] * len(self.membros)  # Requisições sem resposta por membro
+        self._ordem = collections.deque()          # Membro de cada requisição pendente
+        self._proximo = 0
+        self._trava = threading.Lock()
+
+    def _escolher(self):
+        """Escolhe o membro que recebe a próxima requisição."""
+        n = len(self.membros)
+        if self.politica == 'menor_carga':
+            candidatos = [(self._proximo + k) % n for k in range(n)]
+            escolhido = min(candidatos, key=lambda i: self.pendentes[i])
+        else:
+            escolhido = self._proximo
+        self._proximo = (escolhido + 1) % n
+        return escolhido
+
+    def preconectar(self):
+        """Conecta a todos os membros em segundo plano (o grupo sempre é cliente)."""
+        for membro in self.membros:
+            membro.preconectar('cliente')
+
+    def scatter(self, dados):
+        """Envia dados para um único membro do grupo."""
+        with self._trava:
+            i = self._escolher()
+            self.pendentes[i] += 1
+            self._ordem.append(i)
+        self.membros[i].enviar(dados)
+
+    def broadcast(self, dados):
+        """Envia os mesmos dados para todos os membros do grupo."""
+        with self._trava:
+            for i in range(len(self.membros)):
+                self.pendentes[i] += 1
+                self._ordem.append(i)
+        for membro in self.membros:
+            membro.enviar(dados)
+
+    def gather(self, n=None):
+        """Coleta n respostas (por padrão, todas as pendentes)."""
+        if n is None:
+            n = len(self._ordem)
+        respostas = []
+        for _ in range(n):
+            with self._trava:
+                if not self._ordem:
+                    raise RuntimeError(f"[{self.id}] Nenhuma resposta pendente para coletar")
+                i = self._ordem.popleft()
+            respostas.append(self.membros[i].receber())
+            with self._trava:
+                self.pendentes[i] -= 1
+        return respostas
+
+    def fechar(self):
+        """Fecha as conexões dos membros e as remove do pool."""
+        with _trava_pool:
+            for chave, canal in list(_pool_conexoes.items()):
+                if canal in self.membros:
+                    del _pool_conexoes[chave]
+        for membro in self.membros:
+            membro.fechar()
@@ -0,0 +1,171 @@
+# src/colecoes.py
+"""
+Map<K,V> e Set<T>: busca, inserção e remoção em O(1) por hash, no lugar de
+percorrer listas (contem(lista, x), índice de um produto numa lista...).
+
+Um Map é um dict do Python ({chave: valor} no programa, m[k], m[k] = v,
+for (k in m) percorre as chaves na ordem de inserção). Um Set é um
+Conjunto: também guarda a ordem de inserção, para que for e output deem a
+mesma saída a cada execução (a ordem de um set do Python muda com a
+semente do hash de strings).
+
+Listas (e matrizes) não têm hash; como chave ou elemento de Set elas viram
+tuplas (chave()), então [1, 2] encontra [1, 2] mesmo sendo outra lista.
+"""
+import array
+
+from matriz import Matriz
+from textos import Texto
+
+class ErroColecao(ValueError):
+    pass
+
+def chave(valor):
+    """Valor com hash equivalente: listas, arrays e matrizes viram tuplas (também aninhadas)."""
+    if isinstance(valor, (list, array.array)):
+        return tuple(chave(item) for item in valor)
+    if isinstance(valor, Matriz):
+        return tuple(chave(linha.valores()) for linha in valor)
+    if isinstance(valor, Texto):
+        return str(valor)  # Guarda a string montada, não a rope
+    return valor
+
+class Conjunto:
+    """Set<T>: elementos únicos, ordem de inserção, pertinência em O(1)."""
+    __slots__ = ('itens',)
+
+    def __init__(self, itens=()):
+        self.itens = dict.fromkeys(chave(item) for item in itens)
+
+    def adicionar(self, item):
+        self.itens[chave(item)] = None
+
+    def remover(self, item):
+        try:
+            del self.itens[chave(item)]
+        except KeyError:
+            raise ErroColecao(f"{item!r} não está no conjunto")
+
+    def __contains__(self, item):
+        try:
+            return item in self.itens
+        except TypeError:  # Sem hash: lista
+            return chave(item) in self.itens
+
+    def __iter__(self):
+        return iter(self.itens)
+
+    def __len__(self):
+        return len(self.itens)
+
+    def __eq__(self, outro):
+        if isinstance(outro, Conjunto):
+            return self.itens.keys() == outro.itens.keys()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{' + ', '.join(repr(item) for item in self.itens) + '}'
+
+    __str__ = __repr__
+
+def mapa(chaves, valores):
+    """Map a partir das chaves e valores de um literal {k: v, ...}."""
+    resultado = {}
+    for k, v in zip(chaves, valores):
+        resultado[chave(k)] = v
+    return resultado
+
+def converter(tipo, valor):
+    """
+    Valor pronto para uma variável Map<K,V> ou Set<T>: uma lista de pares
+    [k, v] vira Map e uma lista vira Set. Qualquer outro valor volta sem
+    mudança.
+    """
+    if tipo[0] == 'Set' and isinstance(valor, (list, array.array)):
+        return Conjunto(valor)
+    if tipo[0] == 'Map' and isinstance(valor, list):
+        if not all(isinstance(par, (list, array.array)) and len(par) == 2 for par in valor):
+            raise ErroColecao(f"Map<{tipo[1]}, {tipo[2]}> espera {{chave: valor}} ou uma lista de pares [chave, valor]")
+        return mapa([par[0] for par in valor], [par[1] for par in valor])
+    return valor
+
+# --------------------------------------
+# Nativas
+# --------------------------------------
+def _conferir_mapa(m):
+    if not isinstance(m, dict):
+        raise TypeError(f"esperava um Map, recebeu {type(m).__name__}")
+
+def obter(m, k, padrao=None):
+    """get(m, k, padrao?): valor de k; sem padrão, uma chave ausente é erro."""
+    _conferir_mapa(m)
+    try:
+        return m[k]
+    except TypeError:
+        k = chave(k)
+    except KeyError:
+        pass
+    if k in m:
+        return m[k]
+    if padrao is None:
+        raise ErroColecao(f"chave {k!r} ausente")
+    return padrao
+
+def por(colecao, k, v=None):
+    """put(m, k, v) guarda v na chave k; put(s, x) acrescenta x ao Set."""
+    if isinstance(colecao, Conjunto):
+        if v is not None:
+            raise TypeError("put num Set recebe só o elemento: put(s, x)")
+        colecao.adicionar(k)
+        return
+    _conferir_mapa(colecao)
+    if v is None:
+        raise TypeError("put num Map recebe a chave e o valor: put(m, k, v)")
+    try:
+        colecao[k] = v
+    except TypeError:
+        colecao[chave(k)] = v
+
+def contem(colecao, item):
+    """contains(c, x): se x é chave do Map, elemento do Set, item da lista ou trecho da string."""
+    if isinstance(colecao, dict):
+        try:
+            return item in colecao
+        except TypeError:
+            return chave(item) in colecao
+    if isinstance(colecao, Texto):
+        colecao = str(colecao)
+    if isinstance(colecao, str):
+        return (str(item) if isinstance(item, Texto) else item) in colecao
+    if isinstance(colecao, (Conjunto, list, array.array)):
+        return item in colecao
+    raise TypeError(f"contains não se aplica a {type(colecao).__name__}")
+
+def remover(colecao, k):
+    """remove(c, k): tira a chave k do Map ou o elemento k do Set."""
+    if isinstance(colecao, Conjunto):
+        colecao.remover(k)
+        return
+    _conferir_mapa(colecao)
+    try:
+        del colecao[chave(k)]
+    except KeyError:
+        raise ErroColecao(f"chave {k!r} ausente")
+
+def chaves(m):
+    """keys(m): lista das chaves, na ordem de inserção."""
+    _conferir_mapa(m)
+    return list(m)
+
+def valores(m):
+    """values(m): lista dos valores, na ordem de inserção."""
+    _conferir_mapa(m)
+    return list(m.values())
+
+def conjunto(itens):
+    """set(lista): Set com os elementos da lista (ou das chaves de um Map)."""
+    if not isinstance(itens, (list, array.array, str, dict, Conjunto)):
+        raise TypeError(f"esperava uma lista, recebeu {type(itens).__name__}")
+    return Conjunto(itens)
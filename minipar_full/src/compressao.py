@@ -0,0 +1,115 @@
+# src/compressao.py
+"""
+Compressão adaptativa das mensagens de um canal (zlib ou lzma da stdlib).
+
+Mensagens abaixo de `minimo` bytes vão sem compressão. No modo 'auto', o
+compressor testa periodicamente todos os codecs combinados com o outro lado
+e passa a usar o de melhor taxa; se nenhum compensa (dados incompressíveis),
+envia os dados crus até a próxima amostragem.
+"""
+import lzma
+import time
+import zlib
+
+# Identificador de cada codec no cabeçalho do quadro (0 = sem compressão)
+SEM_COMPRESSAO = 0
+CODECS = {
+    'zlib': (1, lambda dados: zlib.compress(dados, 6), zlib.decompress),
+    'lzma': (2, lambda dados: lzma.compress(dados, preset=1), lzma.decompress),
+}
+_POR_ID = {identificador: (nome, descomprimir) for nome, (identificador, _, descomprimir) in CODECS.items()}
+
+MINIMO_PADRAO = 512   # Bytes; abaixo disso a compressão não compensa
+_AMOSTRAGEM = 64      # A cada quantas mensagens o modo 'auto' reavalia os codecs
+_TAXA_UTIL = 0.9      # Só comprime se reduzir pelo menos 10%
+_VANTAGEM_LZMA = 0.9  # lzma (mais lento) só vence se for 10% melhor que zlib
+
+class Compressor:
+    def __init__(self, modo, minimo=MINIMO_PADRAO):
+        if modo not in ('auto',) + tuple(CODECS):
+            raise ValueError(f"Compressão '{modo}' inválida (use auto, {', '.join(CODECS)})")
+        self.modo = modo
+        self.minimo = minimo
+        self.codecs = []   # Codecs aceitos pelos dois lados (definidos na negociação)
+        self.atual = None  # Codec escolhido pelo modo 'auto'
+        self._desde_amostra = _AMOSTRAGEM
+        self.estatisticas = {
+            'mensagens': 0,
+            'mensagens_comprimidas': 0,
+            'bytes_brutos': 0,
+            'bytes_rede': 0,
+            'segundos_cpu_compressao': 0.0,
+            'segundos_cpu_descompressao': 0.0,
+        }
+
+    def oferta(self):
+        """Codecs que este lado aceita usar."""
+        return list(CODECS) if self.modo == 'auto' else [self.modo]
+
+    def combinar(self, codecs_do_par):
+        """Registra os codecs aceitos pelos dois lados."""
+        self.codecs = [nome for nome in self.oferta() if nome in codecs_do_par]
+
+    def comprimir(self, dados):
+        """Retorna (id do codec, dados) para enviar."""
+        est = self.estatisticas
+        est['mensagens'] += 1
+        est['bytes_brutos'] += len(dados)
+        codec, saida = SEM_COMPRESSAO, dados
+        if self.codecs and len(dados) >= self.minimo:
+            inicio = time.thread_time()
+            codec, saida = self._escolher(dados)
+            est['segundos_cpu_compressao'] += time.thread_time() - inicio
+        if codec != SEM_COMPRESSAO:
+            est['mensagens_comprimidas'] += 1
+        est['bytes_rede'] += len(saida)
+        return codec, saida
+
+    def _escolher(self, dados):
+        if self.modo != 'auto':
+            return self._tentar(self.modo, dados) or (SEM_COMPRESSAO, dados)
+        self._desde_amostra += 1
+        if self._desde_amostra < _AMOSTRAGEM:
+            if self.atual is None:
+                return SEM_COMPRESSAO, dados
+            return self._tentar(self.atual, dados) or (SEM_COMPRESSAO, dados)
+        # Amostragem: comprime com todos e guarda o melhor
+        self._desde_amostra = 0
+        resultados = {nome: self._tentar(nome, dados) for nome in self.codecs}
+        resultados = {nome: r for nome, r in resultados.items() if r}
+        if not resultados:
+            self.atual = None
+            return SEM_COMPRESSAO, dados
+        melhor = min(resultados, key=lambda nome: len(resultados[nome][1]))
+        if melhor == 'lzma' and 'zlib' in resultados and \
+                len(resultados['lzma'][1]) > _VANTAGEM_LZMA * len(resultados['zlib'][1]):
+            melhor = 'zlib'
+        self.atual = melhor
+        return resultados[melhor]
+
+    def _tentar(self, nome, dados):
+        """Comprime com o codec; None se a compressão não compensar."""
+        identificador, comprimir, _ = CODECS[nome]
+        saida = comprimir(dados)
+        if len(saida) > _TAXA_UTIL * len(dados):
+            return None
+        return identificador, saida
+
+    def descomprimir(self, codec, dados):
+        inicio = time.thread_time()
+        saida = descomprimir(codec, dados)
+        self.estatisticas['segundos_cpu_descompressao'] += time.thread_time() - inicio
+        return saida
+
+    def taxa(self):
+        """Bytes na rede / bytes originais (1.0 = sem ganho)."""
+        brutos = self.estatisticas['bytes_brutos']
+        return self.estatisticas['bytes_rede'] / brutos if brutos else 1.0
+
+def descomprimir(codec, dados):
+    """Descomprime um quadro recebido (qualquer canal aceita os codecs da stdlib)."""
+    if codec == SEM_COMPRESSAO:
+        return dados
+    if codec not in _POR_ID:
+        raise ValueError(f"Codec {codec} desconhecido")
+    return _POR_ID[codec][1](dados)
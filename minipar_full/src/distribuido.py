@@ -0,0 +1,176 @@
+# src/distribuido.py
+"""
+Execução distribuída de blocos PAR: cada ramo é enviado (árvore sintática +
+variáveis capturadas) para um trabalhador remoto (trabalhador.py), que o
+executa e devolve as variáveis escritas e a saída produzida.
+
+Os pedidos trafegam com pickle sobre o enquadramento de channels.Canal,
+cada quadro precedido de um HMAC-SHA256 calculado com a chave compartilhada
+(variável de ambiente MINIPAR_CHAVE); quadros com HMAC inválido são
+rejeitados antes do pickle.loads. Sem chave, o trabalhador só aceita
+conexões em endereços de loopback.
+"""
+import hashlib
+import hmac
+import ipaddress
+import itertools
+import os
+import pickle
+import socket
+import threading
+import nativas
+import nos
+from channels import Canal
+
+# Ramos que usam estes nós dependem de recursos locais (teclado, sockets)
+_NOS_LOCAIS = (
+    nos.Input, nos.Send, nos.Receive, nos.Scatter, nos.Broadcast, nos.Gather,
+    nos.DeclaracaoCanal, nos.DeclaracaoGrupo,
+)
+
+def percorre_canal(no):
+    """for (msg in canal): o for recebe as mensagens de um canal."""
+    return isinstance(no, nos.For) and type(no.expr) is nos.ID and no.expr.tipo == 'c_channel'
+
+def _local(no):
+    return isinstance(no, _NOS_LOCAIS) or percorre_canal(no)
+
+def percorrer(no):
+    """Percorre a árvore em pré-ordem."""
+    pilha = [no]
+    while pilha:
+        atual = pilha.pop()
+        yield atual
+        pilha.extend(reversed(list(atual.filhos())))
+
+def funcoes_chamadas(ramo, funcoes):
+    """
+    Definições ({nome: DefFuncao}) das funções do programa que o ramo chama,
+    direta ou indiretamente; vão junto com o ramo para o trabalhador.
+    """
+    usadas = {}
+    pendentes = [ramo]
+    while pendentes:
+        for no in percorrer(pendentes.pop()):
+            if not isinstance(no, nos.ChamadaFuncao):
+                continue
+            nomes = [no.nome]
+            posicao = nativas.ARGUMENTOS_FUNCAO.get(no.nome)
+            if posicao is not None and len(no.args) > posicao and isinstance(no.args[posicao], nos.String):
+                nomes.append(no.args[posicao].valor)  # sort(v, "chave"): a chave também é chamada
+            for nome in nomes:
+                if nome in funcoes and nome not in usadas:
+                    usadas[nome] = funcoes[nome]
+                    pendentes.append(funcoes[nome])
+    return usadas
+
+def pode_executar_remoto(ramo, funcoes=None):
+    """Indica se o ramo (e as funções que ele chama) pode ser executado fora deste processo."""
+    if not isinstance(ramo, nos.No):
+        return False
+    for raiz in [ramo, *funcoes_chamadas(ramo, funcoes or {}).values()]:
+        if any(_local(no) for no in percorrer(raiz)):
+            return False
+    return True
+
+def variaveis_usadas(ramo, funcoes=None):
+    """Nomes de variáveis lidas ou escritas pelo ramo (inclusive as globais usadas pelas funções que ele chama)."""
+    nomes = set()
+    for no in itertools.chain(percorrer(ramo), *map(percorrer, (funcoes or {}).values())):
+        if isinstance(no, nos.ID):
+            nomes.add(no.nome)
+        elif isinstance(no, (nos.Atribuicao, nos.AtribuicaoIndice, nos.AtribuicaoComposta, nos.For)):
+            nomes.add(no.id)
+    return nomes
+
+def analisar_endereco(texto):
+    """Converte 'host:porta' (ou só 'porta') em (host, porta)."""
+    host, _, porta = texto.rpartition(':')
+    return (host or 'localhost', int(porta))
+
+class ErroRemoto(Exception):
+    """Erro ocorrido ao executar um ramo num trabalhador."""
+    pass
+
+# --------------------------------------
+# Autenticação dos quadros
+# --------------------------------------
+VARIAVEL_CHAVE = 'MINIPAR_CHAVE'
+_TAMANHO_HMAC = hashlib.sha256().digest_size
+
+class ErroAutenticacao(ConnectionError):
+    """Quadro com HMAC inválido: a conexão é descartada sem desserializar nada."""
+    pass
+
+def chave_configurada():
+    """Chave compartilhada entre coordenador e trabalhadores (bytes vazios quando não há)."""
+    return os.environ.get(VARIAVEL_CHAVE, '').encode()
+
+def endereco_local(host):
+    """Indica se o host resolve para um endereço de loopback."""
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except (OSError, ValueError):
+        return False
+
+def empacotar(objeto, chave):
+    dados = pickle.dumps(objeto)
+    return hmac.new(chave, dados, hashlib.sha256).digest() + dados
+
+def desempacotar(quadro, chave):
+    """Confere o HMAC do quadro e só então o desserializa."""
+    assinatura, dados = quadro[:_TAMANHO_HMAC], quadro[_TAMANHO_HMAC:]
+    if not hmac.compare_digest(assinatura, hmac.new(chave, dados, hashlib.sha256).digest()):
+        raise ErroAutenticacao("HMAC inválido (a chave MINIPAR_CHAVE difere entre os nós?)")
+    return pickle.loads(dados)
+
+class Distribuidor:
+    """
+    Mantém uma conexão com cada trabalhador e envia cada ramo para o menos
+    carregado: pedidos ainda pendentes aqui + carga informada pelo próprio
+    trabalhador na última resposta (ramos de outros coordenadores).
+    """
+    def __init__(self, enderecos, chave=None):
+        self.chave = chave_configurada() if chave is None else chave
+        self.trabalhadores = [Canal(f"trabalhador-{host}:{porta}", host, porta, nodelay=True)
+                              for host, porta in enderecos]
+        for canal in self.trabalhadores:
+            canal.preconectar('cliente')  # Conecta enquanto o programa ainda não chegou ao PAR
+        self.pendentes = [0] * len(self.trabalhadores)
+        self.carga = [0] * len(self.trabalhadores)
+        self._travas = [threading.Lock() for _ in self.trabalhadores]  # Uma ida e volta por vez
+        self._trava = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def _escolher(self):
+        """Reserva o trabalhador com menor carga estimada."""
+        with self._trava:
+            i = min(range(len(self.trabalhadores)),
+                    key=lambda k: (self.pendentes[k] + self.carga[k], self.pendentes[k]))
+            self.pendentes[i] += 1
+            return i
+
+    def executar(self, ramo, variaveis, funcoes=None):
+        """Executa o ramo num trabalhador (com as funções que ele chama) e retorna a resposta dele."""
+        i = self._escolher()
+        pedido = {'id': next(self._ids), 'ramo': ramo, 'variaveis': variaveis, 'funcoes': funcoes or {}}
+        try:
+            with self._travas[i]:
+                canal = self.trabalhadores[i]
+                canal.enviar_bytes(empacotar(pedido, self.chave))
+                resposta = desempacotar(canal.receber_bytes(), self.chave)
+        except OSError as e:
+            raise ErroRemoto(f"Falha de comunicação com {self.trabalhadores[i].id}: {e}")
+        finally:
+            with self._trava:
+                self.pendentes[i] -= 1
+        self.carga[i] = resposta['carga']
+        if resposta['erro']:
+            raise ErroRemoto(f"{self.trabalhadores[i].id}: {resposta['erro']}")
+        return resposta
+
+    def fechar(self):
+        """Fecha as conexões com os trabalhadores já contatados."""
+        for canal in self.trabalhadores:
+            if canal.socket or canal.connection:
+                canal.fechar()
@@ -1,20 +1,116 @@
 # src/interpreter.py
+import array
+import contextlib
+import operator
 import threading
-from channels import Canal
-from symbol_table import TabelaSimbolos, ErroSemantico
+import colecoes
+import distribuido
+import iteradores
+import listas
+import matriz
+import nativas
+import nos
+import textos
+import tipos
+import vetorial
+import channels
+from channels import Canal, CanalPipeline, GrupoCanais
+from multiplex import CanalMultiplexado
+from saida import SaidaPadrao
+from symbol_table import Escopo, TabelaSimbolos, ErroSemantico
 
-class Executor:
+_PAPEIS = ('cliente', 'servidor')
+
+def papeis_dos_canais(arvore):
+    """
+    Papel de cada canal pela primeira operação que aparece no programa:
+    quem envia primeiro conecta (cliente), quem recebe primeiro escuta (servidor).
+    """
+    papeis = {}
+    for no in distribuido.percorrer(arvore):
+        if isinstance(no, (nos.Send, nos.Scatter, nos.Broadcast)):
+            papeis.setdefault(no.canal, 'cliente')
+        elif isinstance(no, (nos.Receive, nos.Gather)):
+            papeis.setdefault(no.canal, 'servidor')
+        elif distribuido.percorre_canal(no):
+            papeis.setdefault(no.expr.nome, 'servidor')  # for (msg in canal) recebe
+    return papeis
+
+_ARITMETICA = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv}
+_COMPARACOES = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+                '==': operator.eq, '!=': operator.ne}
+_NUMEROS = (int, float)
+_SEQUENCIAS = (list, array.array, matriz.Matriz, matriz.LinhaMatriz)
+
+class TabelaExecucao(TabelaSimbolos):
+    """Tabela do Executor: o escopo atual é por thread (chamadas de função em ramos de PAR não se misturam)."""
     def __init__(self):
-        self.tabela = TabelaSimbolos()
+        self._local = threading.local()
+        super().__init__()
+
+    @property
+    def escopo_atual(self):
+        return getattr(self._local, 'escopo', self.escopo_global)
+
+    @escopo_atual.setter
+    def escopo_atual(self, escopo):
+        self._local.escopo = escopo
+
+class _Retorno(Exception):
+    """Levantada por `return` e capturada pela chamada de função."""
+    def __init__(self, valor):
+        self.valor = valor
+
+class Executor:
+    def __init__(self, trabalhadores=None, saida=None, especializar=True):
+        self.especializar = especializar  # Inferência de tipos e nós numéricos especializados (ver tipos.py)
+        self.tabela = TabelaExecucao()
+        self.funcoes = {}  # Funções definidas pelo programa: {nome: DefFuncao}
+        self.saida = saida or SaidaPadrao()  # Destino de output() (ver saida.py)
         self.canais = {}  # Dicionário de canais: {id: Canal}
         self.contexto = {}  # Contexto de execução (variáveis temporárias)
+        self.papeis = {}  # Papel previsto de cada canal, para conectar já na declaração
+        # PAR distribuído: lista de (host, porta) de trabalhadores remotos
+        self.distribuidor = distribuido.Distribuidor(trabalhadores) if trabalhadores else None
 
-    def executar(self, arvore):
-        """Executa a árvore sintática gerada pelo parser."""
+    def executar(self, arvore, fechar_canais=True):
+        """
+        Executa a árvore sintática gerada pelo parser. Ao terminar, envia o que
+        restou nos buffers dos canais e os fecha (a REPL os mantém abertos
+        entre os trechos: fechar_canais=False).
+        """
+        self.papeis = papeis_dos_canais(arvore)
+        if self.especializar:
+            tipos.especializar(arvore)
         try:
             self.visitar(arvore)
-        except ErroExecucao as e:
+        except _Retorno:
+            pass  # return fora de função encerra o programa
+        except (ErroExecucao, ErroSemantico, distribuido.ErroRemoto) as e:
+            self.saida.esvaziar()  # A saída produzida até o erro vem antes da mensagem
             print(f"Erro durante a execução: {e}")
+        finally:
+            self.saida.esvaziar()
+            if fechar_canais:
+                self.fechar_canais()
+            if self.distribuidor:
+                self.distribuidor.fechar()
+
+    def fechar_canais(self):
+        """Entrega as mensagens ainda na fila dos canais com buffer e fecha as conexões."""
+        canais, self.canais = self.canais, {}
+        for canal_id, canal in canais.items():
+            try:
+                if isinstance(canal, Canal):
+                    canal.esvaziar()  # A thread de envio é daemon: sem isso a fila se perde
+            except OSError as e:
+                print(f"Erro durante a execução: canal '{canal_id}' não entregou as mensagens pendentes: {e}")
+            finally:
+                try:
+                    canal.fechar()
+                except OSError:
+                    pass
+        channels.fechar_pool()
 
     def visitar(self, no):
         """Despacha a execução com base no tipo do nó."""
@@ -28,6 +124,9 @@ class Executor:
     # --------------------------------------
     # Blocos Fundamentais
     # --------------------------------------
+    def visitar_Programa(self, no):
+        self.visitar(no.bloco)
+
     def visitar_BlocoSEQ(self, no):
         """Executa instruções sequencialmente."""
         for stmt in no.stmts:
@@ -36,13 +135,98 @@ class Executor:
     def visitar_BlocoPAR(self, no):
         """Executa instruções em paralelo usando threads."""
         threads = []
-        for stmt in no.stmts:
-            thread = threading.Thread(target=self.visitar, args=(stmt,))
+        ramos = self.saida.abrir_ramos(len(no.stmts))  # Buffers de saída por ramo (ver saida.py)
+        erros = [None] * len(no.stmts)  # Exceção de cada ramo, relançada aqui depois do join
+        for i, (stmt, ramo) in enumerate(zip(no.stmts, ramos)):
+            alvo = self.visitar
+            if self.distribuidor and distribuido.pode_executar_remoto(stmt, self.funcoes):
+                alvo = self._executar_remoto
+            thread = threading.Thread(target=self._executar_ramo,
+                                      args=(alvo, stmt, ramo, self.tabela.escopo_atual, erros, i))
             threads.append(thread)
             thread.start()
         
         for thread in threads:
             thread.join()  # Aguarda todas finalizarem
+        self.saida.juntar_ramos(ramos)
+        for erro in erros:
+            if erro is not None:
+                raise erro  # O do primeiro ramo (na ordem do programa) que falhou
+
+    def _executar_ramo(self, alvo, stmt, ramo, escopo, erros, i):
+        self.tabela.escopo_atual = escopo  # O ramo enxerga as variáveis de quem executou o PAR
+        self.saida.entrar(ramo)
+        try:
+            alvo(stmt)
+        except Exception as e:  # Numa thread, a exceção só viraria um traceback impresso
+            erros[i] = e
+        finally:
+            self.saida.sair(ramo)
+
+    def _executar_remoto(self, stmt):
+        """Executa um ramo do PAR num trabalhador e aplica as escritas dele."""
+        funcoes = distribuido.funcoes_chamadas(stmt, self.funcoes)
+        variaveis = {}
+        for nome in distribuido.variaveis_usadas(stmt, funcoes):
+            try:
+                simbolo = self.tabela.escopo_atual.obter_variavel(nome)
+            except ErroSemantico:
+                continue  # Será declarada pelo próprio ramo
+            variaveis[nome] = (simbolo['tipo'], simbolo['valor'])
+        resposta = self.distribuidor.executar(stmt, variaveis, funcoes)
+        for linha in resposta['saida']:
+            self.escrever(linha)
+        for nome, (tipo, valor) in resposta['escritas'].items():
+            try:
+                self.tabela.escopo_atual.obter_variavel(nome)['valor'] = valor
+            except ErroSemantico:
+                self.tabela.escopo_atual.declarar_variavel(nome, tipo, valor)
+
+    # --------------------------------------
+    # Controle de Fluxo
+    # --------------------------------------
+    def visitar_If(self, no):
+        """Executa o bloco entao ou senao conforme a condição."""
+        stmts = no.entao if self.visitar(no.condicao) else no.senao
+        for stmt in stmts or []:
+            self.visitar(stmt)
+
+    def visitar_While(self, no):
+        """Repete o bloco enquanto a condição for verdadeira."""
+        while self.visitar(no.condicao):
+            for stmt in no.stmts:
+                self.visitar(stmt)
+
+    def visitar_For(self, no):
+        """
+        Percorre uma lista, string, range, Map (chaves), Set, as linhas de um
+        arquivo (lines) ou as mensagens de um canal, sem montar uma lista antes.
+        """
+        escopo = self.tabela.escopo_atual
+        if no.id not in escopo.simbolos:
+            escopo.declarar_variavel(no.id, None)
+        if distribuido.percorre_canal(no):
+            canal = self.canais.get(no.expr.nome)
+            if not isinstance(canal, (Canal, CanalMultiplexado)):
+                raise ErroExecucao(f"for na linha {no.linha}: '{no.expr.nome}' não é um canal declarado")
+            itens = iteradores.mensagens(canal)
+        else:
+            itens = self.visitar(no.expr)
+            if isinstance(itens, (dict, colecoes.Conjunto)):
+                itens = list(itens)  # O corpo pode usar put/remove no próprio Map ou Set
+        try:
+            itens = iter(itens)
+        except TypeError:
+            raise ErroExecucao(f"for na linha {no.linha}: {type(itens).__name__} não pode ser percorrido")
+        simbolos, nome, stmts, visitar = escopo.simbolos, no.id, no.stmts, self.visitar
+        try:
+            for item in itens:  # O contador de um range é o do próprio Python
+                simbolos[nome]['valor'] = item
+                for stmt in stmts:
+                    visitar(stmt)
+        except (OSError, UnicodeDecodeError) as e:
+            # Leitura de lines() ou do canal que falhou no meio do for
+            raise ErroExecucao(f"for na linha {no.linha}: {e}")
 
     # --------------------------------------
     # Declarações e Atribuições
@@ -52,13 +236,82 @@ class Executor:
         tipo = no.tipo
         nome = no.id
         valor = self.visitar(no.expr) if no.expr else None
+        if type(tipo) is tuple:
+            valor = self._converter_lista(tipo, valor, no)
         self.tabela.escopo_atual.declarar_variavel(nome, tipo, valor)
 
     def visitar_Atribuicao(self, no):
         """Atribui valor a uma variável."""
         nome = no.id
         valor = self.visitar(no.expr)
-        self.tabela.escopo_atual.simbolos[nome]['valor'] = valor
+        simbolo = self.tabela.escopo_atual.obter_variavel(nome)
+        if type(simbolo['tipo']) is tuple:
+            valor = self._converter_lista(simbolo['tipo'], valor, no)
+        simbolo['valor'] = valor
+
+    def _converter_lista(self, tipo, valor, no):
+        """
+        List<Int>/List<Float> e Matrix<Float> guardam um array contíguo (ver
+        listas.py e matriz.py); Map e Set aceitam listas (ver colecoes.py).
+        """
+        try:
+            if tipo[0] == 'Matrix':
+                return matriz.converter(tipo, valor)
+            if tipo[0] in ('Map', 'Set'):
+                return colecoes.converter(tipo, valor)
+            return listas.converter(tipo, valor)
+        except (listas.ErroLista, matriz.ErroMatriz, colecoes.ErroColecao) as e:
+            raise ErroExecucao(f"'{no.id}' (linha {no.linha}): {e}")
+
+    def visitar_AtribuicaoIndice(self, no):
+        """Atribui a um elemento de lista: v[i] = x; m[i][j] = x;"""
+        alvo = self.tabela.escopo_atual.obter_variavel(no.id)['valor']
+        indices = [self.visitar(indice) for indice in no.indices]
+        valor = self.visitar(no.expr)
+        try:
+            for indice in indices[:-1]:
+                alvo = _indexar(alvo, indice)
+            _atribuir(alvo, indices[-1], valor)
+        except (IndexError, KeyError, TypeError, OverflowError) as e:
+            raise ErroExecucao(f"Atribuição a '{no.id}' inválida (linha {no.linha}): {e}")
+
+    def visitar_AtribuicaoComposta(self, no):
+        """x += e; v[i] -= e; m[i][j] *= e; numa Matrix, m op= e altera a própria matriz."""
+        simbolo = self.tabela.escopo_atual.obter_variavel(no.id)
+        indices = [self.visitar(indice) for indice in no.indices]
+        valor = self.visitar(no.expr)
+        if not indices:
+            atual = simbolo['valor']
+            if type(atual) in _NUMEROS and type(valor) in _NUMEROS:
+                simbolo['valor'] = _ARITMETICA[no.op](atual, valor)  # Contador ou acumulador: direto
+                return
+            if isinstance(atual, matriz.Matriz):
+                try:
+                    vetorial.atualizar(no.op, atual, valor)
+                except (vetorial.ErroVetorial, TypeError) as e:
+                    raise ErroExecucao(f"'{no.id} {no.op}=' (linha {no.linha}): {e}")
+                return
+            novo = self._aritmetica(no.op, atual, valor)
+            if type(simbolo['tipo']) is tuple:
+                novo = self._converter_lista(simbolo['tipo'], novo, no)
+            simbolo['valor'] = novo
+            return
+        alvo = simbolo['valor']
+        try:
+            for indice in indices[:-1]:
+                alvo = _indexar(alvo, indice)
+            _atribuir(alvo, indices[-1], self._aritmetica(no.op, _indexar(alvo, indices[-1]), valor))
+        except (IndexError, KeyError, TypeError, OverflowError) as e:
+            raise ErroExecucao(f"Atribuição a '{no.id}' inválida (linha {no.linha}): {e}")
+
+    # --------------------------------------
+    # Funções
+    # --------------------------------------
+    def visitar_DefFuncao(self, no):
+        self.funcoes[no.nome] = no
+
+    def visitar_Return(self, no):
+        raise _Retorno(self.visitar(no.expr))
 
     # --------------------------------------
     # Comunicação via Canais
@@ -68,53 +321,159 @@ class Executor:
         canal_id = no.id
         host = no.host
         port = no.port
-        self.canais[canal_id] = Canal(canal_id, host, port)
+        opcoes = dict(getattr(no, 'opcoes', {}))
+        # papel="cliente"|"servidor": define quem conecta (por padrão, a primeira operação no programa)
+        # antecipar=false: só conecta na primeira operação, em vez de já na declaração
+        papel = opcoes.pop('papel', None) or self.papeis.get(canal_id)
+        try:
+            antecipar = channels.conferir_opcao(canal_id, 'antecipar', opcoes.pop('antecipar', True), bool)
+        except ValueError as e:
+            raise ErroExecucao(str(e))
+        if papel not in _PAPEIS + (None,):
+            raise ErroExecucao(f"Papel '{papel}' inválido para o canal '{canal_id}' (use {' ou '.join(_PAPEIS)})")
+        # multiplexar=true: canais para o mesmo host:porta compartilham uma conexão
+        # pipeline=N: até N pedidos em trânsito, respostas casadas por id
+        if opcoes.get('multiplexar'):
+            classe = CanalMultiplexado
+        elif 'pipeline' in opcoes:
+            classe = CanalPipeline
+        else:
+            classe = Canal
+        invalidas = set(opcoes) - set(classe.OPCOES)
+        if invalidas:
+            raise ErroExecucao(f"Opções inválidas para o canal '{canal_id}': {', '.join(sorted(invalidas))}")
+        try:
+            canal = classe(canal_id, host, port, **opcoes)
+        except ValueError as e:
+            raise ErroExecucao(str(e))
+        self.canais[canal_id] = canal
+        if antecipar and papel:
+            canal.preconectar(papel)  # connect/accept em segundo plano
         print(f"[Canal {canal_id}] Configurado em {host}:{port}")
 
-# interpreter.py
+    def visitar_DeclaracaoGrupo(self, no):
+        """Cria um canal ligado a um grupo de servidores (host + lista de portas)."""
+        opcoes = getattr(no, 'opcoes', {})
+        invalidas = set(opcoes) - set(GrupoCanais.OPCOES)
+        if invalidas:
+            raise ErroExecucao(f"Opções inválidas para o grupo '{no.id}': {', '.join(sorted(invalidas))}")
+        try:
+            self.canais[no.id] = GrupoCanais(no.id, no.host, no.portas, **opcoes)
+        except ValueError as e:
+            raise ErroExecucao(str(e))
+        self.canais[no.id].preconectar()
+        print(f"[Grupo {no.id}] Configurado em {no.host}:{no.portas}")
 
-def visitar_Send(self, no):
-    canal_id = no.canal  # p[1] (ex: "teste" em teste.SEND: ...)
-    dados = self.visitar(no.dados)  # p[4] (ex: "Olá do cliente!")
-    
-    if canal_id not in self.canais:
-        raise ErroExecucao(f"Canal '{canal_id}' não declarado!")
-    
-    self.canais[canal_id].enviar(str(dados))
+    def _obter_grupo(self, canal_id):
+        """Retorna o grupo de canais ou levanta erro se o canal não for um grupo."""
+        grupo = self.canais.get(canal_id)
+        if not isinstance(grupo, GrupoCanais):
+            raise ErroExecucao(f"Canal '{canal_id}' não é um grupo de canais!")
+        return grupo
 
-def visitar_Receive(self, no):
-    canal_id = no.canal  # p[1] (ex: "teste" em teste.RECEIVE: ...)
-    variavel_destino = no.variavel  # p[4] (ex: "resultado" para armazenar dados)
-    
-    if canal_id not in self.canais:
-        raise ErroExecucao(f"Canal '{canal_id}' não declarado!")
-    
-    dados = self.canais[canal_id].receber()
-    self.tabela.escopo_atual.simbolos[variavel_destino]['valor'] = dados  # Atribui à variável
+    def visitar_Scatter(self, no):
+        """Envia dados para um membro do grupo (rodízio ou menor carga)."""
+        dados = str(self.visitar(no.dados))
+        with _erro_de_canal(no.canal, 'scatter'):
+            self._obter_grupo(no.canal).scatter(dados)
+
+    def visitar_Broadcast(self, no):
+        """Envia dados para todos os membros do grupo."""
+        dados = str(self.visitar(no.dados))
+        with _erro_de_canal(no.canal, 'broadcast'):
+            self._obter_grupo(no.canal).broadcast(dados)
+
+    def visitar_Gather(self, no):
+        """Coleta as respostas pendentes do grupo numa lista."""
+        with _erro_de_canal(no.canal, 'gather'):
+            respostas = self._obter_grupo(no.canal).gather()
+        self.tabela.escopo_atual.obter_variavel(no.variavel)['valor'] = respostas  # Pode estar num escopo externo
+
+    def visitar_Send(self, no):
+        canal_id = no.canal  # ex: "teste" em teste.send: ...
+        dados = self.visitar(no.dados)  # ex: "Olá do cliente!"
+
+        if canal_id not in self.canais:
+            raise ErroExecucao(f"Canal '{canal_id}' não declarado!")
+
+        with _erro_de_canal(canal_id, 'send'):
+            self.canais[canal_id].enviar(str(dados))
+
+    def visitar_Receive(self, no):
+        canal_id = no.canal  # ex: "teste" em teste.receive: ...
+        variavel_destino = no.variavel  # ex: "resultado" para armazenar dados
+
+        if canal_id not in self.canais:
+            raise ErroExecucao(f"Canal '{canal_id}' não declarado!")
+
+        with _erro_de_canal(canal_id, 'receive'):
+            dados = self.canais[canal_id].receber()
+        self.tabela.escopo_atual.obter_variavel(variavel_destino)['valor'] = dados  # Atribui à variável
 
     # --------------------------------------
     # E/S e Funções
     # --------------------------------------
     def visitar_Input(self, no):
         """Lê entrada do usuário."""
-        prompt = ' '.join([self.visitar(arg) for arg in no.args])
+        prompt = ' '.join([str(self.visitar(arg)) for arg in no.args])
+        self.saida.esvaziar()  # O que foi escrito antes aparece antes do prompt
         return input(prompt)
 
     def visitar_Output(self, no):
         """Exibe saída na tela."""
         mensagem = ' '.join([str(self.visitar(arg)) for arg in no.args])
-        print(mensagem)
+        self.escrever(mensagem)
+
+    def escrever(self, texto):
+        """Escreve uma linha de saída do programa."""
+        self.saida.escrever(texto + '\n')
 
     def visitar_ChamadaFuncao(self, no):
-        """Executa uma função declarada."""
+        """Executa uma função declarada (ou nativa) e retorna o valor do seu return."""
         nome = no.nome
         args = [self.visitar(arg) for arg in no.args]
-        
-        if nome not in self.tabela.funcoes:
-            raise ErroExecucao(f"Função '{nome}' não declarada!")
-        
-        # Implemente a lógica de chamada de função aqui
-        return 0  # Placeholder
+
+        funcao = self.funcoes.get(nome)
+        if funcao is None:
+            nativa = nativas.obter(nome)
+            if nativa is None:
+                raise ErroExecucao(f"Função '{nome}' não declarada!")
+            posicao = nativas.ARGUMENTOS_FUNCAO.get(nome)
+            if posicao is not None and len(args) > posicao and isinstance(args[posicao], (str, textos.Texto)):
+                args[posicao] = self._funcao_python(str(args[posicao]), no)
+            try:
+                return nativa(*args)
+            except (TypeError, ValueError, ArithmeticError) as e:
+                raise ErroExecucao(f"{nome}() na linha {no.linha}: {e}")
+
+        return self._chamar(funcao, args)
+
+    def _funcao_python(self, nome, no):
+        """Função declarada ou nativa pelo nome, como função Python (para as nativas que recebem funções)."""
+        funcao = self.funcoes.get(nome)
+        if funcao is not None:
+            return lambda *args: self._chamar(funcao, list(args))
+        nativa = nativas.obter(nome)
+        if nativa is None:
+            raise ErroExecucao(f"Função '{nome}' não declarada (linha {no.linha})!")
+        return nativa
+
+    def _chamar(self, funcao, args):
+        """Executa uma função declarada com os argumentos já avaliados."""
+        # Parâmetros e variáveis locais num escopo novo, filho do global
+        escopo = Escopo(self.tabela.escopo_global)
+        for param, valor in zip(funcao.params, args):
+            escopo.declarar_variavel(param['nome'], param['tipo'], valor)
+        anterior = self.tabela.escopo_atual
+        self.tabela.escopo_atual = escopo
+        try:
+            for stmt in funcao.stmts:
+                self.visitar(stmt)
+        except _Retorno as retorno:
+            return retorno.valor
+        finally:
+            self.tabela.escopo_atual = anterior
+        return None
 
     # --------------------------------------
     # Utilitários
@@ -125,13 +484,153 @@ def visitar_Receive(self, no):
     def visitar_String(self, no):
         return no.valor
 
+    def visitar_Bool(self, no):
+        return no.valor
+
     def visitar_ID(self, no):
         """Obtém valor de uma variável."""
         return self.tabela.escopo_atual.obter_variavel(no.nome)['valor']
 
+    def visitar_Erro(self, no):
+        raise ErroExecucao(f"'{no.nome}' contém erro semântico (veja as mensagens do parser)")
+
+    # --------------------------------------
+    # Expressões
+    # --------------------------------------
+    def visitar_BinOp(self, no):
+        return self._aritmetica(no.op, self.visitar(no.esquerda), self.visitar(no.direita))
+
+    def visitar_Comparacao(self, no):
+        return self._comparar(no.op, self.visitar(no.esquerda), self.visitar(no.direita))
+
+    def _aritmetica(self, op, esquerda, direita):
+        if isinstance(esquerda, _SEQUENCIAS) or isinstance(direita, _SEQUENCIAS):
+            # Listas numéricas: elemento a elemento (ver vetorial.py); + entre listas concatena
+            try:
+                resultado = vetorial.operar(op, esquerda, direita)
+            except vetorial.ErroVetorial as e:
+                raise ErroExecucao(f"Operação '{op}' entre listas: {e}")
+            if resultado is not NotImplemented:
+                return resultado
+        if op == '+':
+            if type(esquerda) is str and type(direita) is str and len(esquerda) >= textos.LIMIAR:
+                return textos.Texto(esquerda, direita)  # Concatenação em laço: rope (ver textos.py)
+            return esquerda + direita
+        elif op == '-':
+            return esquerda - direita
+        elif op == '*':
+            return esquerda * direita
+        elif op == '/':
+            return esquerda / direita
+        raise ErroExecucao(f"Operador '{op}' desconhecido")
+
+    def _comparar(self, op, esquerda, direita):
+        if op == '<':
+            return esquerda < direita
+        elif op == '<=':
+            return esquerda <= direita
+        elif op == '>':
+            return esquerda > direita
+        elif op == '>=':
+            return esquerda >= direita
+        elif op == '==':
+            return esquerda == direita
+        elif op == '!=':
+            return esquerda != direita
+        raise ErroExecucao(f"Operador '{op}' desconhecido")
+
+    # Nós especializados pela inferência de tipos (tipos.py): operandos que são
+    # números ou variáveis são lidos direto, sem passar pelo despacho de visitar,
+    # e a operação é uma função pronta. Se os valores não forem do tipo
+    # garantido (ex: variável escrita por outro trecho da REPL), vale o caminho genérico;
+    # as comparações são as mesmas do caminho genérico e dispensam a conferência.
+    def _operando(self, no):
+        classe = type(no)
+        if classe is nos.ID:
+            return self.tabela.escopo_atual.obter_variavel(no.nome)['valor']
+        if classe is nos.Numero:
+            return no.valor
+        return self.visitar(no)
+
+    def visitar_BinOpInt(self, no):
+        esquerda = self._operando(no.esquerda)
+        direita = self._operando(no.direita)
+        if type(esquerda) is int and type(direita) is int:
+            return _ARITMETICA[no.op](esquerda, direita)
+        return self._aritmetica(no.op, esquerda, direita)
+
+    def visitar_BinOpFloat(self, no):
+        esquerda = self._operando(no.esquerda)
+        direita = self._operando(no.direita)
+        if type(esquerda) in _NUMEROS and type(direita) in _NUMEROS:
+            return _ARITMETICA[no.op](esquerda, direita)
+        return self._aritmetica(no.op, esquerda, direita)
+
+    def visitar_ComparacaoNumerica(self, no):
+        esquerda = self._operando(no.esquerda)
+        direita = self._operando(no.direita)
+        return _COMPARACOES[no.op](esquerda, direita)
+
+    def visitar_Lista(self, no):
+        return [self.visitar(item) for item in no.itens]
+
+    def visitar_Mapa(self, no):
+        return colecoes.mapa([self.visitar(k) for k in no.chaves], [self.visitar(v) for v in no.valores])
+
+    def visitar_Indice(self, no):
+        lista = self.visitar(no.lista)
+        indice = self.visitar(no.indice)
+        try:
+            return lista[indice]
+        except TypeError as e:
+            if not isinstance(lista, dict):
+                raise ErroExecucao(f"Índice inválido (linha {no.linha}): {e}")
+        except (IndexError, KeyError) as e:
+            raise ErroExecucao(f"Índice inválido (linha {no.linha}): {e}")
+        try:
+            return lista[colecoes.chave(indice)]  # Map com chave sem hash (lista): procurada pela tupla
+        except KeyError as e:
+            raise ErroExecucao(f"Índice inválido (linha {no.linha}): {e}")
+
+    def visitar_Fatia(self, no):
+        """Trecho de lista ou string: v[i:j], v[:j], v[i:]."""
+        lista = self.visitar(no.lista)
+        inicio = self.visitar(no.inicio) if no.inicio else None
+        fim = self.visitar(no.fim) if no.fim else None
+        try:
+            return listas.fatia(lista, inicio, fim)
+        except TypeError as e:
+            raise ErroExecucao(f"Fatia inválida (linha {no.linha}): {e}")
+
+def _indexar(colecao, indice):
+    """colecao[indice]; num Map, uma chave sem hash (lista) é procurada pela sua tupla (ver colecoes.py)."""
+    try:
+        return colecao[indice]
+    except TypeError:
+        if isinstance(colecao, dict):
+            return colecao[colecoes.chave(indice)]
+        raise
+
+def _atribuir(colecao, indice, valor):
+    try:
+        colecao[indice] = valor
+    except TypeError:
+        if isinstance(colecao, dict):
+            colecao[colecoes.chave(indice)] = valor
+        else:
+            raise
+
 class ErroExecucao(Exception):
     pass
 
+@contextlib.contextmanager
+def _erro_de_canal(canal_id, operacao):
+    """Falhas de conexão numa operação de canal viram ErroExecucao (mensagem, não traceback)."""
+    try:
+        yield
+    except OSError as e:
+        raise ErroExecucao(f"{operacao} no canal '{canal_id}' falhou: {e}")
+
 # Ponto de entrada do interpretador
 if __name__ == "__main__":
     from parser import Parser
@@ -0,0 +1,45 @@
+# src/iteradores.py
+"""
+O que um for percorre sem montar uma lista antes: range(início, fim, passo)
+(o range do Python, que calcula cada número na hora), as linhas de um
+arquivo (lines(caminho), lidas uma a uma) e as mensagens de um canal
+(for (msg in canal), até o outro lado fechar a conexão). Além desses, o for
+aceita qualquer iterável do Python: listas, strings, Map (chaves) e Set.
+
+Memória constante: só o elemento atual existe a cada passo.
+"""
+from textos import Texto
+
+def intervalo(*args):
+    """range(fim), range(início, fim) ou range(início, fim, passo): inteiros de início até fim (exclusivo)."""
+    for arg in args:
+        if type(arg) is not int:
+            raise TypeError(f"range espera inteiros, recebeu {type(arg).__name__}")
+    if len(args) == 3 and args[2] == 0:
+        raise ValueError("range com passo 0")
+    return range(*args)
+
+def linhas(caminho):
+    """lines(caminho): as linhas do arquivo (sem a quebra de linha), lidas sob demanda."""
+    if isinstance(caminho, Texto):
+        caminho = str(caminho)
+    if not isinstance(caminho, str):
+        raise TypeError(f"lines espera o caminho do arquivo, recebeu {type(caminho).__name__}")
+    try:
+        arquivo = open(caminho, encoding='utf-8')
+    except OSError as e:
+        raise ValueError(f"não foi possível abrir '{caminho}': {e.strerror}")
+    return _ler(arquivo)
+
+def _ler(arquivo):
+    with arquivo:  # Fecha ao terminar o for (ou quando o gerador é descartado)
+        for linha in arquivo:
+            yield linha.rstrip('\n')
+
+def mensagens(canal):
+    """Mensagens recebidas pelo canal, uma por vez, até o outro lado encerrar a conexão."""
+    while True:
+        try:
+            yield canal.receber()
+        except ConnectionError:
+            return
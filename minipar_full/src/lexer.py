@@ -6,13 +6,15 @@ tokens = (
     # Palavras-chave
     'SEQ', 'PAR', 'IF', 'ELSE', 'WHILE', 'DEF', 'RETURN', 'INPUT', 'OUTPUT',
     'SEND', 'RECEIVE', 'BOOL', 'INT', 'FLOAT_TYPE', 'STRING_TYPE',
-    'C_CHANNEL', 'LIST', 'FOR', 'IN', 'TRUE', 'FALSE',
+    'C_CHANNEL', 'LIST', 'MATRIX', 'MAP', 'SET', 'FOR', 'IN', 'TRUE', 'FALSE',
+    'SCATTER', 'BROADCAST', 'GATHER',
     
     # Identificadores e literais
     'ID', 'NUM', 'FLOAT', 'STRING',
     
     # Operadores e símbolos
     'PLUS', 'MINUS', 'MULT', 'DIV', 'ASSIGN', 'EQ', 'NE', 'LT', 'GT', 'LE', 'GE',
+    'PLUS_ASSIGN', 'MINUS_ASSIGN', 'MULT_ASSIGN', 'DIV_ASSIGN',
     'LPAREN', 'RPAREN', 'LBRACE', 'RBRACE', 'LBRACKET', 'RBRACKET', 'COMMA', 'COLON', 'DOT',
     'SEMICOLON',  # Adicionado
     
@@ -34,12 +36,18 @@ keywords = {
     'return': 'RETURN',
     'send': 'SEND',
     'receive': 'RECEIVE',
+    'scatter': 'SCATTER',
+    'broadcast': 'BROADCAST',
+    'gather': 'GATHER',
     'Bool': 'BOOL',
     'Int': 'INT',
     'Float': 'FLOAT_TYPE',
     'String': 'STRING_TYPE',
     'c_channel': 'C_CHANNEL',
     'List': 'LIST',
+    'Matrix': 'MATRIX',
+    'Map': 'MAP',
+    'Set': 'SET',
     'for': 'FOR',
     'in': 'IN',
     'true': 'TRUE',
@@ -52,6 +60,10 @@ t_MINUS = r'-'
 t_MULT = r'\*'
 t_DIV = r'/'
 t_ASSIGN = r'='
+t_PLUS_ASSIGN = r'\+='
+t_MINUS_ASSIGN = r'-='
+t_MULT_ASSIGN = r'\*='
+t_DIV_ASSIGN = r'/='
 t_EQ = r'=='
 t_NE = r'!='
 t_LT = r'<'
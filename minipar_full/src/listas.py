@@ -0,0 +1,112 @@
+# src/listas.py
+"""
+Listas tipadas: valores de variáveis List<Int> e List<Float> ficam num
+array.array contíguo ('q': inteiro de 8 bytes, 'd': float de 8 bytes), em
+vez de uma lista de ponteiros para objetos (8 bytes do ponteiro + 24 a 32
+do int/float por elemento).
+
+O tipo do elemento é garantido: List<Float> converte inteiros para float e
+List<Int> recusa floats (e inteiros fora de 64 bits) com ErroLista.
+"""
+import array
+
+CODIGOS = {'Int': 'q', 'Float': 'd'}
+
+class ErroLista(Exception):
+    pass
+
+class ListaTipada(array.array):
+    """
+    array.array que se comporta como lista do MiniPar: concatena com listas,
+    compara e imprime como elas. O acesso por índice é o do array (sem
+    camada em Python); fatias passam por fatia().
+    """
+    def _nova(self, itens):
+        return ListaTipada(self.typecode, itens)
+
+    def __add__(self, outra):
+        if not isinstance(outra, (list, array.array)):
+            return NotImplemented
+        return _concatenar(self, outra)
+
+    def __radd__(self, outra):
+        if not isinstance(outra, list):
+            return NotImplemented
+        return _concatenar(outra, self)
+
+    def __mul__(self, vezes):
+        return self._nova(super().__mul__(vezes))
+
+    __rmul__ = __mul__
+
+    def __eq__(self, outra):
+        if isinstance(outra, (list, array.array)):
+            return len(self) == len(outra) and all(a == b for a, b in zip(self, outra))
+        return NotImplemented
+
+    def __ne__(self, outra):
+        igual = self.__eq__(outra)
+        return igual if igual is NotImplemented else not igual
+
+    __hash__ = None
+
+    def extend(self, itens):
+        # array.extend só aceita outro array do mesmo código; listas passam pelo fromlist
+        if isinstance(itens, array.array) and itens.typecode != self.typecode:
+            itens = list(itens)
+        if isinstance(itens, array.array):
+            super().extend(itens)
+        else:
+            self.fromlist(list(itens))
+
+    def __repr__(self):
+        return '[' + ', '.join(repr(item) for item in self) + ']'
+
+    __str__ = __repr__
+
+def _concatenar(a, b):
+    """
+    a + b com uma ListaTipada de pelo menos um lado: ListaTipada do menor
+    código que comporta os dois lados (List<Int> + floats vira 'd') ou, se
+    algum elemento não for número, uma lista comum. Quem garante o tipo
+    declarado é a atribuição (converter), não o +.
+    """
+    codigos = {lista.typecode for lista in (a, b) if isinstance(lista, array.array)}
+    for codigo in ('q', 'd') if 'q' in codigos else ('d',):
+        nova = ListaTipada(codigo)
+        try:
+            nova.extend(a)
+            nova.extend(b)
+            return nova
+        except (TypeError, OverflowError):
+            pass
+    return [*a, *b]
+
+def fatia(lista, inicio, fim):
+    """lista[inicio:fim], mantendo ListaTipada (a fatia de um array.array é um array.array simples)."""
+    trecho = lista[inicio:fim]
+    return ListaTipada(lista.typecode, trecho) if isinstance(lista, ListaTipada) else trecho
+
+def elemento(tipo):
+    """Código do array.array para um tipo List<Int>/List<Float> (('List', 'Int')), ou None."""
+    if isinstance(tipo, tuple) and tipo[0] == 'List':
+        return CODIGOS.get(tipo[1]) if isinstance(tipo[1], str) else None
+    return None
+
+def converter(tipo, valor):
+    """
+    Valor pronto para uma variável do tipo declarado: listas de List<Int> e
+    List<Float> (também aninhadas, como List<List<Float>>) viram ListaTipada.
+    Qualquer outro tipo ou valor volta sem mudança.
+    """
+    if not isinstance(tipo, tuple) or tipo[0] != 'List' or not isinstance(valor, (list, array.array, range)):
+        return valor
+    codigo = elemento(tipo)
+    if codigo is None:
+        return [converter(tipo[1], item) for item in valor] if isinstance(tipo[1], tuple) else valor
+    if isinstance(valor, ListaTipada) and valor.typecode == codigo:
+        return valor
+    try:
+        return ListaTipada(codigo, valor)
+    except (TypeError, OverflowError) as e:
+        raise ErroLista(f"valor inválido para List<{tipo[1]}>: {e}")
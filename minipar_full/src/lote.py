@@ -0,0 +1,222 @@
+# src/lote.py
+"""
+Execução em lote: roda muitos programas .mp num pool de processos já
+carregados (sem pagar a inicialização do interpretador por programa) e
+compara a saída de cada um com a esperada.
+
+Uso: python lote.py <diretório | programa.mp | manifesto.jsonl> ... [--trabalhadores N] [--limite 10]
+
+Num diretório, cada `nome.mp` (procurado recursivamente) usa, se existirem,
+`nome_expected.txt` como saída esperada e `nome_input.txt` como stdin, no
+mesmo estilo dos arquivos de TO DO/. Um manifesto tem um objeto JSON por
+linha: {"programa": "...", "esperado": "...", "entrada": "..."} (caminhos
+relativos ao manifesto; só "programa" é obrigatório).
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import difflib
+import io
+import json
+import os
+import sys
+import time
+
+import parser as ps
+import servico
+from saida import SaidaLista
+
+SUFIXO_ESPERADO = '_expected.txt'
+SUFIXO_ENTRADA = '_input.txt'
+FIM_TERMINAL = '** Process exited'  # Rodapé das transcrições de terminal em TO DO/
+
+OK, FALHOU, TEMPO, ERRO, EXECUTADO = 'OK', 'FALHOU', 'TEMPO', 'ERRO', 'EXECUTADO'
+
+# --------------------------------------
+# Casos
+# --------------------------------------
+class Caso:
+    def __init__(self, programa, esperado=None, entrada=None):
+        self.programa = programa
+        self.esperado = esperado  # Caminhos; None quando não há
+        self.entrada = entrada
+
+def _ler(caminho):
+    with open(caminho, 'r') as arquivo:
+        return arquivo.read()
+
+def _caso_do_programa(caminho):
+    base = caminho[:-len('.mp')]
+    existente = lambda sufixo: base + sufixo if os.path.exists(base + sufixo) else None
+    return Caso(caminho, existente(SUFIXO_ESPERADO), existente(SUFIXO_ENTRADA))
+
+def _casos_do_manifesto(caminho):
+    pasta = os.path.dirname(caminho)
+    relativo = lambda valor: os.path.join(pasta, valor) if valor else None
+    casos = []
+    with open(caminho, 'r') as arquivo:
+        for numero, linha in enumerate(arquivo, 1):
+            if not linha.strip():
+                continue
+            try:
+                item = json.loads(linha)
+                casos.append(Caso(relativo(item['programa']), relativo(item.get('esperado')),
+                                  relativo(item.get('entrada'))))
+            except (ValueError, KeyError, TypeError):
+                raise ValueError(f"{caminho}:{numero}: esperado um objeto JSON com o campo \"programa\"")
+    return casos
+
+def coletar(caminhos):
+    """Monta a lista de casos a partir de diretórios, programas e manifestos."""
+    casos = []
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            for pasta, subpastas, arquivos in os.walk(caminho):
+                subpastas.sort()
+                casos.extend(_caso_do_programa(os.path.join(pasta, nome))
+                             for nome in sorted(arquivos) if nome.endswith('.mp'))
+        elif caminho.endswith(('.jsonl', '.json')):
+            casos.extend(_casos_do_manifesto(caminho))
+        else:
+            casos.append(_caso_do_programa(caminho) if caminho.endswith('.mp') else Caso(caminho))
+    return casos
+
+def normalizar(texto):
+    """Ignora espaços no fim das linhas, linhas vazias no final e o rodapé de transcrições de terminal."""
+    linhas = []
+    for linha in texto.splitlines():
+        if linha.startswith(FIM_TERMINAL):
+            break
+        linhas.append(linha.rstrip())
+    while linhas and not linhas[-1]:
+        linhas.pop()
+    return linhas
+
+# --------------------------------------
+# Execução nos processos do pool
+# --------------------------------------
+class _EntradaComEco(io.StringIO):
+    """stdin que repete no destino cada linha lida, como aparece numa transcrição de terminal."""
+    def __init__(self, texto, saida):
+        super().__init__(texto)
+        self.saida = saida
+
+    def readline(self, *args):
+        linha = super().readline(*args)
+        self.saida.escrever(linha)
+        return linha
+
+def _laco_lote(conexao):
+    """Recebe (código, entrada, ecoar), analisa e executa; responde ('fim', resultado)."""
+    while True:
+        try:
+            codigo, entrada, ecoar = conexao.recv()
+        except EOFError:
+            return
+        saida = SaidaLista()
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(saida):  # Erros de sintaxe fazem parte da saída
+            try:
+                arvore = ps.analisar(codigo)
+            except Exception as e:
+                print(f"Erro durante a análise: {type(e).__name__}: {e}")
+                arvore = None
+        analise = time.perf_counter() - inicio
+        if arvore:
+            servico._executar(arvore, _EntradaComEco(entrada, saida) if ecoar else entrada, saida)
+        conexao.send(('fim', {
+            'saida': saida.valor(),
+            'segundos_analise': analise,
+            'segundos_execucao': time.perf_counter() - inicio - analise,
+        }))
+
+def executar_caso(pool, caso, limite, ecoar=False):
+    """Executa um caso no pool e retorna o resultado (dict) com estado, saída e tempos."""
+    resultado = {'programa': caso.programa, 'esperado': caso.esperado}
+    inicio = time.perf_counter()
+    try:
+        pedido = (_ler(caso.programa), _ler(caso.entrada) if caso.entrada else '', ecoar)
+        for _, valor in pool.executar(pedido, limite):
+            resultado.update(valor)
+    except TimeoutError as e:
+        resultado.update(estado=TEMPO, erro=str(e))
+    except (EOFError, OSError) as e:
+        resultado.update(estado=ERRO, erro=f"{type(e).__name__}: {e}")
+    resultado['segundos'] = time.perf_counter() - inicio
+    if 'estado' not in resultado:
+        if caso.esperado is None:
+            resultado['estado'] = EXECUTADO
+        else:
+            resultado['esperada'] = _ler(caso.esperado)
+            iguais = normalizar(resultado['saida']) == normalizar(resultado['esperada'])
+            resultado['estado'] = OK if iguais else FALHOU
+    return resultado
+
+def executar_lote(casos, trabalhadores, limite, ecoar=False):
+    """Gera os resultados na ordem dos casos, executando até `trabalhadores` programas ao mesmo tempo."""
+    pool = servico.PoolExecucao(trabalhadores, alvo=_laco_lote)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(trabalhadores) as threads:
+            yield from threads.map(lambda caso: executar_caso(pool, caso, limite, ecoar), casos)
+    finally:
+        pool.encerrar()
+
+# --------------------------------------
+# Relatório
+# --------------------------------------
+def _diferenca(resultado):
+    return ''.join(linha + '\n' for linha in difflib.unified_diff(
+        normalizar(resultado['esperada']), normalizar(resultado['saida']),
+        resultado['esperado'], 'saída obtida', lineterm=''))
+
+def main():
+    argumentos = argparse.ArgumentParser(description="Executa programas MiniPar em lote e compara as saídas")
+    argumentos.add_argument('caminhos', nargs='+', metavar='caminho',
+                            help="diretório, programa .mp ou manifesto .jsonl")
+    argumentos.add_argument('--trabalhadores', type=int, default=os.cpu_count() or 2,
+                            help="programas executados ao mesmo tempo")
+    argumentos.add_argument('--limite', type=float, default=10.0, help="segundos máximos por programa")
+    argumentos.add_argument('--ecoar-entrada', action='store_true',
+                            help="repete na saída as linhas lidas do stdin (saídas esperadas copiadas do terminal)")
+    argumentos.add_argument('--diff', action='store_true', help="mostra a diferença das saídas que falharam")
+    argumentos.add_argument('--lentos', type=int, default=5, metavar='N', help="lista os N programas mais lentos")
+    argumentos.add_argument('--json', metavar='ARQUIVO', help="grava o relatório completo em JSON")
+    opcoes = argumentos.parse_args()
+
+    try:
+        casos = coletar(opcoes.caminhos)
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}")
+        sys.exit(2)
+    if not casos:
+        print("Nenhum programa encontrado.")
+        sys.exit(2)
+
+    inicio = time.perf_counter()
+    resultados = []
+    for resultado in executar_lote(casos, max(1, opcoes.trabalhadores), opcoes.limite, opcoes.ecoar_entrada):
+        resultados.append(resultado)
+        print(f"{resultado['estado']:<9} {resultado['segundos'] * 1000:9.1f} ms  {resultado['programa']}")
+        if resultado.get('erro'):
+            print(f"          {resultado['erro']}")
+        if opcoes.diff and resultado['estado'] == FALHOU:
+            print(_diferenca(resultado), end='')
+    total = time.perf_counter() - inicio
+
+    contagem = {estado: 0 for estado in (OK, FALHOU, TEMPO, ERRO, EXECUTADO)}
+    for resultado in resultados:
+        contagem[resultado['estado']] += 1
+    print(f"\n{len(resultados)} programas em {total:.2f}s: "
+          + ', '.join(f"{quantidade} {estado}" for estado, quantidade in contagem.items() if quantidade))
+    if opcoes.lentos:
+        print("Mais lentos:")
+        for resultado in sorted(resultados, key=lambda r: r['segundos'], reverse=True)[:opcoes.lentos]:
+            print(f"  {resultado['segundos'] * 1000:9.1f} ms  {resultado['programa']}")
+
+    if opcoes.json:
+        with open(opcoes.json, 'w') as arquivo:
+            json.dump({'segundos': total, 'contagem': contagem, 'resultados': resultados}, arquivo, indent=2)
+    sys.exit(1 if contagem[FALHOU] or contagem[TEMPO] or contagem[ERRO] else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,93 @@
 import parser as ps
 import lexer as lexic
 import interpreter as exec
+import distribuido
+import metricas
+import ordenacao
+import perfil
+import repl
+from saida import SaidaBuffer
+import argparse
+import signal
 import sys
 import os
 #
 # Testar o interpretador MiniPar
-        
+
 def read_program_from_file(file_path):
     with open(file_path, 'r') as file:
         program = file.read()
     return program
 
 def main():
-    #Verifica se comando no terminal numero de argumentos diferente do esperado (2)
-    if len(sys.argv) != 2:
-        print("Uso: python main.py <nome_do_program.mp> ou minipar <nome_do_programa>")
-        sys.exit(1)
+    argumentos = argparse.ArgumentParser(
+        usage="python main.py [<nome_do_program.mp>] [--trabalhadores host:porta,...] [--metricas arquivo] [--saida direta|buffer|ordenada] [--marcar-ramos] [--perfil | --amostrar [ms]] [--pilhas arquivo] [--processos-sort N]"
+    )
+    argumentos.add_argument('programa', nargs='?', help="sem programa, abre a REPL")
+    argumentos.add_argument('--trabalhadores', default='',
+                            help="executa os ramos de PAR nos trabalhadores informados (ver trabalhador.py)")
+    argumentos.add_argument('--metricas', metavar='ARQUIVO',
+                            help="grava as métricas dos canais ao sair e a cada SIGUSR1 (.json ou OpenMetrics)")
+    argumentos.add_argument('--saida', choices=('direta', 'buffer', 'ordenada'), default='direta',
+                            help="buffer: cada thread escreve em blocos; ordenada: saída de cada ramo de PAR contígua e na ordem do código")
+    argumentos.add_argument('--marcar-ramos', action='store_true',
+                            help="prefixa cada linha escrita num ramo de PAR com o número do ramo ([1], [2.1]...)")
+    modo_perfil = argumentos.add_mutually_exclusive_group()
+    modo_perfil.add_argument('--perfil', '--profile', action='store_true',
+                             help="ao final, mostra no stderr visitas e tempos por linha e por nó")
+    modo_perfil.add_argument('--amostrar', type=float, nargs='?', const=10.0, metavar='MS',
+                             help="perfil por amostragem a cada MS milissegundos (padrão 10); "
+                                  "o relatório sai no stderr ao final e a cada SIGUSR2")
+    argumentos.add_argument('--pilhas', metavar='ARQUIVO',
+                            help="grava as pilhas do perfil no formato collapsed (flame graph); sem --amostrar, implica --perfil")
+    argumentos.add_argument('--processos-sort', type=int, default=1, metavar='N',
+                            help=f"sort sem chave de listas com {ordenacao.LIMIAR_PARALELO:,}+ elementos usa N processos")
+    opcoes = argumentos.parse_args()
+    ordenacao.PROCESSOS = max(1, opcoes.processos_sort)
+    if opcoes.metricas:
+        metricas.exportar_ao_sair(opcoes.metricas)
+    saida = None
+    if opcoes.saida != 'direta' or opcoes.marcar_ramos:
+        saida = SaidaBuffer(tamanho=0 if opcoes.saida == 'direta' else 64 * 1024,
+                            marcar=opcoes.marcar_ramos, ordenada=opcoes.saida == 'ordenada')
 
-    program_file = sys.argv[1]
+    program_file = opcoes.programa
+    if program_file is None:
+        repl.main(saida)
+        return
 
     # Verifica se o programa é inexistente
     if not os.path.exists(program_file):
         print(f"Erro: O arquivo '{program_file}' não foi encontrado.")
         sys.exit(1)
-    
+
     # Ler programa
     entrada = read_program_from_file(program_file)
-    
-    lexer = lexic.lexer
-    result = ps.parser.parse(entrada, lexer=lexer)
-    
+
+    result = ps.analisar(entrada)
+
     if result:
-        if not exec.has_error:
-            exec.execute_stmt(result)
-        else:
-            pass
+        trabalhadores = [distribuido.analisar_endereco(e) for e in opcoes.trabalhadores.split(',') if e]
+        executor = exec.Executor(trabalhadores=trabalhadores, saida=saida)
+        medidor = None
+        if opcoes.amostrar:
+            medidor = perfil.PerfilAmostragem(opcoes.amostrar / 1000)
+            medidor.iniciar()
+            if hasattr(signal, 'SIGUSR2'):
+                signal.signal(signal.SIGUSR2, lambda *_: sys.stderr.write(medidor.relatorio(entrada)))
+        elif opcoes.perfil or opcoes.pilhas:
+            medidor = perfil.PerfilDeterministico()
+            medidor.instalar(executor)
+        try:
+            executor.executar(result)
+        finally:
+            if opcoes.amostrar:
+                medidor.parar()
+            if medidor:
+                sys.stderr.write(medidor.relatorio(entrada))
+                if opcoes.pilhas:
+                    with open(opcoes.pilhas, 'w') as arquivo:
+                        arquivo.write(medidor.pilhas())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
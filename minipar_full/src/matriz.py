@@ -0,0 +1,148 @@
+# src/matriz.py
+"""
+Matrix<Float>: matriz densa num buffer contíguo (array.array 'd', linha
+após linha), no lugar de List<List<Float>> (uma lista de objetos por linha).
+
+m[i] é a linha i (uma vista: m[i][j] = x escreve na matriz), len(m) é o
+número de linhas e for (linha in m) percorre as linhas. As operações
+(matmul, broadcasting com listas, +=) ficam em vetorial.py e usam NumPy
+sobre o mesmo buffer, sem cópia, quando ele está instalado.
+"""
+import array
+
+from listas import ListaTipada, fatia
+
+class ErroMatriz(ValueError):
+    pass
+
+class Matriz:
+    def __init__(self, linhas, colunas, dados=None):
+        self.linhas = linhas
+        self.colunas = colunas
+        self.dados = dados if dados is not None else array.array('d', bytes(8 * linhas * colunas))
+        if len(self.dados) != linhas * colunas:
+            raise ErroMatriz(f"{len(self.dados)} valores não formam uma matriz {linhas}x{colunas}")
+
+    @classmethod
+    def de_linhas(cls, linhas):
+        """Matriz a partir de uma lista de linhas (listas de números do mesmo tamanho)."""
+        colunas = len(linhas[0]) if linhas else 0
+        dados = array.array('d')
+        for i, linha in enumerate(linhas):
+            if len(linha) != colunas:
+                raise ErroMatriz(f"linha {i} com {len(linha)} valores, esperado {colunas}")
+            try:
+                dados.fromlist(list(linha))
+            except TypeError as e:
+                raise ErroMatriz(f"linha {i}: {e}")
+        return cls(len(linhas), colunas, dados)
+
+    def _indice(self, i):
+        if not -self.linhas <= i < self.linhas:
+            raise IndexError(f"linha {i} fora da matriz {self.linhas}x{self.colunas}")
+        return i % self.linhas
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return Matriz.de_linhas([self[k] for k in range(self.linhas)[i]])
+        return LinhaMatriz(self, self._indice(i) * self.colunas)
+
+    def __setitem__(self, i, linha):
+        """m[i] = lista: copia os valores para a linha i."""
+        if len(linha) != self.colunas:
+            raise TypeError(f"linha com {len(linha)} valores numa matriz de {self.colunas} colunas")
+        inicio = self._indice(i) * self.colunas
+        self.dados[inicio:inicio + self.colunas] = array.array('d', linha)
+
+    def __len__(self):
+        return self.linhas
+
+    def __iter__(self):
+        return (LinhaMatriz(self, i * self.colunas) for i in range(self.linhas))
+
+    def coluna(self, j):
+        if not -self.colunas <= j < self.colunas:
+            raise IndexError(f"coluna {j} fora da matriz {self.linhas}x{self.colunas}")
+        return ListaTipada('d', self.dados[j % self.colunas::self.colunas])
+
+    def transposta(self):
+        dados = array.array('d')
+        for j in range(self.colunas):
+            dados.extend(self.dados[j::self.colunas])
+        return Matriz(self.colunas, self.linhas, dados)
+
+    def copia(self):
+        return Matriz(self.linhas, self.colunas, array.array('d', self.dados))
+
+    def __eq__(self, outra):
+        if isinstance(outra, Matriz):
+            return (self.linhas, self.colunas) == (outra.linhas, outra.colunas) and self.dados == outra.dados
+        if isinstance(outra, list):
+            return len(outra) == self.linhas and all(linha == outra[i] for i, linha in enumerate(self))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '[' + ', '.join(repr(linha) for linha in self) + ']'
+
+    __str__ = __repr__
+
+class LinhaMatriz:
+    """Vista de uma linha: leituras e escritas vão direto para o buffer da matriz."""
+    __slots__ = ('matriz', 'inicio')
+
+    def __init__(self, matriz, inicio):
+        self.matriz = matriz
+        self.inicio = inicio
+
+    def _posicao(self, j):
+        colunas = self.matriz.colunas
+        if not -colunas <= j < colunas:
+            raise IndexError(f"coluna {j} fora da matriz {self.matriz.linhas}x{colunas}")
+        return self.inicio + j % colunas
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return fatia(self.valores(), j.start, j.stop)
+        return self.matriz.dados[self._posicao(j)]
+
+    def __setitem__(self, j, valor):
+        self.matriz.dados[self._posicao(j)] = valor
+
+    def __len__(self):
+        return self.matriz.colunas
+
+    def __iter__(self):
+        return iter(self.matriz.dados[self.inicio:self.inicio + self.matriz.colunas])
+
+    def valores(self):
+        """Cópia da linha como ListaTipada."""
+        return ListaTipada('d', self.matriz.dados[self.inicio:self.inicio + self.matriz.colunas])
+
+    # Concatenação (linha + lista) é a da cópia; as operações elemento a elemento ficam em vetorial.py
+    def __add__(self, outra):
+        return self.valores() + outra
+
+    def __radd__(self, outra):
+        return outra + self.valores()
+
+    def __eq__(self, outra):
+        return self.valores() == outra
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.valores())
+
+    __str__ = __repr__
+
+def converter(tipo, valor):
+    """Valor pronto para uma variável Matrix<Float>: listas de linhas viram Matriz."""
+    if tipo[1] != 'Float':
+        raise ErroMatriz(f"Matrix<{tipo[1]}> não existe (use Matrix<Float>)")
+    if isinstance(valor, Matriz):
+        return valor
+    if isinstance(valor, list):
+        return Matriz.de_linhas(valor)
+    return valor
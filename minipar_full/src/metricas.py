@@ -0,0 +1,203 @@
+# src/metricas.py
+"""
+Métricas por canal: mensagens e bytes, histogramas de latência de envio e
+recepção, tempo bloqueado em recv/accept e profundidade da fila de envio.
+Exportáveis em JSON ou no formato texto do OpenMetrics (Prometheus).
+"""
+import atexit
+import bisect
+import json
+import signal
+import threading
+
+# Limites superiores dos baldes dos histogramas (segundos): 1µs, 2µs, 4µs ... ~33s
+LIMITES = tuple(1e-6 * 2 ** k for k in range(26))
+
+class Histograma:
+    def __init__(self):
+        self.baldes = [0] * (len(LIMITES) + 1)  # O último balde é +Inf
+        self.contagem = 0
+        self.soma = 0.0
+
+    def observar(self, valor):
+        self.baldes[bisect.bisect_left(LIMITES, valor)] += 1
+        self.contagem += 1
+        self.soma += valor
+
+    def percentil(self, p):
+        """Estimativa (limite superior do balde) do percentil p (0-100)."""
+        if not self.contagem:
+            return None
+        alvo = self.contagem * p / 100
+        acumulado = 0
+        for i, quantidade in enumerate(self.baldes):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                return LIMITES[i] if i < len(LIMITES) else float('inf')
+
+    def resumo(self):
+        return {
+            'contagem': self.contagem,
+            'soma_segundos': self.soma,
+            'p50_segundos': self.percentil(50),
+            'p99_segundos': self.percentil(99),
+        }
+
+class MetricasCanal:
+    def __init__(self, canal):
+        self.canal = canal
+        self.mensagens_enviadas = 0
+        self.mensagens_recebidas = 0
+        self.bytes_enviados = 0    # Bytes na rede (após compressão e enquadramento)
+        self.bytes_recebidos = 0
+        self.latencia_envio = Histograma()
+        self.latencia_recepcao = Histograma()
+        self.segundos_bloqueado_recv = 0.0
+        self.segundos_bloqueado_accept = 0.0
+        self.profundidade_fila = 0
+        self.profundidade_fila_maxima = 0
+        self.compressor = None  # compressao.Compressor do canal, se houver
+        self._trava = threading.Lock()
+
+    def registrar_envio(self, tamanho, segundos):
+        with self._trava:
+            self.mensagens_enviadas += 1
+            self.bytes_enviados += tamanho
+            self.latencia_envio.observar(segundos)
+
+    def registrar_recepcao(self, segundos):
+        with self._trava:
+            self.mensagens_recebidas += 1
+            self.latencia_recepcao.observar(segundos)
+
+    def registrar_leitura(self, tamanho, segundos):
+        """Bytes lidos do socket e tempo bloqueado esperando por eles."""
+        with self._trava:
+            self.bytes_recebidos += tamanho
+            self.segundos_bloqueado_recv += segundos
+
+    def registrar_accept(self, segundos):
+        with self._trava:
+            self.segundos_bloqueado_accept += segundos
+
+    def registrar_fila(self, profundidade):
+        self.profundidade_fila = profundidade
+        if profundidade > self.profundidade_fila_maxima:
+            self.profundidade_fila_maxima = profundidade
+
+    def resumo(self):
+        with self._trava:
+            resumo = {
+                'mensagens_enviadas': self.mensagens_enviadas,
+                'mensagens_recebidas': self.mensagens_recebidas,
+                'bytes_enviados': self.bytes_enviados,
+                'bytes_recebidos': self.bytes_recebidos,
+                'latencia_envio': self.latencia_envio.resumo(),
+                'latencia_recepcao': self.latencia_recepcao.resumo(),
+                'segundos_bloqueado_recv': self.segundos_bloqueado_recv,
+                'segundos_bloqueado_accept': self.segundos_bloqueado_accept,
+                'profundidade_fila': self.profundidade_fila,
+                'profundidade_fila_maxima': self.profundidade_fila_maxima,
+            }
+        if self.compressor is not None:
+            resumo['compressao'] = dict(self.compressor.estatisticas, taxa=self.compressor.taxa())
+        return resumo
+
+# --------------------------------------
+# Registro global e exportação
+# --------------------------------------
+_registro = {}  # {id do canal: MetricasCanal}
+_trava_registro = threading.Lock()
+
+def registrar(canal_id):
+    """Retorna as métricas do canal (canais com o mesmo id compartilham as métricas)."""
+    with _trava_registro:
+        if canal_id not in _registro:
+            _registro[canal_id] = MetricasCanal(canal_id)
+        return _registro[canal_id]
+
+def reiniciar():
+    """Esquece os canais registrados (processos que executam vários programas, um após o outro)."""
+    with _trava_registro:
+        _registro.clear()
+
+def exportar_json():
+    with _trava_registro:
+        canais = dict(_registro)
+    return json.dumps({canal: m.resumo() for canal, m in canais.items()}, indent=2)
+
+def _rotulos(**rotulos):
+    escapar = lambda valor: str(valor).replace('\\', '\\\\').replace('"', '\\"')
+    return '{' + ','.join(f'{chave}="{escapar(valor)}"' for chave, valor in rotulos.items()) + '}'
+
+def exportar_openmetrics():
+    with _trava_registro:
+        canais = dict(_registro)
+    linhas = []
+
+    def contador(nome, descricao, valores):
+        linhas.append(f"# TYPE {nome} counter")
+        linhas.append(f"# HELP {nome} {descricao}")
+        for rotulos, valor in valores:
+            linhas.append(f"{nome}_total{rotulos} {valor}")
+
+    def medidor(nome, descricao, valores):
+        linhas.append(f"# TYPE {nome} gauge")
+        linhas.append(f"# HELP {nome} {descricao}")
+        for rotulos, valor in valores:
+            linhas.append(f"{nome}{rotulos} {valor}")
+
+    contador("minipar_canal_mensagens", "Mensagens por canal e direção.",
+             [(_rotulos(canal=c, direcao=d), getattr(m, f'mensagens_{d}'))
+              for c, m in canais.items() for d in ('enviadas', 'recebidas')])
+    contador("minipar_canal_bytes", "Bytes na rede por canal e direção.",
+             [(_rotulos(canal=c, direcao=d), getattr(m, f'bytes_{d}'))
+              for c, m in canais.items() for d in ('enviados', 'recebidos')])
+    contador("minipar_canal_bloqueado_segundos", "Tempo bloqueado em recv/accept.",
+             [(_rotulos(canal=c, chamada=chamada), getattr(m, f'segundos_bloqueado_{chamada}'))
+              for c, m in canais.items() for chamada in ('recv', 'accept')])
+    medidor("minipar_canal_fila", "Mensagens na fila de envio.",
+            [(_rotulos(canal=c), m.profundidade_fila) for c, m in canais.items()])
+    medidor("minipar_canal_fila_maxima", "Maior profundidade observada da fila de envio.",
+            [(_rotulos(canal=c), m.profundidade_fila_maxima) for c, m in canais.items()])
+
+    linhas.append("# TYPE minipar_canal_latencia_segundos histogram")
+    linhas.append("# HELP minipar_canal_latencia_segundos Latência de envio e recepção.")
+    for c, m in canais.items():
+        for operacao, histograma in (('envio', m.latencia_envio), ('recepcao', m.latencia_recepcao)):
+            acumulado = 0
+            for limite, quantidade in zip(LIMITES + (float('inf'),), histograma.baldes):
+                acumulado += quantidade
+                le = '+Inf' if limite == float('inf') else repr(limite)
+                linhas.append(f"minipar_canal_latencia_segundos_bucket{_rotulos(canal=c, operacao=operacao, le=le)} {acumulado}")
+            rotulos = _rotulos(canal=c, operacao=operacao)
+            linhas.append(f"minipar_canal_latencia_segundos_count{rotulos} {histograma.contagem}")
+            linhas.append(f"minipar_canal_latencia_segundos_sum{rotulos} {histograma.soma}")
+    linhas.append("# EOF")
+    return '\n'.join(linhas) + '\n'
+
+def salvar(caminho):
+    """Grava as métricas; o formato vem da extensão (.json ou texto OpenMetrics)."""
+    texto = exportar_json() if caminho.endswith('.json') else exportar_openmetrics()
+    with open(caminho, 'w') as arquivo:
+        arquivo.write(texto)
+
+def exportar_ao_sair(caminho):
+    """
+    Grava as métricas em `caminho` ao final do programa e a cada SIGUSR1.
+    O tratador do sinal só avisa uma thread de exportação: ele roda entre
+    duas instruções da thread principal, que pode estar segurando as travas
+    que salvar precisa.
+    """
+    atexit.register(salvar, caminho)
+    if hasattr(signal, 'SIGUSR1') and threading.current_thread() is threading.main_thread():
+        pedido = threading.Event()
+
+        def exportar():
+            while True:
+                pedido.wait()
+                pedido.clear()
+                salvar(caminho)
+
+        threading.Thread(target=exportar, name='metricas-exportacao', daemon=True).start()
+        signal.signal(signal.SIGUSR1, lambda *_: pedido.set())
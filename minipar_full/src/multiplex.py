@@ -0,0 +1,255 @@
+# src/multiplex.py
+"""
+Multiplexação de canais: vários canais lógicos entre os mesmos dois hosts
+compartilham uma única conexão TCP. Cada canal vira um subfluxo identificado
+pelo nome, com controle de fluxo por créditos: o emissor só envia enquanto
+tiver créditos e o receptor devolve créditos à medida que consome, de modo
+que um canal lento não trava os demais.
+"""
+import collections
+import socket
+import struct
+import threading
+import time
+import metricas
+from channels import conectar_com_espera, conferir_opcao, ESPERA_CONEXAO
+
+# Quadro: tipo (1 byte) + tamanho do nome (2 bytes) + tamanho dos dados (4 bytes)
+_CABECALHO = struct.Struct('!BHI')
+_DADOS, _CREDITO, _FIM = 0, 1, 2
+JANELA_PADRAO = 64  # Mensagens em trânsito por subfluxo
+
+class _Subfluxo:
+    """Estado de um canal lógico dentro da conexão compartilhada."""
+    def __init__(self, janela):
+        self.mensagens = collections.deque()
+        self.creditos = janela   # Quantas mensagens ainda posso enviar
+        self.consumidas = 0      # Mensagens lidas ainda não devolvidas como crédito
+        self.encerrado = False   # O outro lado fechou este canal
+        self.condicao = threading.Condition()
+
+class Multiplexador:
+    """Uma conexão TCP por par de hosts, compartilhada por vários canais."""
+    def __init__(self, host, port, janela=JANELA_PADRAO):
+        self.host = host
+        self.port = port
+        self.janela = janela
+        self.socket = None
+        self.connection = None
+        self.subfluxos = {}
+        self.usuarios = 0  # Canais multiplexados abertos sobre esta conexão
+        self._trava = threading.Lock()         # Protege subfluxos e o estabelecimento da conexão
+        self._trava_escrita = threading.Lock()  # Um quadro por vez no socket
+        self._leitor = None
+        self._desconectado = False  # A thread de leitura terminou
+        self._thread_conexao = None  # Conexão antecipada em segundo plano (preconectar)
+        self._erro_conexao = None
+
+    def subfluxo(self, nome):
+        """Retorna o subfluxo do canal, criando-o na primeira referência."""
+        with self._trava:
+            if nome not in self.subfluxos:
+                self.subfluxos[nome] = _Subfluxo(self.janela)
+            return self.subfluxos[nome]
+
+    def _conexao(self, papel, prazo=0):
+        """Estabelece a conexão (quem envia primeiro conecta, quem recebe escuta)."""
+        antecipada = self._thread_conexao
+        if antecipada is not None and antecipada is not threading.current_thread():
+            antecipada.join()
+            self._thread_conexao = None
+            if self._erro_conexao:
+                erro, self._erro_conexao = self._erro_conexao, None
+                raise ConnectionError(f"[{self.host}:{self.port}] Falha ao conectar: {erro}")
+        with self._trava:
+            if self.connection is None and self.socket is None:
+                if papel == 'cliente':
+                    self.socket = conectar_com_espera(self.host, self.port, prazo)
+                    self.connection = self.socket
+                else:
+                    self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                    self.socket.bind((self.host, self.port))
+                    self.socket.listen(1)
+                    self.connection, _ = self.socket.accept()
+                # Quadros pequenos (créditos) não podem esperar pelo algoritmo de Nagle
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._leitor = threading.Thread(
+                    target=self._laco_leitura, name=f"mux-{self.host}:{self.port}", daemon=True
+                )
+                self._leitor.start()
+            return self.connection
+
+    def preconectar(self, papel):
+        """Estabelece a conexão compartilhada em segundo plano."""
+        with self._trava:
+            if self._thread_conexao is not None or self.socket is not None:
+                return
+            self._thread_conexao = threading.Thread(
+                target=self._conectar_em_segundo_plano, args=(papel,),
+                name=f"mux-{self.host}:{self.port}-conexao", daemon=True
+            )
+        self._thread_conexao.start()
+
+    def _conectar_em_segundo_plano(self, papel):
+        try:
+            self._conexao(papel, prazo=ESPERA_CONEXAO)
+        except OSError as e:
+            self._erro_conexao = e
+
+    def _escrever(self, tipo, nome, dados=b'', papel='cliente'):
+        conexao = self._conexao(papel)
+        nome = nome.encode()
+        with self._trava_escrita:
+            conexao.sendall(_CABECALHO.pack(tipo, len(nome), len(dados)) + nome + dados)
+
+    def _laco_leitura(self):
+        """Distribui os quadros recebidos para os subfluxos; nunca bloqueia num canal."""
+        arquivo = self.connection.makefile('rb')
+        try:
+            while True:
+                cabecalho = arquivo.read(_CABECALHO.size)
+                if len(cabecalho) < _CABECALHO.size:
+                    break
+                tipo, tam_nome, tam_dados = _CABECALHO.unpack(cabecalho)
+                nome = arquivo.read(tam_nome).decode()
+                dados = arquivo.read(tam_dados)
+                sub = self.subfluxo(nome)
+                with sub.condicao:
+                    if tipo == _DADOS:
+                        sub.mensagens.append(dados)
+                    elif tipo == _CREDITO:
+                        sub.creditos += int.from_bytes(dados, 'big')
+                    else:
+                        sub.encerrado = True
+                    sub.condicao.notify_all()
+        except OSError:
+            pass
+        finally:
+            # Conexão encerrada: acorda quem estiver esperando em qualquer canal
+            self._desconectado = True
+            with self._trava:
+                subfluxos = list(self.subfluxos.values())
+            for sub in subfluxos:
+                with sub.condicao:
+                    sub.encerrado = True
+                    sub.condicao.notify_all()
+
+    def enviar(self, nome, dados):
+        """Envia uma mensagem no subfluxo, aguardando crédito se a janela estiver cheia."""
+        sub = self.subfluxo(nome)
+        self._conexao('cliente')
+        with sub.condicao:
+            while sub.creditos == 0:
+                if self._desconectado:
+                    raise ConnectionError(f"[{nome}] Conexão multiplexada encerrada")
+                sub.condicao.wait()
+            sub.creditos -= 1
+        self._escrever(_DADOS, nome, dados)
+
+    def receber(self, nome):
+        """Recebe a próxima mensagem do subfluxo e devolve créditos ao emissor."""
+        sub = self.subfluxo(nome)
+        self._conexao('servidor')
+        devolver = 0
+        with sub.condicao:
+            while not sub.mensagens:
+                if sub.encerrado:
+                    raise ConnectionError(f"[{nome}] Canal encerrado pelo outro lado")
+                sub.condicao.wait()
+            dados = sub.mensagens.popleft()
+            sub.consumidas += 1
+            if sub.consumidas >= max(1, self.janela // 2):
+                devolver, sub.consumidas = sub.consumidas, 0
+        if devolver:
+            self._escrever(_CREDITO, nome, devolver.to_bytes(4, 'big'))
+        return dados
+
+    def encerrar(self, nome):
+        """Avisa o outro lado que o canal foi fechado; fecha a conexão com o último canal."""
+        if self.connection is not None:
+            try:
+                self._escrever(_FIM, nome)
+            except OSError:
+                pass
+        with self._trava:
+            self.usuarios -= 1
+            ultimo = self.usuarios <= 0
+        if ultimo:
+            with _trava_multiplexadores:
+                if _multiplexadores.get((self.host, self.port)) is self:
+                    del _multiplexadores[(self.host, self.port)]
+            if self.connection is not None:
+                try:
+                    self.connection.shutdown(socket.SHUT_WR)
+                except OSError:
+                    pass
+                if self._leitor is not None and self._leitor is not threading.current_thread():
+                    self._leitor.join(timeout=5)
+                self.connection.close()
+            if self.socket is not None and self.socket is not self.connection:
+                self.socket.close()
+
+_multiplexadores = {}  # {(host, porta): Multiplexador}
+_trava_multiplexadores = threading.Lock()
+
+def obter_multiplexador(host, port, janela=JANELA_PADRAO):
+    """Retorna a conexão compartilhada para host:porta."""
+    with _trava_multiplexadores:
+        mux = _multiplexadores.get((host, port))
+        if mux is None:
+            mux = Multiplexador(host, port, janela)
+            _multiplexadores[(host, port)] = mux
+        with mux._trava:
+            mux.usuarios += 1
+        return mux
+
+class CanalMultiplexado:
+    """
+    Canal com a mesma interface de channels.Canal, mas que trafega como um
+    subfluxo nomeado (o id do canal) sobre a conexão compartilhada do host.
+    """
+    OPCOES = ('multiplexar', 'janela')
+
+    def __init__(self, id, host, port, multiplexar=True, janela=JANELA_PADRAO):
+        conferir_opcao(id, 'multiplexar', multiplexar, bool)
+        conferir_opcao(id, 'janela', janela, int, minimo=1)
+        self.id = id
+        self.host = host
+        self.port = port
+        self.mux = obter_multiplexador(host, port, janela)
+        self.metricas = metricas.registrar(id)
+
+    def preconectar(self, papel):
+        """Estabelece a conexão compartilhada em segundo plano."""
+        self.mux.preconectar(papel)
+
+    def enviar(self, dados):
+        """Envia dados pelo subfluxo do canal."""
+        if isinstance(dados, (list, dict)):
+            dados = str(dados)
+        self.enviar_bytes(dados.encode())
+
+    def enviar_bytes(self, carga):
+        inicio = time.perf_counter()
+        self.mux.enviar(self.id, carga)
+        quadro = _CABECALHO.size + len(self.id.encode()) + len(carga)
+        self.metricas.registrar_envio(quadro, time.perf_counter() - inicio)
+
+    def receber(self):
+        """Recebe dados do subfluxo do canal."""
+        return self.receber_bytes().decode()
+
+    def receber_bytes(self):
+        # A leitura do socket é da thread do multiplexador; aqui o bloqueio é a espera pela mensagem
+        inicio = time.perf_counter()
+        carga = self.mux.receber(self.id)
+        segundos = time.perf_counter() - inicio
+        self.metricas.registrar_leitura(_CABECALHO.size + len(self.id.encode()) + len(carga), segundos)
+        self.metricas.registrar_recepcao(segundos)
+        return carga
+
+    def fechar(self):
+        """Fecha o canal lógico (a conexão fecha junto com o último canal)."""
+        self.mux.encerrar(self.id)
+        print(f"[{self.id}] Conexão fechada.")
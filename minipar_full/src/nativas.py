@@ -0,0 +1,108 @@
+# src/nativas.py
+"""Funções nativas: disponíveis em todo programa sem declaração (def)."""
+import array
+
+import colecoes
+import iteradores
+import matriz
+import ordenacao
+import vetorial
+
+def _append(lista, valor):
+    """append(lista, valor): acrescenta no fim (numa List<Int>/List<Float> o tipo do elemento é conferido)."""
+    if not isinstance(lista, (list, array.array)):
+        raise TypeError(f"esperava uma lista, recebeu {type(lista).__name__}")
+    lista.append(valor)
+
+def _matrix(linhas, colunas, valor):
+    """matrix(linhas, colunas, valor): Matrix<Float> linhas x colunas com todos os elementos iguais a valor."""
+    if type(linhas) is not int or type(colunas) is not int or linhas < 0 or colunas < 0:
+        raise ValueError("matrix espera números de linhas e colunas inteiros e não negativos")
+    return matriz.Matriz(linhas, colunas, array.array('d', [valor]) * (linhas * colunas))
+
+def _transpose(m):
+    """transpose(m): a transposta de uma matriz (Matrix ou lista de linhas)."""
+    if not isinstance(m, matriz.Matriz):
+        m = matriz.Matriz.de_linhas(m)
+    return m.transposta()
+
+def _column(m, j):
+    """column(m, j): a coluna j de uma Matrix, como List<Float>."""
+    if not isinstance(m, matriz.Matriz):
+        raise TypeError(f"esperava uma Matrix, recebeu {type(m).__name__}")
+    try:
+        return m.coluna(j)
+    except IndexError as e:
+        raise ValueError(str(e))
+
+def _mesmo_formato(tipos):
+    """Resultado de uma função aplicada a cada elemento: float para número, lista para lista."""
+    if tipos[0] in ('int', 'float', 'num'):
+        return 'float'
+    return 'list' if tipos[0] == 'list' else None
+
+def _relu(tipos):
+    return tipos[0] if tipos[0] in ('int', 'float', 'num', 'list') else None
+
+def _lista(tipos):
+    return 'list' if tipos[0] == 'list' else None
+
+def _add(tipos):
+    if 'list' in tipos:
+        return 'list'
+    return 'num' if all(tipo in ('int', 'float', 'num') for tipo in tipos) else None
+
+# {nome: (implementação, número de parâmetros (ou (mínimo, máximo)), tipo do resultado para a
+#         inferência em tipos.py: um tipo fixo ou uma função dos tipos dos argumentos)}
+NATIVAS = {
+    'len': (len, 1, 'int'),
+    'append': (_append, 2, None),
+    'sort': (ordenacao.ordenar, (1, 3), _lista),
+    # Iteráveis sob demanda para o for (iteradores.py)
+    'range': (iteradores.intervalo, (1, 3), 'range'),
+    'lines': (iteradores.linhas, 1, None),
+    # Map e Set (colecoes.py)
+    'get': (colecoes.obter, (2, 3), None),
+    'put': (colecoes.por, (2, 3), None),
+    'contains': (colecoes.contem, 2, 'bool'),
+    'remove': (colecoes.remover, 2, None),
+    'keys': (colecoes.chaves, 1, 'list'),
+    'values': (colecoes.valores, 1, 'list'),
+    'set': (colecoes.conjunto, 1, 'set'),
+    # Vetoriais (vetorial.py): com NumPy quando instalado
+    'exp': (vetorial.exp, 1, _mesmo_formato),
+    'sigmoid': (vetorial.sigmoid, 1, _mesmo_formato),
+    'relu': (vetorial.relu, 1, _relu),
+    'add': (vetorial.add, 2, _add),
+    'dot': (vetorial.dot, 2, 'num'),
+    'sum': (vetorial.soma, 1, 'num'),
+    'matmul': (vetorial.matmul, 2, None),
+    # Matrix<Float> (matriz.py)
+    'matrix': (_matrix, 3, None),
+    'transpose': (_transpose, 1, None),
+    'column': (_column, 2, 'list'),
+}
+
+# Argumentos que nomeiam uma função (String): o Executor troca o nome pela função
+# antes de chamar a nativa. {nome da nativa: posição do argumento}
+ARGUMENTOS_FUNCAO = {'sort': 1}
+
+def assinatura(nome):
+    """Detalhes da nativa no formato da tabela de símbolos (com 'minimo' de argumentos), ou None se não existir."""
+    if nome not in NATIVAS:
+        return None
+    nargs = NATIVAS[nome][1]
+    minimo, maximo = nargs if isinstance(nargs, tuple) else (nargs, nargs)
+    return {'tipo_retorno': 'unknown', 'minimo': minimo,
+            'parametros': [{'nome': f"arg{i}", 'tipo': 'unknown'} for i in range(maximo)]}
+
+def obter(nome):
+    """Implementação da nativa, ou None se não existir."""
+    return NATIVAS[nome][0] if nome in NATIVAS else None
+
+def tipo_retorno(nome, tipos_args):
+    """Tipo do resultado da nativa ('int', 'float'...) dados os tipos dos argumentos, ou None se desconhecido."""
+    if nome not in NATIVAS:
+        return None
+    tipo = NATIVAS[nome][2]
+    return tipo(tipos_args) if callable(tipo) else tipo
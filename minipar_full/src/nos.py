@@ -0,0 +1,155 @@
+# src/nos.py
+"""Nós da árvore sintática gerada pelo parser e percorrida pelo Executor."""
+
+class No:
+    """
+    Nó base. Cada subclasse lista seus campos em `campos`; o Executor
+    despacha pelo nome da classe (visitar_<Classe>).
+    """
+    campos = ()
+    tipo_inferido = None  # Tipo garantido pela inferência (tipos.py): 'int', 'float', 'num', 'str', 'bool', 'list'
+
+    def __init__(self, *valores, linha=None):
+        if len(valores) != len(self.campos):
+            raise TypeError(f"{type(self).__name__} espera {len(self.campos)} campos, recebeu {len(valores)}")
+        for campo, valor in zip(self.campos, valores):
+            setattr(self, campo, valor)
+        self.linha = linha  # Linha do código-fonte (quando conhecida)
+
+    def filhos(self):
+        """Retorna os nós filhos (inclusive os que estão dentro de listas)."""
+        for campo in self.campos:
+            valor = getattr(self, campo)
+            if isinstance(valor, No):
+                yield valor
+            elif isinstance(valor, list):
+                for item in valor:
+                    if isinstance(item, No):
+                        yield item
+
+    def __repr__(self):
+        valores = ', '.join(repr(getattr(self, campo)) for campo in self.campos)
+        return f"{type(self).__name__}({valores})"
+
+# --------------------------------------
+# Blocos e comandos
+# --------------------------------------
+class Programa(No):
+    campos = ('bloco',)
+
+class BlocoSEQ(No):
+    campos = ('stmts',)
+
+class BlocoPAR(No):
+    campos = ('stmts',)
+
+class DeclaracaoVariavel(No):
+    campos = ('tipo', 'id', 'expr')
+
+class Atribuicao(No):
+    campos = ('id', 'expr')
+
+class AtribuicaoIndice(No):
+    campos = ('id', 'indices', 'expr')
+
+class AtribuicaoComposta(No):
+    campos = ('id', 'indices', 'op', 'expr')  # indices: [] para a própria variável
+
+class If(No):
+    campos = ('condicao', 'entao', 'senao')
+
+class While(No):
+    campos = ('condicao', 'stmts')
+
+class For(No):
+    campos = ('id', 'expr', 'stmts')
+
+class DefFuncao(No):
+    campos = ('nome', 'params', 'stmts')
+
+class Return(No):
+    campos = ('expr',)
+
+class Input(No):
+    campos = ('args',)
+
+class Output(No):
+    campos = ('args',)
+
+class ChamadaFuncao(No):
+    campos = ('nome', 'args')
+
+# --------------------------------------
+# Canais
+# --------------------------------------
+class DeclaracaoCanal(No):
+    campos = ('id', 'host', 'port', 'opcoes')
+
+class DeclaracaoGrupo(No):
+    campos = ('id', 'host', 'portas', 'opcoes')
+
+class Send(No):
+    campos = ('canal', 'dados')
+
+class Receive(No):
+    campos = ('canal', 'variavel')
+
+class Scatter(No):
+    campos = ('canal', 'dados')
+
+class Broadcast(No):
+    campos = ('canal', 'dados')
+
+class Gather(No):
+    campos = ('canal', 'variavel')
+
+# --------------------------------------
+# Expressões
+# --------------------------------------
+class BinOp(No):
+    campos = ('op', 'esquerda', 'direita')
+
+class Comparacao(No):
+    campos = ('op', 'esquerda', 'direita')
+
+# Especializações criadas pela inferência de tipos (tipos.py); cada uma confere
+# os tipos dos operandos e, se a garantia falhar, usa o caminho genérico.
+class BinOpInt(BinOp):
+    """Aritmética entre dois int."""
+
+class BinOpFloat(BinOp):
+    """Aritmética entre números em que ao menos um é float (ou pode ser)."""
+
+class ComparacaoNumerica(Comparacao):
+    """Comparação entre dois números."""
+
+class Lista(No):
+    campos = ('itens',)
+
+class Mapa(No):
+    campos = ('chaves', 'valores')  # {chaves[i]: valores[i]}
+
+class Indice(No):
+    campos = ('lista', 'indice')
+
+class Fatia(No):
+    campos = ('lista', 'inicio', 'fim')  # inicio/fim: None quando omitidos
+
+class AcessoAtributo(No):
+    campos = ('objeto', 'atributo')
+
+class Numero(No):
+    campos = ('valor',)
+
+class String(No):
+    campos = ('valor',)
+
+class Bool(No):
+    campos = ('valor',)
+
+class ID(No):
+    campos = ('nome', 'tipo')
+
+class Erro(No):
+    """Marca um trecho com erro semântico já reportado pelo parser."""
+    campos = ('nome',)
@@ -0,0 +1,62 @@
+# src/ordenacao.py
+"""
+Nativa sort(lista, chave?, reverso?): devolve uma lista nova ordenada pelo
+Timsort do Python (sorted), sem o custo de um quicksort interpretado, em
+que cada comparação são várias visitas a nós. List<Int>/List<Float>
+continuam ListaTipada.
+
+A chave é o nome de uma função (def do programa ou nativa), aplicada a cada
+elemento: sort(palavras, "len"). sort(v, true) ordena em ordem decrescente.
+
+O modo paralelo é opcional (main.py --processos-sort N, que define
+PROCESSOS): sem chave, listas com pelo menos LIMIAR_PARALELO elementos são
+divididas em trechos ordenados num pool de PROCESSOS processos; os trechos
+voltam e são intercalados (k-way merge) pelo próprio Timsort, que reconhece
+as k sequências já ordenadas e só as mescla, em C. Ele não é o padrão porque
+serializar a lista para os processos e de volta custa mais que a ordenação
+em si em muitas máquinas (benchmarks/ordenar.py mede os dois modos). Com
+chave não há modo paralelo: ela chama o interpretador, que não atravessa
+processos. Também não há dentro de um processo daemon (os do servico.py e
+do lote.py), que não pode criar processos filhos.
+"""
+import array
+import concurrent.futures
+import itertools
+import multiprocessing
+
+from listas import ListaTipada
+
+LIMIAR_PARALELO = 250_000       # Elementos a partir dos quais vale dividir entre processos
+PROCESSOS = 1                    # 1: nunca paralelo (padrão)
+
+def _ordenar_trecho(trecho, reverso):
+    """Executado no processo do pool: arrays voltam como array (serializados como bytes)."""
+    ordenado = sorted(trecho, reverse=reverso)
+    return array.array(trecho.typecode, ordenado) if isinstance(trecho, array.array) else ordenado
+
+def _paralelo(lista, reverso):
+    tamanho = -(-len(lista) // PROCESSOS)
+    trechos = [lista[i:i + tamanho] for i in range(0, len(lista), tamanho)]
+    try:
+        with concurrent.futures.ProcessPoolExecutor(len(trechos)) as pool:
+            ordenados = list(pool.map(_ordenar_trecho, trechos, itertools.repeat(reverso)))
+    except (OSError, concurrent.futures.process.BrokenProcessPool):
+        return sorted(lista, reverse=reverso)  # Sem processos (ex: ambiente restrito): ordena aqui
+    return sorted(itertools.chain.from_iterable(ordenados), reverse=reverso)
+
+def ordenar(lista, chave=None, reverso=False):
+    """sort(lista, chave, reverso): cópia ordenada da lista (chave: função aplicada a cada elemento)."""
+    if not isinstance(lista, (list, array.array)):
+        raise TypeError(f"esperava uma lista, recebeu {type(lista).__name__}")
+    if isinstance(chave, bool):  # sort(v, true): sem chave, só o sentido
+        chave, reverso = None, chave
+    if chave is not None and not callable(chave):
+        raise TypeError(f"a chave deve ser o nome de uma função, recebeu {type(chave).__name__}")
+    if not isinstance(reverso, bool):
+        raise TypeError(f"reverso deve ser Bool, recebeu {type(reverso).__name__}")
+    if (chave is None and PROCESSOS > 1 and len(lista) >= LIMIAR_PARALELO
+            and not multiprocessing.current_process().daemon):
+        ordenado = _paralelo(lista, reverso)
+    else:
+        ordenado = sorted(lista, key=chave, reverse=reverso)
+    return ListaTipada(lista.typecode, ordenado) if isinstance(lista, array.array) else ordenado
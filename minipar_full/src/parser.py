@@ -1,6 +1,9 @@
 import ply.yacc as yacc
+import lexer as lexico
 from lexer import tokens
 from symbol_table import TabelaSimbolos, ErroSemantico
+import nos
+import nativas
 
 class Parser:
     def __init__(self):
@@ -13,17 +16,18 @@ class Parser:
 # Inicializa a tabela de símbolos global
 tabela_simbolos = TabelaSimbolos()
 
-# Precedência de operadores
+# Precedência de operadores (da menor para a maior): comparações, soma, produto, índice
 precedence = (
+    ('nonassoc', 'LT', 'LE', 'GT', 'GE', 'EQ', 'NE'),
     ('left', 'PLUS', 'MINUS'),
     ('left', 'MULT', 'DIV'),
-    ('nonassoc', 'LT', 'LE', 'GT', 'GE', 'EQ', 'NE'),
+    ('left', 'LBRACKET'),
 )
 
 # Regra inicial
 def p_programa_minipar(p):
     'programa_minipar : bloco_stmt'
-    p[0] = ('programa', p[1])
+    p[0] = nos.Programa(p[1])
 
 # Blocos SEQ e PAR
 def p_bloco_stmt(p):
@@ -34,12 +38,12 @@ def p_bloco_stmt(p):
 def p_bloco_SEQ(p):
     'bloco_SEQ : SEQ LBRACE stmts RBRACE'
     tabela_simbolos.novo_escopo()  # Entra em um novo escopo
-    p[0] = ('SEQ', p[3])
+    p[0] = nos.BlocoSEQ(p[3], linha=p.lineno(1))
     tabela_simbolos.sair_escopo()  # Sai do escopo ao finalizar o bloco
 
 def p_bloco_PAR(p):
     'bloco_PAR : PAR LBRACE stmts RBRACE'
-    p[0] = ('PAR', p[3])
+    p[0] = nos.BlocoPAR(p[3], linha=p.lineno(1))
 
 # Lista de comandos
 def p_stmts(p):
@@ -54,8 +58,18 @@ def p_tipo_var(p):
                 | FLOAT_TYPE
                 | STRING_TYPE
                 | C_CHANNEL
-                | LIST LT tipo_var GT'''
-    p[0] = p[1] if len(p) == 2 else (p[1], p[3])
+                | LIST LT tipo_var GT
+                | MATRIX LT tipo_var GT
+                | SET LT tipo_var GT
+                | MAP LT tipo_var COMMA tipo_var GT'''
+    if len(p) == 2:
+        p[0] = p[1]
+    elif len(p) == 5:
+        p[0] = (p[1], p[3])
+    else:
+        p[0] = (p[1], p[3], p[5])
+    if p[1] == 'Matrix' and p[3] != 'Float':
+        print(f"Erro Semântico (linha {p.lineno(1)}): Matrix<{p[3]}> não existe (use Matrix<Float>)")
 
 
 # Declaração de variáveis
@@ -68,7 +82,7 @@ def p_declaracao(p):
         tabela_simbolos.escopo_atual.declarar_variavel(nome, tipo)
     except ErroSemantico as e:
         print(f"Erro Semântico (linha {p.lineno(2)}): {e}")
-    p[0] = ('declaracao', tipo, nome, p[4])
+    p[0] = nos.DeclaracaoVariavel(tipo, nome, p[4], linha=p.lineno(2))
 
     def p_declaracao_String(p):
         'declaracao : STRING_TYPE ID ASSIGN expr'
@@ -79,24 +93,83 @@ def p_declaracao(p):
             tabela_simbolos.escopo_atual.declarar_variavel(nome, tipo)
         except ErroSemantico as e:
             print(f"Erro Semântico (linha {p.lineno(2)}): {e}")
-        p[0] = ('declaracao', tipo, nome, p[4])
+        p[0] = nos.DeclaracaoVariavel(tipo, nome, p[4], linha=p.lineno(2))
 
     # Adicione esta regra ao parser.py
 def p_declaracao_canal(p):
-    '''declaracao : C_CHANNEL ASSIGN ID STRING NUM SEMICOLON'''
+    '''declaracao : C_CHANNEL ASSIGN ID STRING NUM
+                  | C_CHANNEL ASSIGN ID STRING NUM opcoes_canal'''
     try:
         canal_id = p[3]
         host = p[4].strip('"')  # Remove as aspas da string
         porta = p[5]
-        p[0] = ('declaracao_canal', canal_id, host, porta)
+        opcoes = p[6] if len(p) == 7 else {}
+        # O nome do canal vale como expressão em for (msg in canal) (mensagens até a conexão fechar)
+        if canal_id not in tabela_simbolos.escopo_atual.simbolos:
+            tabela_simbolos.escopo_atual.declarar_variavel(canal_id, 'c_channel')
+        p[0] = nos.DeclaracaoCanal(canal_id, host, porta, opcoes, linha=p.lineno(1))
     except Exception as e:
         print(f"Erro na declaração do canal: {e}")
 
+# Grupo de canais: c_channel = fazenda "localhost" [9001, 9002] politica="menor_carga";
+def p_declaracao_grupo(p):
+    '''declaracao : C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET
+                  | C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET opcoes_canal'''
+    opcoes = p[8] if len(p) == 9 else {}
+    p[0] = nos.DeclaracaoGrupo(p[3], p[4], p[6], opcoes, linha=p.lineno(1))
+
+def p_portas(p):
+    '''portas : NUM
+              | NUM COMMA portas'''
+    p[0] = [p[1]] if len(p) == 2 else [p[1]] + p[3]
+
+# Opções do canal (ex: capacidade=64)
+def p_opcoes_canal(p):
+    '''opcoes_canal : opcao_canal
+                    | opcao_canal COMMA opcoes_canal'''
+    p[0] = dict(p[1]) if len(p) == 2 else {**p[1], **p[3]}
+
+def p_opcao_canal(p):
+    '''opcao_canal : ID ASSIGN NUM
+                   | ID ASSIGN STRING
+                   | ID ASSIGN TRUE
+                   | ID ASSIGN FALSE'''
+    valor = p[3]
+    if p.slice[3].type in ('TRUE', 'FALSE'):
+        valor = p.slice[3].type == 'TRUE'
+    p[0] = {p[1]: valor}
+
         
 # Atribuição
 def p_atribuicao(p):
     'atribuicao : ID ASSIGN expr'
-    p[0] = ('atribuicao', p[1], p[3])
+    p[0] = nos.Atribuicao(p[1], p[3], linha=p.lineno(1))
+
+# Atribuição a elemento de lista: v[i] = x; m[i][j] = x;
+def p_atribuicao_indice(p):
+    'atribuicao : ID indices ASSIGN expr'
+    p[0] = nos.AtribuicaoIndice(p[1], p[2], p[4], linha=p.lineno(1))
+
+# Atribuição composta: x += 1; m[i][j] *= 2; (numa Matrix, m += v altera a própria matriz)
+def p_atribuicao_composta(p):
+    '''atribuicao : ID op_composto expr
+                  | ID indices op_composto expr'''
+    if len(p) == 4:
+        p[0] = nos.AtribuicaoComposta(p[1], [], p[2], p[3], linha=p.lineno(1))
+    else:
+        p[0] = nos.AtribuicaoComposta(p[1], p[2], p[3], p[4], linha=p.lineno(1))
+
+def p_op_composto(p):
+    '''op_composto : PLUS_ASSIGN
+                   | MINUS_ASSIGN
+                   | MULT_ASSIGN
+                   | DIV_ASSIGN'''
+    p[0] = p[1][0]  # '+=' -> '+'
+
+def p_indices(p):
+    '''indices : LBRACKET expr RBRACKET
+               | indices LBRACKET expr RBRACKET'''
+    p[0] = [p[2]] if len(p) == 4 else p[1] + [p[3]]
 
 # Comandos
 def p_stmt(p):
@@ -111,38 +184,64 @@ def p_stmt(p):
             | chamada_funcao SEMICOLON
             | receive_stmt
             | send_stmt
-            | RETURN expr SEMICOLON
+            | scatter_stmt
+            | gather_stmt
+            | bloco_stmt
             | COMMENT'''
     p[0] = p[1]
 
+def p_stmt_return(p):
+    'stmt : RETURN expr SEMICOLON'
+    p[0] = nos.Return(p[2], linha=p.lineno(1))
+
 # Adicionando regra para FOR
 def p_for_stmt(p):
-    'for_stmt : FOR LPAREN ID IN expr RPAREN LBRACE stmts RBRACE'
-    p[0] = ('for', p[3], p[5], p[8])
+    'for_stmt : FOR LPAREN ID IN expr RPAREN inicio_for LBRACE stmts RBRACE'
+    p[0] = nos.For(p[3], p[5], p[9], linha=p.lineno(1))
+
+def p_inicio_for(p):
+    'inicio_for :'
+    # Declara a variável do laço antes do corpo ser analisado (p[-4] é o ID)
+    if p[-4] not in tabela_simbolos.escopo_atual.simbolos:
+        tabela_simbolos.escopo_atual.declarar_variavel(p[-4], None)
 
 # Adicionando regra para WHILE
 def p_while_stmt(p):
     'while_stmt : WHILE LPAREN expr RPAREN LBRACE stmts RBRACE'
-    p[0] = ('while', p[3], p[6])
+    p[0] = nos.While(p[3], p[6], linha=p.lineno(1))
 
 def p_input(p):
     'input : INPUT LPAREN args RPAREN'
-    p[0] = ('input', p[3])
+    p[0] = nos.Input(p[3], linha=p.lineno(1))
 
 def p_output(p):
     'output : OUTPUT LPAREN args RPAREN'
-    p[0] = ('output', p[3])
+    p[0] = nos.Output(p[3], linha=p.lineno(1))
 
 # Adicionando regra para RECEIVE
 def p_receive_stmt(p):
     'receive_stmt : ID DOT RECEIVE COLON expr SEMICOLON'
-    p[0] = ('receive', p[2], p[4])
+    p[0] = nos.Receive(p[1], _nome_destino(p[5]), linha=p.lineno(1))
 
 # Adicionando regra para SEND
 def p_send_stmt(p):
     'send_stmt : ID DOT SEND COLON expr SEMICOLON'
-    p[0] = ('send', p[2], p[4])
+    p[0] = nos.Send(p[1], p[5], linha=p.lineno(1))
+
+def _nome_destino(expr):
+    """Nome da variável que recebe os dados de um receive/gather."""
+    return expr.nome if isinstance(expr, (nos.ID, nos.Erro)) else expr
+
+# Comandos de grupos de canais
+def p_scatter_stmt(p):
+    '''scatter_stmt : ID DOT SCATTER COLON expr SEMICOLON
+                    | ID DOT BROADCAST COLON expr SEMICOLON'''
+    no = nos.Scatter if p.slice[3].type == 'SCATTER' else nos.Broadcast
+    p[0] = no(p[1], p[5], linha=p.lineno(1))
 
+def p_gather_stmt(p):
+    'gather_stmt : ID DOT GATHER COLON expr SEMICOLON'
+    p[0] = nos.Gather(p[1], _nome_destino(p[5]), linha=p.lineno(1))
 
 # Parâmetros de função
 def p_params(p):
@@ -158,33 +257,34 @@ def p_params(p):
 
 # Definição de função
 def p_def_funcao(p):
-    'def_funcao : DEF ID LPAREN params RPAREN LBRACE stmts RBRACE'
-    nome_funcao = p[2]
-    parametros = p[4]
-    # Declara a função na tabela
+    'def_funcao : DEF ID LPAREN params RPAREN inicio_funcao LBRACE stmts RBRACE'
+    p[0] = nos.DefFuncao(p[2], p[4], p[8], linha=p.lineno(1))
+    tabela_simbolos.sair_escopo()  # Sai do escopo da função
+
+def p_inicio_funcao(p):
+    'inicio_funcao :'
+    # Antes do corpo: declara a função (permite recursão) e abre o escopo dos parâmetros
+    nome_funcao, parametros = p[-4], p[-2]
     try:
         tabela_simbolos.declarar_funcao(
-            nome_funcao, 
+            nome_funcao,
             tipo_retorno="void",  # Atualize conforme a linguagem
             parametros=parametros
         )
-        # Novo escopo para os parâmetros e variáveis locais
-        tabela_simbolos.novo_escopo()
-        for param in parametros:
-            tabela_simbolos.escopo_atual.declarar_variavel(param['nome'], param['tipo'])
-        p[0] = ('def_funcao', nome_funcao, parametros, p[7])
     except ErroSemantico as e:
         print(f"Erro em função '{nome_funcao}': {e}")
-    finally:
-        tabela_simbolos.sair_escopo()  # Sai do escopo da função
+    # Novo escopo para os parâmetros e variáveis locais
+    tabela_simbolos.novo_escopo()
+    for param in parametros:
+        tabela_simbolos.escopo_atual.declarar_variavel(param['nome'], param['tipo'])
 
 def p_expr_input(p):
     'expr : INPUT LPAREN args RPAREN'
-    p[0] = ('input', p[3])  # p[3] = lista de argumentos (ex: prompt)
+    p[0] = nos.Input(p[3], linha=p.lineno(1))  # p[3] = lista de argumentos (ex: prompt)
 
 def p_expr_output(p):
     'expr : OUTPUT LPAREN args RPAREN'
-    p[0] = ('output', p[3])  # p[3] = valores a serem impressos
+    p[0] = nos.Output(p[3], linha=p.lineno(1))  # p[3] = valores a serem impressos
 
 # Chamada de função (priorizada antes de expr_simples)
 def p_chamada_funcao(p):
@@ -192,15 +292,18 @@ def p_chamada_funcao(p):
     nome_funcao = p[1]
     args = p[3]
     try:
-        # Obtém detalhes da função
-        funcao = tabela_simbolos.obter_funcao(nome_funcao)
-        # Verifica número de argumentos
-        if len(args) != len(funcao['parametros']):
-            raise ErroSemantico(f"Função '{nome_funcao}' espera {len(funcao['parametros'])} argumentos, mas {len(args)} foram fornecidos")
-        p[0] = ('chamada_funcao', nome_funcao, args)
+        # Obtém detalhes da função (as nativas valem em qualquer programa)
+        funcao = nativas.assinatura(nome_funcao) or tabela_simbolos.obter_funcao(nome_funcao)
+        # Verifica número de argumentos (nativas podem ter parâmetros opcionais)
+        maximo = len(funcao['parametros'])
+        minimo = funcao.get('minimo', maximo)
+        if not minimo <= len(args) <= maximo:
+            esperados = maximo if minimo == maximo else f"de {minimo} a {maximo}"
+            raise ErroSemantico(f"Função '{nome_funcao}' espera {esperados} argumentos, mas {len(args)} foram fornecidos")
+        p[0] = nos.ChamadaFuncao(nome_funcao, args, linha=p.lineno(1))
     except ErroSemantico as e:
         print(f"Erro Semântico (linha {p.lineno(1)}): {e}")
-        p[0] = ('erro', nome_funcao)
+        p[0] = nos.Erro(nome_funcao, linha=p.lineno(1))
 
 def p_args(p):
     '''args : expr_list
@@ -221,7 +324,7 @@ def p_expr_binop(p):
                   | expr MINUS expr
                   | expr MULT expr
                   | expr DIV expr'''
-    p[0] = ('binop', p[2], p[1], p[3])
+    p[0] = nos.BinOp(p[2], p[1], p[3], linha=p.lineno(2))
 
 def p_expr_comparacao(p):
     '''expr_comparacao : expr LT expr
@@ -230,11 +333,46 @@ def p_expr_comparacao(p):
                        | expr GE expr
                        | expr EQ expr
                        | expr NE expr'''
-    p[0] = ('comparacao', p[2], p[1], p[3])
+    p[0] = nos.Comparacao(p[2], p[1], p[3], linha=p.lineno(2))
 
 def p_expr_lista(p):
-    'expr_lista : LBRACKET expr_list RBRACKET'
-    p[0] = ('lista', p[2])
+    '''expr_lista : LBRACKET expr_list RBRACKET
+                  | LBRACKET RBRACKET'''
+    p[0] = nos.Lista(p[2] if len(p) == 4 else [], linha=p.lineno(1))
+
+# Map literal: {chave: valor, ...} ou {}
+def p_expr_mapa(p):
+    '''expr : LBRACE pares RBRACE
+            | LBRACE RBRACE'''
+    pares = p[2] if len(p) == 4 else []
+    p[0] = nos.Mapa([k for k, _ in pares], [v for _, v in pares], linha=p.lineno(1))
+
+def p_pares(p):
+    '''pares : expr COLON expr
+             | expr COLON expr COMMA pares'''
+    p[0] = [(p[1], p[3])] + (p[5] if len(p) == 6 else [])
+
+def p_expr_parenteses(p):
+    'expr : LPAREN expr RPAREN'
+    p[0] = p[2]
+
+# Acesso a elemento de lista (ou caractere de string): v[i], m[i][j]
+def p_expr_indice(p):
+    'expr : expr LBRACKET expr RBRACKET'
+    p[0] = nos.Indice(p[1], p[3], linha=p.lineno(2))
+
+# Fatia de lista ou string: v[i:j], v[:j], v[i:]
+def p_expr_fatia(p):
+    '''expr : expr LBRACKET expr COLON expr RBRACKET
+            | expr LBRACKET COLON expr RBRACKET
+            | expr LBRACKET expr COLON RBRACKET'''
+    if len(p) == 7:
+        inicio, fim = p[3], p[5]
+    elif p.slice[3].type == 'COLON':
+        inicio, fim = None, p[4]
+    else:
+        inicio, fim = p[3], None
+    p[0] = nos.Fatia(p[1], inicio, fim, linha=p.lineno(2))
 
 def p_expr_list(p):
     '''expr_list : expr
@@ -250,35 +388,32 @@ def p_expr_simples(p):
                     | FALSE
                     | ID DOT ID'''
     if len(p) == 4:  # Caso do ID DOT ID
-        p[0] = ('acesso_atributo', p[1], p[3])
-    elif isinstance(p[1], str) and p[1].lower() in ('true', 'false'):
-        p[0] = ('bool', p[1].lower() == 'true')
+        p[0] = nos.AcessoAtributo(p[1], p[3], linha=p.lineno(1))
+    elif p.slice[1].type in ('TRUE', 'FALSE'):
+        p[0] = nos.Bool(p.slice[1].type == 'TRUE', linha=p.lineno(1))
     elif isinstance(p[1], str):
         # Verifica se é uma string
         if p.slice[1].type == 'STRING':
-            p[0] = ('string', p[1])  # Literal string
-        # Verifica se é um booleano
-        elif p[1].lower() in ('true', 'false'):
-            p[0] = ('bool', p[1].lower() == 'true')
+            p[0] = nos.String(p[1], linha=p.lineno(1))  # Literal string
         # Caso contrário, é um ID (variável)
         else:
             try:
                 simbolo = tabela_simbolos.escopo_atual.obter_variavel(p[1])
-                p[0] = ('id', p[1], simbolo['tipo'])
+                p[0] = nos.ID(p[1], simbolo['tipo'], linha=p.lineno(1))
             except ErroSemantico as e:
                 print(f"Erro Semântico (linha {p.lineno(1)}): {e}")
-                p[0] = ('erro', p[1])
+                p[0] = nos.Erro(p[1], linha=p.lineno(1))
     else:
-        p[0] = p[1]
+        p[0] = nos.Numero(p[1], linha=p.lineno(1))
 
 # Estrutura condicional
 def p_if_stmt(p):
     '''if_stmt : IF LPAREN expr RPAREN LBRACE stmts RBRACE
                | IF LPAREN expr RPAREN LBRACE stmts RBRACE ELSE LBRACE stmts RBRACE'''
     if len(p) == 8:
-        p[0] = ('if', p[3], p[6], None)
+        p[0] = nos.If(p[3], p[6], None, linha=p.lineno(1))
     else:
-        p[0] = ('if', p[3], p[6], p[10])
+        p[0] = nos.If(p[3], p[6], p[10], linha=p.lineno(1))
 
 # Tratamento de erros
 def p_error(p):
@@ -289,4 +424,25 @@ def p_error(p):
 
 
 # Cria o parser
-parser = yacc.yacc()
\ No newline at end of file
+parser = yacc.yacc()
+
+def analisar(codigo):
+    """Analisa um programa do zero: tabela de símbolos nova e linhas contadas a partir de 1."""
+    global tabela_simbolos
+    tabela_simbolos = TabelaSimbolos()
+    lexico.lexer.lineno = 1
+    return parser.parse(codigo, lexer=lexico.lexer)
+
+# Parser de comandos soltos (REPL): começa em `stmts`; a regra inicial do programa fica sem uso
+parser_incremental = yacc.yacc(start='stmts', tabmodule='parsetab_incremental', debug=False,
+                               errorlog=yacc.NullLogger())
+
+def analisar_incremental(codigo, tabela):
+    """
+    Analisa uma lista de comandos contra uma tabela de símbolos já existente
+    (as declarações feitas aqui ficam nela); retorna a lista de comandos.
+    """
+    global tabela_simbolos
+    tabela_simbolos = tabela
+    lexico.lexer.lineno = 1
+    return parser_incremental.parse(codigo, lexer=lexico.lexer)
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftPLUSMINUSleftMULTDIVnonassocLTLEGTGEEQNEASSIGN BOOL COLON COMMA COMMENT C_CHANNEL DEF DIV DOT ELSE EQ FALSE FLOAT FLOAT_TYPE FOR GE GT ID IF IN INPUT INT LBRACE LBRACKET LE LIST LPAREN LT MINUS MULT NE NUM OUTPUT PAR PLUS RBRACE RBRACKET RECEIVE RETURN RPAREN SEMICOLON SEND SEQ STRING STRING_TYPE TRUE WHILEprograma_minipar : bloco_stmtbloco_stmt : bloco_SEQ\n| bloco_PARbloco_SEQ : SEQ LBRACE stmts RBRACEbloco_PAR : PAR LBRACE stmts RBRACEstmts : stmt\n| stmt stmtstipo_var : BOOL\n| INT\n| FLOAT_TYPE\n| STRING_TYPE\n| C_CHANNEL\n| LIST LT tipo_var GTdeclaracao : tipo_var ID ASSIGN exprdeclaracao : C_CHANNEL ASSIGN ID STRING NUM SEMICOLONatribuicao : ID ASSIGN exprstmt : declaracao SEMICOLON\n| atribuicao SEMICOLON\n| if_stmt\n| for_stmt\n| while_stmt\n| def_funcao\n| input SEMICOLON\n| output SEMICOLON\n| chamada_funcao SEMICOLON\n| receive_stmt\n| send_stmt\n| RETURN expr SEMICOLON\n| COMMENTfor_stmt : FOR LPAREN ID IN expr RPAREN LBRACE stmts RBRACEwhile_stmt : WHILE LPAREN expr RPAREN LBRACE stmts RBRACEinput : INPUT LPAREN args RPARENoutput : OUTPUT LPAREN args RPARENreceive_stmt : ID DOT RECEIVE COLON expr SEMICOLONsend_stmt : ID DOT SEND COLON expr SEMICOLONparams : ID COMMA params\n| ID\n| def_funcao : DEF ID LPAREN params RPAREN LBRACE stmts RBRACEexpr : INPUT LPAREN args RPARENexpr : OUTPUT LPAREN args RPARENchamada_funcao : ID LPAREN args RPARENargs : expr_list\n| expr : chamada_funcao\n| expr_binop\n| expr_comparacao\n| expr_lista\n| expr_simplesexpr_binop : expr PLUS expr\n| expr MINUS expr\n| expr MULT expr\n| expr DIV exprexpr_comparacao : expr LT expr\n| expr LE expr\n| expr GT expr\n| expr GE expr\n| expr EQ expr\n| expr NE exprexpr_lista : LBRACKET expr_list RBRACKETexpr_list : expr\n| expr COMMA expr_listexpr_simples : ID\n| NUM\n| FLOAT\n| STRING\n| TRUE\n| FALSE\n| ID DOT IDif_stmt : IF LPAREN expr RPAREN LBRACE stmts RBRACE\n| IF LPAREN expr RPAREN LBRACE stmts RBRACE ELSE LBRACE stmts RBRACE'
+_lr_signature = 'nonassocLTLEGTGEEQNEleftPLUSMINUSleftMULTDIVleftLBRACKETASSIGN BOOL BROADCAST COLON COMMA COMMENT C_CHANNEL DEF DIV DIV_ASSIGN DOT ELSE EQ FALSE FLOAT FLOAT_TYPE FOR GATHER GE GT ID IF IN INPUT INT LBRACE LBRACKET LE LIST LPAREN LT MAP MATRIX MINUS MINUS_ASSIGN MULT MULT_ASSIGN NE NUM OUTPUT PAR PLUS PLUS_ASSIGN RBRACE RBRACKET RECEIVE RETURN RPAREN SCATTER SEMICOLON SEND SEQ SET STRING STRING_TYPE TRUE WHILEprograma_minipar : bloco_stmtbloco_stmt : bloco_SEQ\n                  | bloco_PARbloco_SEQ : SEQ LBRACE stmts RBRACEbloco_PAR : PAR LBRACE stmts RBRACEstmts : stmt\n             | stmt stmtstipo_var : BOOL\n                | INT\n                | FLOAT_TYPE\n                | STRING_TYPE\n                | C_CHANNEL\n                | LIST LT tipo_var GT\n                | MATRIX LT tipo_var GT\n                | SET LT tipo_var GT\n                | MAP LT tipo_var COMMA tipo_var GTdeclaracao : tipo_var ID ASSIGN exprdeclaracao : C_CHANNEL ASSIGN ID STRING NUM\n                  | C_CHANNEL ASSIGN ID STRING NUM opcoes_canaldeclaracao : C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET\n                  | C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET opcoes_canalportas : NUM\n              | NUM COMMA portasopcoes_canal : opcao_canal\n                    | opcao_canal COMMA opcoes_canalopcao_canal : ID ASSIGN NUM\n                   | ID ASSIGN STRING\n                   | ID ASSIGN TRUE\n                   | ID ASSIGN FALSEatribuicao : ID ASSIGN expratribuicao : ID indices ASSIGN expratribuicao : ID op_composto expr\n                  | ID indices op_composto exprop_composto : PLUS_ASSIGN\n                   | MINUS_ASSIGN\n                   | MULT_ASSIGN\n                   | DIV_ASSIGNindices : LBRACKET expr RBRACKET\n               | indices LBRACKET expr RBRACKETstmt : declaracao SEMICOLON\n            | atribuicao SEMICOLON\n            | if_stmt\n            | for_stmt\n            | while_stmt\n            | def_funcao\n            | input SEMICOLON\n            | output SEMICOLON\n            | chamada_funcao SEMICOLON\n            | receive_stmt\n            | send_stmt\n            | scatter_stmt\n            | gather_stmt\n            | bloco_stmt\n            | COMMENTstmt : RETURN expr SEMICOLONfor_stmt : FOR LPAREN ID IN expr RPAREN inicio_for LBRACE stmts RBRACEinicio_for :while_stmt : WHILE LPAREN expr RPAREN LBRACE stmts RBRACEinput : INPUT LPAREN args RPARENoutput : OUTPUT LPAREN args RPARENreceive_stmt : ID DOT RECEIVE COLON expr SEMICOLONsend_stmt : ID DOT SEND COLON expr SEMICOLONscatter_stmt : ID DOT SCATTER COLON expr SEMICOLON\n                    | ID DOT BROADCAST COLON expr SEMICOLONgather_stmt : ID DOT GATHER COLON expr SEMICOLONparams : ID COMMA params\n              | ID\n              | def_funcao : DEF ID LPAREN params RPAREN inicio_funcao LBRACE stmts RBRACEinicio_funcao :expr : INPUT LPAREN args RPARENexpr : OUTPUT LPAREN args RPARENchamada_funcao : ID LPAREN args RPARENargs : expr_list\n            | expr : chamada_funcao\n            | expr_binop\n            | expr_comparacao\n            | expr_lista\n            | expr_simplesexpr_binop : expr PLUS expr\n                  | expr MINUS expr\n                  | expr MULT expr\n                  | expr DIV exprexpr_comparacao : expr LT expr\n                       | expr LE expr\n                       | expr GT expr\n                       | expr GE expr\n                       | expr EQ expr\n                       | expr NE exprexpr_lista : LBRACKET expr_list RBRACKET\n                  | LBRACKET RBRACKETexpr : LBRACE pares RBRACE\n            | LBRACE RBRACEpares : expr COLON expr\n             | expr COLON expr COMMA paresexpr : LPAREN expr RPARENexpr : expr LBRACKET expr RBRACKETexpr : expr LBRACKET expr COLON expr RBRACKET\n            | expr LBRACKET COLON expr RBRACKET\n            | expr LBRACKET expr COLON RBRACKETexpr_list : expr\n                 | expr COMMA expr_listexpr_simples : ID\n                    | NUM\n                    | FLOAT\n                    | STRING\n                    | TRUE\n                    | FALSE\n                    | ID DOT IDif_stmt : IF LPAREN expr RPAREN LBRACE stmts RBRACE\n               | IF LPAREN expr RPAREN LBRACE stmts RBRACE ELSE LBRACE stmts RBRACE'
     
-_lr_action_items = {'SEQ':([0,],[5,]),'PAR':([0,],[6,]),'$end':([1,2,3,4,39,73,],[0,-1,-2,-3,-4,-5,]),'LBRACE':([5,6,125,127,143,148,156,],[7,8,139,141,151,153,159,]),'RETURN':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,74,139,141,144,145,151,152,153,154,158,159,160,162,],[22,22,22,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,-28,22,22,-34,-35,22,-70,22,-31,-39,22,-30,-71,]),'COMMENT':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,74,139,141,144,145,151,152,153,154,158,159,160,162,],[23,23,23,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,-28,23,23,-34,-35,23,-70,23,-31,-39,23,-30,-71,]),'C_CHANNEL':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,72,74,139,141,144,145,151,152,153,154,158,159,160,162,],[26,26,26,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,104,-28,26,26,-34,-35,26,-70,26,-31,-39,26,-30,-71,]),'ID':([7,8,10,13,14,15,16,20,21,22,23,24,26,30,33,34,35,36,41,42,43,44,45,55,62,63,65,66,67,68,70,71,74,75,76,77,78,79,80,81,82,83,84,85,86,87,90,100,119,122,123,126,132,139,141,142,144,145,151,152,153,154,158,159,160,162,],[25,25,25,-19,-20,-21,-22,-26,-27,54,-29,61,-12,69,-8,-9,-10,-11,-17,-18,-23,-24,-25,54,54,54,96,54,98,54,54,54,-28,54,54,54,54,54,54,54,54,54,54,54,54,117,54,128,54,54,54,54,-13,25,25,128,-34,-35,25,-70,25,-31,-39,25,-30,-71,]),'IF':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,74,139,141,144,145,151,152,153,154,158,159,160,162,],[27,27,27,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,-28,27,27,-34,-35,27,-70,27,-31,-39,27,-30,-71,]),'FOR':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,74,139,141,144,145,151,152,153,154,158,159,160,162,],[28,28,28,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,-28,28,28,-34,-35,28,-70,28,-31,-39,28,-30,-71,]),'WHILE':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,74,139,141,144,145,151,152,153,154,158,159,160,162,],[29,29,29,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,-28,29,29,-34,-35,29,-70,29,-31,-39,29,-30,-71,]),'DEF':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,74,139,141,144,145,151,152,153,154,158,159,160,162,],[30,30,30,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,-28,30,30,-34,-35,30,-70,30,-31,-39,30,-30,-71,]),'INPUT':([7,8,10,13,14,15,16,20,21,22,23,41,42,43,44,45,55,62,63,66,68,70,71,74,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,139,141,144,145,151,152,153,154,158,159,160,162,],[31,31,31,-19,-20,-21,-22,-26,-27,47,-29,-17,-18,-23,-24,-25,47,47,47,47,47,47,47,-28,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,31,31,-34,-35,31,-70,31,-31,-39,31,-30,-71,]),'OUTPUT':([7,8,10,13,14,15,16,20,21,22,23,41,42,43,44,45,55,62,63,66,68,70,71,74,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,139,141,144,145,151,152,153,154,158,159,160,162,],[32,32,32,-19,-20,-21,-22,-26,-27,48,-29,-17,-18,-23,-24,-25,48,48,48,48,48,48,48,-28,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,32,32,-34,-35,32,-70,32,-31,-39,32,-30,-71,]),'BOOL':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,72,74,139,141,144,145,151,152,153,154,158,159,160,162,],[33,33,33,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,33,-28,33,33,-34,-35,33,-70,33,-31,-39,33,-30,-71,]),'INT':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,72,74,139,141,144,145,151,152,153,154,158,159,160,162,],[34,34,34,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,34,-28,34,34,-34,-35,34,-70,34,-31,-39,34,-30,-71,]),'FLOAT_TYPE':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,72,74,139,141,144,145,151,152,153,154,158,159,160,162,],[35,35,35,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,35,-28,35,35,-34,-35,35,-70,35,-31,-39,35,-30,-71,]),'STRING_TYPE':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,72,74,139,141,144,145,151,152,153,154,158,159,160,162,],[36,36,36,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,36,-28,36,36,-34,-35,36,-70,36,-31,-39,36,-30,-71,]),'LIST':([7,8,10,13,14,15,16,20,21,23,41,42,43,44,45,72,74,139,141,144,145,151,152,153,154,158,159,160,162,],[37,37,37,-19,-20,-21,-22,-26,-27,-29,-17,-18,-23,-24,-25,37,-28,37,37,-34,-35,37,-70,37,-31,-39,37,-30,-71,]),'RBRACE':([9,10,13,14,15,16,20,21,23,38,40,41,42,43,44,45,74,144,145,147,149,152,154,155,157,158,160,161,162,],[39,-6,-19,-20,-21,-22,-26,-27,-29,73,-7,-17,-18,-23,-24,-25,-28,-34,-35,152,154,-70,-31,158,160,-39,-30,162,-71,]),'SEMICOLON':([11,12,17,18,19,46,49,50,51,52,53,54,56,57,58,59,60,91,105,106,107,108,109,110,111,112,113,114,117,118,120,121,130,131,133,134,136,137,138,146,],[41,42,43,44,45,74,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,-16,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-69,-60,-14,-42,-32,-33,-40,-41,144,145,146,-15,]),'LBRACKET':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'NUM':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,124,126,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,138,56,]),'FLOAT':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'STRING':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,96,119,122,123,126,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,124,58,58,58,58,]),'TRUE':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'FALSE':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'ASSIGN':([25,26,61,],[62,65,90,]),'LPAREN':([25,27,28,29,31,32,47,48,54,69,],[63,66,67,68,70,71,85,86,63,100,]),'DOT':([25,54,],[64,87,]),'GT':([33,34,35,36,46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,103,104,105,106,107,108,109,110,111,112,113,114,117,118,120,121,132,133,134,136,137,140,],[-8,-9,-10,-11,81,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,81,81,81,81,132,-12,81,81,81,81,None,None,None,None,None,None,-69,-60,81,-42,-13,-40,-41,81,81,81,]),'LT':([37,46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,105,106,107,108,109,110,111,112,113,114,117,118,120,121,133,134,136,137,140,],[72,79,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,79,79,79,79,79,79,79,79,None,None,None,None,None,None,-69,-60,79,-42,-40,-41,79,79,79,]),'PLUS':([46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,105,106,107,108,109,110,111,112,113,114,117,118,120,121,133,134,136,137,140,],[75,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,75,75,75,75,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-69,-60,75,-42,-40,-41,75,75,75,]),'MINUS':([46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,105,106,107,108,109,110,111,112,113,114,117,118,120,121,133,134,136,137,140,],[76,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,76,76,76,76,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-69,-60,76,-42,-40,-41,76,76,76,]),'MULT':([46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,105,106,107,108,109,110,111,112,113,114,117,118,120,121,133,134,136,137,140,],[77,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,77,77,77,77,77,77,-52,-53,-54,-55,-56,-57,-58,-59,-69,-60,77,-42,-40,-41,77,77,77,]),'DIV':([46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,105,106,107,108,109,110,111,112,113,114,117,118,120,121,133,134,136,137,140,],[78,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,78,78,78,78,78,78,-52,-53,-54,-55,-56,-57,-58,-59,-69,-60,78,-42,-40,-41,78,78,78,]),'LE':([46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,105,106,107,108,109,110,111,112,113,114,117,118,120,121,133,134,136,137,140,],[80,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,80,80,80,80,80,80,80,80,None,None,None,None,None,None,-69,-60,80,-42,-40,-41,80,80,80,]),'GE':([46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,105,106,107,108,109,110,111,112,113,114,117,118,120,121,133,134,136,137,140,],[82,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,82,82,82,82,82,82,82,82,None,None,None,None,None,None,-69,-60,82,-42,-40,-41,82,82,82,]),'EQ':([46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,105,106,107,108,109,110,111,112,113,114,117,118,120,121,133,134,136,137,140,],[83,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,83,83,83,83,83,83,83,83,None,None,None,None,None,None,-69,-60,83,-42,-40,-41,83,83,83,]),'NE':([46,49,50,51,52,53,54,56,57,58,59,60,89,91,97,99,105,106,107,108,109,110,111,112,113,114,117,118,120,121,133,134,136,137,140,],[84,-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,84,84,84,84,84,84,84,84,None,None,None,None,None,None,-69,-60,84,-42,-40,-41,84,84,84,]),'COMMA':([49,50,51,52,53,54,56,57,58,59,60,89,105,106,107,108,109,110,111,112,113,114,117,118,121,128,133,134,],[-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,119,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-69,-60,-42,142,-40,-41,]),'RBRACKET':([49,50,51,52,53,54,56,57,58,59,60,88,89,105,106,107,108,109,110,111,112,113,114,117,118,121,133,134,135,],[-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,118,-61,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-69,-60,-42,-40,-41,-62,]),'RPAREN':([49,50,51,52,53,54,56,57,58,59,60,63,70,71,85,86,89,92,93,97,99,100,101,102,105,106,107,108,109,110,111,112,113,114,115,116,117,118,121,128,129,133,134,135,140,142,150,],[-45,-46,-47,-48,-49,-63,-64,-65,-66,-67,-68,-44,-44,-44,-44,-44,-61,121,-43,125,127,-38,130,131,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,133,134,-69,-60,-42,-37,143,-40,-41,-62,148,-38,-36,]),'RECEIVE':([64,],[94,]),'SEND':([64,],[95,]),'COLON':([94,95,],[122,123,]),'IN':([98,],[126,]),'ELSE':([152,],[156,]),}
+_lr_action_items = {'SEQ':([0,3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,91,92,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[5,-2,-3,5,5,5,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,-5,-55,5,5,-61,-62,-63,-64,-65,-111,-58,5,5,5,-69,-56,-112,]),'PAR':([0,3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,91,92,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[6,-2,-3,6,6,6,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,-5,-55,6,6,-61,-62,-63,-64,-65,-111,-58,6,6,6,-69,-56,-112,]),'$end':([1,2,3,4,45,91,],[0,-1,-2,-3,-4,-5,]),'COMMENT':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,91,92,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,25,25,25,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,-5,-55,25,25,-61,-62,-63,-64,-65,-111,-58,25,25,25,-69,-56,-112,]),'RETURN':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,91,92,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,26,26,26,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,-5,-55,26,26,-61,-62,-63,-64,-65,-111,-58,26,26,26,-69,-56,-112,]),'C_CHANNEL':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,87,88,89,90,91,92,182,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,29,29,29,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,136,136,136,136,-5,-55,136,29,29,-61,-62,-63,-64,-65,-111,-58,29,29,29,-69,-56,-112,]),'ID':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,26,27,29,33,36,37,38,39,45,47,48,49,50,51,54,61,62,70,72,73,75,76,77,78,79,80,81,82,83,85,86,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,113,114,116,117,118,132,141,156,158,165,166,167,168,169,173,179,180,181,184,196,198,200,201,207,208,209,210,211,212,223,227,228,230,232,233,242,244,246,248,249,],[-2,-3,28,28,28,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,63,69,-12,84,-8,-9,-10,-11,-4,-40,-41,-46,-47,-48,63,63,63,63,63,63,63,-34,-35,-36,-37,128,63,130,63,63,63,-5,-55,63,63,63,63,63,63,63,63,63,63,63,63,63,159,63,63,63,63,175,63,63,63,63,63,63,63,63,63,-13,-14,-15,63,213,28,28,175,63,-61,-62,-63,-64,-65,-16,213,213,-111,-58,28,28,28,-69,-56,-112,]),'IF':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,91,92,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,30,30,30,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,-5,-55,30,30,-61,-62,-63,-64,-65,-111,-58,30,30,30,-69,-56,-112,]),'FOR':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,91,92,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,31,31,31,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,-5,-55,31,31,-61,-62,-63,-64,-65,-111,-58,31,31,31,-69,-56,-112,]),'WHILE':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,91,92,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,32,32,32,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,-5,-55,32,32,-61,-62,-63,-64,-65,-111,-58,32,32,32,-69,-56,-112,]),'DEF':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,91,92,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,33,33,33,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,-5,-55,33,33,-61,-62,-63,-64,-65,-111,-58,33,33,33,-69,-56,-112,]),'INPUT':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,26,45,47,48,49,50,51,54,61,62,70,72,73,75,76,77,78,79,81,83,85,86,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,198,200,207,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,34,34,34,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,53,-4,-40,-41,-46,-47,-48,53,53,53,53,53,53,53,-34,-35,-36,-37,53,53,53,53,-5,-55,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,34,34,53,-61,-62,-63,-64,-65,-111,-58,34,34,34,-69,-56,-112,]),'OUTPUT':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,26,45,47,48,49,50,51,54,61,62,70,72,73,75,76,77,78,79,81,83,85,86,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,198,200,207,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,35,35,35,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,55,-4,-40,-41,-46,-47,-48,55,55,55,55,55,55,55,-34,-35,-36,-37,55,55,55,55,-5,-55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,35,35,55,-61,-62,-63,-64,-65,-111,-58,35,35,35,-69,-56,-112,]),'BOOL':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,87,88,89,90,91,92,182,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,36,36,36,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,36,36,36,36,-5,-55,36,36,36,-61,-62,-63,-64,-65,-111,-58,36,36,36,-69,-56,-112,]),'INT':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,87,88,89,90,91,92,182,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,37,37,37,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,37,37,37,37,-5,-55,37,37,37,-61,-62,-63,-64,-65,-111,-58,37,37,37,-69,-56,-112,]),'FLOAT_TYPE':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,87,88,89,90,91,92,182,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,38,38,38,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,38,38,38,38,-5,-55,38,38,38,-61,-62,-63,-64,-65,-111,-58,38,38,38,-69,-56,-112,]),'STRING_TYPE':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,87,88,89,90,91,92,182,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,39,39,39,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,39,39,39,39,-5,-55,39,39,39,-61,-62,-63,-64,-65,-111,-58,39,39,39,-69,-56,-112,]),'LIST':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,87,88,89,90,91,92,182,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,40,40,40,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,40,40,40,40,-5,-55,40,40,40,-61,-62,-63,-64,-65,-111,-58,40,40,40,-69,-56,-112,]),'MATRIX':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,87,88,89,90,91,92,182,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,41,41,41,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,41,41,41,41,-5,-55,41,41,41,-61,-62,-63,-64,-65,-111,-58,41,41,41,-69,-56,-112,]),'SET':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,87,88,89,90,91,92,182,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,42,42,42,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,42,42,42,42,-5,-55,42,42,42,-61,-62,-63,-64,-65,-111,-58,42,42,42,-69,-56,-112,]),'MAP':([3,4,7,8,10,13,14,15,16,20,21,22,23,24,25,45,47,48,49,50,51,87,88,89,90,91,92,182,198,200,208,209,210,211,212,230,232,233,242,244,246,248,249,],[-2,-3,43,43,43,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-4,-40,-41,-46,-47,-48,43,43,43,43,-5,-55,43,43,43,-61,-62,-63,-64,-65,-111,-58,43,43,43,-69,-56,-112,]),'RBRACE':([3,4,9,10,13,14,15,16,20,21,22,23,24,25,44,45,46,47,48,49,50,51,56,57,58,59,60,61,63,64,65,66,67,68,91,92,107,108,111,142,143,144,145,146,147,148,149,150,151,153,155,157,159,164,183,186,187,188,205,206,208,209,210,211,212,218,220,224,225,230,232,243,245,246,247,248,249,],[-2,-3,45,-6,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,91,-4,-7,-40,-41,-46,-47,-48,-76,-77,-78,-79,-80,108,-104,-105,-106,-107,-108,-109,-5,-55,155,-94,-92,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,-73,-98,-71,-72,-95,-101,-100,-61,-62,-63,-64,-65,230,232,-99,-96,-111,-58,246,248,-69,249,-56,-112,]),'LBRACE':([5,6,26,54,61,62,70,72,73,75,76,77,78,79,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,172,173,174,184,202,207,219,222,231,241,],[7,8,61,61,61,61,61,61,61,61,-34,-35,-36,-37,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,198,61,200,61,-70,61,-57,233,242,244,]),'SEMICOLON':([11,12,17,18,19,52,56,57,58,59,60,63,64,65,66,67,68,108,111,115,119,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,164,177,178,183,186,187,191,192,193,194,195,196,205,206,214,215,224,228,234,235,236,237,238,239,],[47,48,49,50,51,92,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,-94,-92,-30,-32,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,-17,-31,-33,-73,-59,-60,-98,-71,-72,208,209,210,211,212,-18,-101,-100,-19,-24,-99,-20,-26,-27,-28,-29,-25,-21,]),'LPAREN':([26,28,30,31,32,34,35,53,54,55,61,62,63,70,72,73,75,76,77,78,79,81,83,84,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,207,],[54,73,81,82,83,85,86,104,54,106,54,54,73,54,54,54,54,-34,-35,-36,-37,54,54,132,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'LBRACKET':([26,28,52,54,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,72,73,75,76,77,78,79,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,111,112,114,115,116,117,118,119,127,129,131,140,141,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,173,183,184,185,186,187,188,190,191,192,193,194,195,199,204,205,206,207,224,],[62,75,93,62,-76,-77,-78,-79,-80,62,62,-104,-105,-106,-107,-108,-109,62,118,62,62,62,-34,-35,-36,-37,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,93,62,-94,93,-92,93,62,93,62,62,62,93,93,93,93,93,62,93,93,93,93,93,93,93,93,93,93,-97,-93,62,-91,62,-110,93,93,93,93,-73,62,62,62,62,62,-38,197,62,-98,62,93,-71,-72,93,-39,93,93,93,93,93,93,93,-101,-100,62,-99,]),'NUM':([26,54,61,62,70,72,73,75,76,77,78,79,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,171,173,184,197,207,226,229,],[64,64,64,64,64,64,64,64,-34,-35,-36,-37,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,196,64,64,217,64,234,217,]),'FLOAT':([26,54,61,62,70,72,73,75,76,77,78,79,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,207,],[65,65,65,65,65,65,65,65,-34,-35,-36,-37,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'STRING':([26,54,61,62,70,72,73,75,76,77,78,79,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,128,141,156,158,165,166,167,168,169,173,184,207,226,],[66,66,66,66,66,66,66,66,-34,-35,-36,-37,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,171,66,66,66,66,66,66,66,66,66,66,66,235,]),'TRUE':([26,54,61,62,70,72,73,75,76,77,78,79,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,207,226,],[67,67,67,67,67,67,67,67,-34,-35,-36,-37,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,236,]),'FALSE':([26,54,61,62,70,72,73,75,76,77,78,79,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,207,226,],[68,68,68,68,68,68,68,68,-34,-35,-36,-37,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,237,]),'ASSIGN':([28,29,69,71,170,190,213,],[70,80,114,116,-38,-39,226,]),'DOT':([28,63,],[74,113,]),'PLUS_ASSIGN':([28,71,170,190,],[76,76,-38,-39,]),'MINUS_ASSIGN':([28,71,170,190,],[77,77,-38,-39,]),'MULT_ASSIGN':([28,71,170,190,],[78,78,-38,-39,]),'DIV_ASSIGN':([28,71,170,190,],[79,79,-38,-39,]),'GT':([36,37,38,39,52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,135,136,137,138,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,179,180,181,183,185,186,187,188,191,192,193,194,195,199,203,204,205,206,223,224,],[-8,-9,-10,-11,100,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,100,-94,100,-92,100,100,100,100,100,100,179,-12,180,181,100,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,100,100,100,100,-73,-13,-14,-15,-98,100,-71,-72,100,100,100,100,100,100,100,223,100,-101,-100,-16,-99,]),'COMMA':([36,37,38,39,56,57,58,59,60,63,64,65,66,67,68,108,111,112,136,139,142,143,144,145,146,147,148,149,150,151,153,155,157,159,164,175,179,180,181,183,186,187,188,205,206,215,217,223,224,234,235,236,237,],[-8,-9,-10,-11,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,-94,-92,158,-12,182,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,-73,201,-13,-14,-15,-98,-71,-72,207,-101,-100,227,229,-16,-99,-26,-27,-28,-29,]),'LT':([40,41,42,43,52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,183,185,186,187,188,191,192,193,194,195,199,204,205,206,224,],[87,88,89,90,98,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,98,-94,98,-92,98,98,98,98,98,98,98,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,98,98,98,98,-73,-98,98,-71,-72,98,98,98,98,98,98,98,98,-101,-100,-99,]),'PLUS':([52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,183,185,186,187,188,191,192,193,194,195,199,204,205,206,224,],[94,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,94,-94,94,-92,94,94,94,94,94,94,94,-81,-82,-83,-84,94,94,94,94,94,94,-97,-93,-91,-110,94,94,94,94,-73,-98,94,-71,-72,94,94,94,94,94,94,94,94,-101,-100,-99,]),'MINUS':([52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,183,185,186,187,188,191,192,193,194,195,199,204,205,206,224,],[95,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,95,-94,95,-92,95,95,95,95,95,95,95,-81,-82,-83,-84,95,95,95,95,95,95,-97,-93,-91,-110,95,95,95,95,-73,-98,95,-71,-72,95,95,95,95,95,95,95,95,-101,-100,-99,]),'MULT':([52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,183,185,186,187,188,191,192,193,194,195,199,204,205,206,224,],[96,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,96,-94,96,-92,96,96,96,96,96,96,96,96,96,-83,-84,96,96,96,96,96,96,-97,-93,-91,-110,96,96,96,96,-73,-98,96,-71,-72,96,96,96,96,96,96,96,96,-101,-100,-99,]),'DIV':([52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,183,185,186,187,188,191,192,193,194,195,199,204,205,206,224,],[97,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,97,-94,97,-92,97,97,97,97,97,97,97,97,97,-83,-84,97,97,97,97,97,97,-97,-93,-91,-110,97,97,97,97,-73,-98,97,-71,-72,97,97,97,97,97,97,97,97,-101,-100,-99,]),'LE':([52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,183,185,186,187,188,191,192,193,194,195,199,204,205,206,224,],[99,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,99,-94,99,-92,99,99,99,99,99,99,99,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,99,99,99,99,-73,-98,99,-71,-72,99,99,99,99,99,99,99,99,-101,-100,-99,]),'GE':([52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,183,185,186,187,188,191,192,193,194,195,199,204,205,206,224,],[101,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,101,-94,101,-92,101,101,101,101,101,101,101,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,101,101,101,101,-73,-98,101,-71,-72,101,101,101,101,101,101,101,101,-101,-100,-99,]),'EQ':([52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,183,185,186,187,188,191,192,193,194,195,199,204,205,206,224,],[102,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,102,-94,102,-92,102,102,102,102,102,102,102,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,102,102,102,102,-73,-98,102,-71,-72,102,102,102,102,102,102,102,102,-101,-100,-99,]),'NE':([52,56,57,58,59,60,63,64,65,66,67,68,105,108,109,111,112,115,119,127,129,131,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,160,161,162,163,164,183,185,186,187,188,191,192,193,194,195,199,204,205,206,224,],[103,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,103,-94,103,-92,103,103,103,103,103,103,103,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,103,103,103,103,-73,-98,103,-71,-72,103,103,103,103,103,103,103,103,-101,-100,-99,]),'RPAREN':([56,57,58,59,60,63,64,65,66,67,68,73,85,86,104,105,106,108,111,112,120,121,129,131,132,133,134,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,159,164,175,176,183,186,187,189,199,201,205,206,221,224,],[-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,-75,-75,-75,-75,153,-75,-94,-92,-102,164,-74,172,174,-68,177,178,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,186,-97,187,-93,-91,-110,-73,-67,202,-98,-71,-72,-103,219,-68,-101,-100,-66,-99,]),'COLON':([56,57,58,59,60,63,64,65,66,67,68,93,108,109,111,122,123,124,125,126,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,164,183,186,187,205,206,224,],[-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,141,-94,156,-92,165,166,167,168,169,184,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,-73,-98,-71,-72,-101,-100,-99,]),'RBRACKET':([56,57,58,59,60,62,63,64,65,66,67,68,108,110,111,112,127,140,142,143,144,145,146,147,148,149,150,151,153,155,157,159,163,164,183,184,185,186,187,189,204,205,206,216,217,224,240,],[-76,-77,-78,-79,-80,111,-104,-105,-106,-107,-108,-109,-94,157,-92,-102,170,183,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,190,-73,-98,205,206,-71,-72,-103,224,-101,-100,228,-22,-99,-23,]),'RECEIVE':([74,],[122,]),'SEND':([74,],[123,]),'SCATTER':([74,],[124,]),'BROADCAST':([74,],[125,]),'GATHER':([74,],[126,]),'IN':([130,],[173,]),'ELSE':([230,],[241,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'programa_minipar':([0,],[1,]),'bloco_stmt':([0,],[2,]),'bloco_SEQ':([0,],[3,]),'bloco_PAR':([0,],[4,]),'stmts':([7,8,10,139,141,151,153,159,],[9,38,40,147,149,155,157,161,]),'stmt':([7,8,10,139,141,151,153,159,],[10,10,10,10,10,10,10,10,]),'declaracao':([7,8,10,139,141,151,153,159,],[11,11,11,11,11,11,11,11,]),'atribuicao':([7,8,10,139,141,151,153,159,],[12,12,12,12,12,12,12,12,]),'if_stmt':([7,8,10,139,141,151,153,159,],[13,13,13,13,13,13,13,13,]),'for_stmt':([7,8,10,139,141,151,153,159,],[14,14,14,14,14,14,14,14,]),'while_stmt':([7,8,10,139,141,151,153,159,],[15,15,15,15,15,15,15,15,]),'def_funcao':([7,8,10,139,141,151,153,159,],[16,16,16,16,16,16,16,16,]),'input':([7,8,10,139,141,151,153,159,],[17,17,17,17,17,17,17,17,]),'output':([7,8,10,139,141,151,153,159,],[18,18,18,18,18,18,18,18,]),'chamada_funcao':([7,8,10,22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,139,141,151,153,159,],[19,19,19,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,19,19,19,19,19,]),'receive_stmt':([7,8,10,139,141,151,153,159,],[20,20,20,20,20,20,20,20,]),'send_stmt':([7,8,10,139,141,151,153,159,],[21,21,21,21,21,21,21,21,]),'tipo_var':([7,8,10,72,139,141,151,153,159,],[24,24,24,103,24,24,24,24,24,]),'expr':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,],[46,89,91,89,97,99,89,89,105,106,107,108,109,110,111,112,113,114,89,89,120,89,136,137,140,]),'expr_binop':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'expr_comparacao':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'expr_lista':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'expr_simples':([22,55,62,63,66,68,70,71,75,76,77,78,79,80,81,82,83,84,85,86,90,119,122,123,126,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'expr_list':([55,63,70,71,85,86,119,],[88,93,93,93,93,93,135,]),'args':([63,70,71,85,86,],[92,101,102,115,116,]),'params':([100,142,],[129,150,]),}
+_lr_goto_items = {'programa_minipar':([0,],[1,]),'bloco_stmt':([0,7,8,10,198,200,233,242,244,],[2,24,24,24,24,24,24,24,24,]),'bloco_SEQ':([0,7,8,10,198,200,233,242,244,],[3,3,3,3,3,3,3,3,3,]),'bloco_PAR':([0,7,8,10,198,200,233,242,244,],[4,4,4,4,4,4,4,4,4,]),'stmts':([7,8,10,198,200,233,242,244,],[9,44,46,218,220,243,245,247,]),'stmt':([7,8,10,198,200,233,242,244,],[10,10,10,10,10,10,10,10,]),'declaracao':([7,8,10,198,200,233,242,244,],[11,11,11,11,11,11,11,11,]),'atribuicao':([7,8,10,198,200,233,242,244,],[12,12,12,12,12,12,12,12,]),'if_stmt':([7,8,10,198,200,233,242,244,],[13,13,13,13,13,13,13,13,]),'for_stmt':([7,8,10,198,200,233,242,244,],[14,14,14,14,14,14,14,14,]),'while_stmt':([7,8,10,198,200,233,242,244,],[15,15,15,15,15,15,15,15,]),'def_funcao':([7,8,10,198,200,233,242,244,],[16,16,16,16,16,16,16,16,]),'input':([7,8,10,198,200,233,242,244,],[17,17,17,17,17,17,17,17,]),'output':([7,8,10,198,200,233,242,244,],[18,18,18,18,18,18,18,18,]),'chamada_funcao':([7,8,10,26,54,61,62,70,72,73,75,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,198,200,207,233,242,244,],[19,19,19,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,19,19,56,19,19,19,]),'receive_stmt':([7,8,10,198,200,233,242,244,],[20,20,20,20,20,20,20,20,]),'send_stmt':([7,8,10,198,200,233,242,244,],[21,21,21,21,21,21,21,21,]),'scatter_stmt':([7,8,10,198,200,233,242,244,],[22,22,22,22,22,22,22,22,]),'gather_stmt':([7,8,10,198,200,233,242,244,],[23,23,23,23,23,23,23,23,]),'tipo_var':([7,8,10,87,88,89,90,182,198,200,233,242,244,],[27,27,27,135,137,138,139,203,27,27,27,27,27,]),'expr':([26,54,61,62,70,72,73,75,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,207,],[52,105,109,112,115,119,112,127,129,131,112,112,140,142,143,144,145,146,147,148,149,150,151,112,112,160,161,162,163,185,188,112,191,192,193,194,195,199,204,109,]),'expr_binop':([26,54,61,62,70,72,73,75,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,207,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'expr_comparacao':([26,54,61,62,70,72,73,75,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,207,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'expr_lista':([26,54,61,62,70,72,73,75,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,207,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'expr_simples':([26,54,61,62,70,72,73,75,81,83,85,86,93,94,95,96,97,98,99,100,101,102,103,104,106,114,116,117,118,141,156,158,165,166,167,168,169,173,184,207,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'indices':([28,],[71,]),'op_composto':([28,71,],[72,117,]),'pares':([61,207,],[107,225,]),'expr_list':([62,73,85,86,104,106,158,],[110,121,121,121,121,121,189,]),'args':([73,85,86,104,106,],[120,133,134,152,154,]),'params':([132,201,],[176,221,]),'opcoes_canal':([196,227,228,],[214,238,239,]),'opcao_canal':([196,227,228,],[215,215,215,]),'portas':([197,229,],[216,240,]),'inicio_funcao':([202,],[222,]),'inicio_for':([219,],[231,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,75 +27,116 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> programa_minipar","S'",1,None,None,None),
-  ('programa_minipar -> bloco_stmt','programa_minipar',1,'p_programa_minipar','parser.py',24),
-  ('bloco_stmt -> bloco_SEQ','bloco_stmt',1,'p_bloco_stmt','parser.py',29),
-  ('bloco_stmt -> bloco_PAR','bloco_stmt',1,'p_bloco_stmt','parser.py',30),
-  ('bloco_SEQ -> SEQ LBRACE stmts RBRACE','bloco_SEQ',4,'p_bloco_SEQ','parser.py',34),
-  ('bloco_PAR -> PAR LBRACE stmts RBRACE','bloco_PAR',4,'p_bloco_PAR','parser.py',40),
-  ('stmts -> stmt','stmts',1,'p_stmts','parser.py',45),
-  ('stmts -> stmt stmts','stmts',2,'p_stmts','parser.py',46),
-  ('tipo_var -> BOOL','tipo_var',1,'p_tipo_var','parser.py',51),
-  ('tipo_var -> INT','tipo_var',1,'p_tipo_var','parser.py',52),
-  ('tipo_var -> FLOAT_TYPE','tipo_var',1,'p_tipo_var','parser.py',53),
-  ('tipo_var -> STRING_TYPE','tipo_var',1,'p_tipo_var','parser.py',54),
-  ('tipo_var -> C_CHANNEL','tipo_var',1,'p_tipo_var','parser.py',55),
-  ('tipo_var -> LIST LT tipo_var GT','tipo_var',4,'p_tipo_var','parser.py',56),
-  ('declaracao -> tipo_var ID ASSIGN expr','declaracao',4,'p_declaracao','parser.py',62),
-  ('declaracao -> C_CHANNEL ASSIGN ID STRING NUM SEMICOLON','declaracao',6,'p_declaracao_canal','parser.py',85),
-  ('atribuicao -> ID ASSIGN expr','atribuicao',3,'p_atribuicao','parser.py',97),
-  ('stmt -> declaracao SEMICOLON','stmt',2,'p_stmt','parser.py',102),
-  ('stmt -> atribuicao SEMICOLON','stmt',2,'p_stmt','parser.py',103),
-  ('stmt -> if_stmt','stmt',1,'p_stmt','parser.py',104),
-  ('stmt -> for_stmt','stmt',1,'p_stmt','parser.py',105),
-  ('stmt -> while_stmt','stmt',1,'p_stmt','parser.py',106),
-  ('stmt -> def_funcao','stmt',1,'p_stmt','parser.py',107),
-  ('stmt -> input SEMICOLON','stmt',2,'p_stmt','parser.py',108),
-  ('stmt -> output SEMICOLON','stmt',2,'p_stmt','parser.py',109),
-  ('stmt -> chamada_funcao SEMICOLON','stmt',2,'p_stmt','parser.py',110),
-  ('stmt -> receive_stmt','stmt',1,'p_stmt','parser.py',111),
-  ('stmt -> send_stmt','stmt',1,'p_stmt','parser.py',112),
-  ('stmt -> RETURN expr SEMICOLON','stmt',3,'p_stmt','parser.py',113),
-  ('stmt -> COMMENT','stmt',1,'p_stmt','parser.py',114),
-  ('for_stmt -> FOR LPAREN ID IN expr RPAREN LBRACE stmts RBRACE','for_stmt',9,'p_for_stmt','parser.py',119),
-  ('while_stmt -> WHILE LPAREN expr RPAREN LBRACE stmts RBRACE','while_stmt',7,'p_while_stmt','parser.py',124),
-  ('input -> INPUT LPAREN args RPAREN','input',4,'p_input','parser.py',128),
-  ('output -> OUTPUT LPAREN args RPAREN','output',4,'p_output','parser.py',132),
-  ('receive_stmt -> ID DOT RECEIVE COLON expr SEMICOLON','receive_stmt',6,'p_receive_stmt','parser.py',137),
-  ('send_stmt -> ID DOT SEND COLON expr SEMICOLON','send_stmt',6,'p_send_stmt','parser.py',142),
-  ('params -> ID COMMA params','params',3,'p_params','parser.py',148),
-  ('params -> ID','params',1,'p_params','parser.py',149),
-  ('params -> <empty>','params',0,'p_params','parser.py',150),
-  ('def_funcao -> DEF ID LPAREN params RPAREN LBRACE stmts RBRACE','def_funcao',8,'p_def_funcao','parser.py',160),
-  ('expr -> INPUT LPAREN args RPAREN','expr',4,'p_expr_input','parser.py',181),
-  ('expr -> OUTPUT LPAREN args RPAREN','expr',4,'p_expr_output','parser.py',185),
-  ('chamada_funcao -> ID LPAREN args RPAREN','chamada_funcao',4,'p_chamada_funcao','parser.py',190),
-  ('args -> expr_list','args',1,'p_args','parser.py',205),
-  ('args -> <empty>','args',0,'p_args','parser.py',206),
-  ('expr -> chamada_funcao','expr',1,'p_expr','parser.py',211),
-  ('expr -> expr_binop','expr',1,'p_expr','parser.py',212),
-  ('expr -> expr_comparacao','expr',1,'p_expr','parser.py',213),
-  ('expr -> expr_lista','expr',1,'p_expr','parser.py',214),
-  ('expr -> expr_simples','expr',1,'p_expr','parser.py',215),
-  ('expr_binop -> expr PLUS expr','expr_binop',3,'p_expr_binop','parser.py',219),
-  ('expr_binop -> expr MINUS expr','expr_binop',3,'p_expr_binop','parser.py',220),
-  ('expr_binop -> expr MULT expr','expr_binop',3,'p_expr_binop','parser.py',221),
-  ('expr_binop -> expr DIV expr','expr_binop',3,'p_expr_binop','parser.py',222),
-  ('expr_comparacao -> expr LT expr','expr_comparacao',3,'p_expr_comparacao','parser.py',226),
-  ('expr_comparacao -> expr LE expr','expr_comparacao',3,'p_expr_comparacao','parser.py',227),
-  ('expr_comparacao -> expr GT expr','expr_comparacao',3,'p_expr_comparacao','parser.py',228),
-  ('expr_comparacao -> expr GE expr','expr_comparacao',3,'p_expr_comparacao','parser.py',229),
-  ('expr_comparacao -> expr EQ expr','expr_comparacao',3,'p_expr_comparacao','parser.py',230),
-  ('expr_comparacao -> expr NE expr','expr_comparacao',3,'p_expr_comparacao','parser.py',231),
-  ('expr_lista -> LBRACKET expr_list RBRACKET','expr_lista',3,'p_expr_lista','parser.py',235),
-  ('expr_list -> expr','expr_list',1,'p_expr_list','parser.py',239),
-  ('expr_list -> expr COMMA expr_list','expr_list',3,'p_expr_list','parser.py',240),
-  ('expr_simples -> ID','expr_simples',1,'p_expr_simples','parser.py',244),
-  ('expr_simples -> NUM','expr_simples',1,'p_expr_simples','parser.py',245),
-  ('expr_simples -> FLOAT','expr_simples',1,'p_expr_simples','parser.py',246),
-  ('expr_simples -> STRING','expr_simples',1,'p_expr_simples','parser.py',247),
-  ('expr_simples -> TRUE','expr_simples',1,'p_expr_simples','parser.py',248),
-  ('expr_simples -> FALSE','expr_simples',1,'p_expr_simples','parser.py',249),
-  ('expr_simples -> ID DOT ID','expr_simples',3,'p_expr_simples','parser.py',250),
-  ('if_stmt -> IF LPAREN expr RPAREN LBRACE stmts RBRACE','if_stmt',7,'p_if_stmt','parser.py',275),
-  ('if_stmt -> IF LPAREN expr RPAREN LBRACE stmts RBRACE ELSE LBRACE stmts RBRACE','if_stmt',11,'p_if_stmt','parser.py',276),
+  ('programa_minipar -> bloco_stmt','programa_minipar',1,'p_programa_minipar','parser.py',29),
+  ('bloco_stmt -> bloco_SEQ','bloco_stmt',1,'p_bloco_stmt','parser.py',34),
+  ('bloco_stmt -> bloco_PAR','bloco_stmt',1,'p_bloco_stmt','parser.py',35),
+  ('bloco_SEQ -> SEQ LBRACE stmts RBRACE','bloco_SEQ',4,'p_bloco_SEQ','parser.py',39),
+  ('bloco_PAR -> PAR LBRACE stmts RBRACE','bloco_PAR',4,'p_bloco_PAR','parser.py',45),
+  ('stmts -> stmt','stmts',1,'p_stmts','parser.py',50),
+  ('stmts -> stmt stmts','stmts',2,'p_stmts','parser.py',51),
+  ('tipo_var -> BOOL','tipo_var',1,'p_tipo_var','parser.py',56),
+  ('tipo_var -> INT','tipo_var',1,'p_tipo_var','parser.py',57),
+  ('tipo_var -> FLOAT_TYPE','tipo_var',1,'p_tipo_var','parser.py',58),
+  ('tipo_var -> STRING_TYPE','tipo_var',1,'p_tipo_var','parser.py',59),
+  ('tipo_var -> C_CHANNEL','tipo_var',1,'p_tipo_var','parser.py',60),
+  ('tipo_var -> LIST LT tipo_var GT','tipo_var',4,'p_tipo_var','parser.py',61),
+  ('tipo_var -> MATRIX LT tipo_var GT','tipo_var',4,'p_tipo_var','parser.py',62),
+  ('tipo_var -> SET LT tipo_var GT','tipo_var',4,'p_tipo_var','parser.py',63),
+  ('tipo_var -> MAP LT tipo_var COMMA tipo_var GT','tipo_var',6,'p_tipo_var','parser.py',64),
+  ('declaracao -> tipo_var ID ASSIGN expr','declaracao',4,'p_declaracao','parser.py',77),
+  ('declaracao -> C_CHANNEL ASSIGN ID STRING NUM','declaracao',5,'p_declaracao_canal','parser.py',100),
+  ('declaracao -> C_CHANNEL ASSIGN ID STRING NUM opcoes_canal','declaracao',6,'p_declaracao_canal','parser.py',101),
+  ('declaracao -> C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET','declaracao',7,'p_declaracao_grupo','parser.py',113),
+  ('declaracao -> C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET opcoes_canal','declaracao',8,'p_declaracao_grupo','parser.py',114),
+  ('portas -> NUM','portas',1,'p_portas','parser.py',119),
+  ('portas -> NUM COMMA portas','portas',3,'p_portas','parser.py',120),
+  ('opcoes_canal -> opcao_canal','opcoes_canal',1,'p_opcoes_canal','parser.py',125),
+  ('opcoes_canal -> opcao_canal COMMA opcoes_canal','opcoes_canal',3,'p_opcoes_canal','parser.py',126),
+  ('opcao_canal -> ID ASSIGN NUM','opcao_canal',3,'p_opcao_canal','parser.py',130),
+  ('opcao_canal -> ID ASSIGN STRING','opcao_canal',3,'p_opcao_canal','parser.py',131),
+  ('opcao_canal -> ID ASSIGN TRUE','opcao_canal',3,'p_opcao_canal','parser.py',132),
+  ('opcao_canal -> ID ASSIGN FALSE','opcao_canal',3,'p_opcao_canal','parser.py',133),
+  ('atribuicao -> ID ASSIGN expr','atribuicao',3,'p_atribuicao','parser.py',142),
+  ('atribuicao -> ID indices ASSIGN expr','atribuicao',4,'p_atribuicao_indice','parser.py',147),
+  ('atribuicao -> ID op_composto expr','atribuicao',3,'p_atribuicao_composta','parser.py',152),
+  ('atribuicao -> ID indices op_composto expr','atribuicao',4,'p_atribuicao_composta','parser.py',153),
+  ('op_composto -> PLUS_ASSIGN','op_composto',1,'p_op_composto','parser.py',160),
+  ('op_composto -> MINUS_ASSIGN','op_composto',1,'p_op_composto','parser.py',161),
+  ('op_composto -> MULT_ASSIGN','op_composto',1,'p_op_composto','parser.py',162),
+  ('op_composto -> DIV_ASSIGN','op_composto',1,'p_op_composto','parser.py',163),
+  ('indices -> LBRACKET expr RBRACKET','indices',3,'p_indices','parser.py',167),
+  ('indices -> indices LBRACKET expr RBRACKET','indices',4,'p_indices','parser.py',168),
+  ('stmt -> declaracao SEMICOLON','stmt',2,'p_stmt','parser.py',173),
+  ('stmt -> atribuicao SEMICOLON','stmt',2,'p_stmt','parser.py',174),
+  ('stmt -> if_stmt','stmt',1,'p_stmt','parser.py',175),
+  ('stmt -> for_stmt','stmt',1,'p_stmt','parser.py',176),
+  ('stmt -> while_stmt','stmt',1,'p_stmt','parser.py',177),
+  ('stmt -> def_funcao','stmt',1,'p_stmt','parser.py',178),
+  ('stmt -> input SEMICOLON','stmt',2,'p_stmt','parser.py',179),
+  ('stmt -> output SEMICOLON','stmt',2,'p_stmt','parser.py',180),
+  ('stmt -> chamada_funcao SEMICOLON','stmt',2,'p_stmt','parser.py',181),
+  ('stmt -> receive_stmt','stmt',1,'p_stmt','parser.py',182),
+  ('stmt -> send_stmt','stmt',1,'p_stmt','parser.py',183),
+  ('stmt -> scatter_stmt','stmt',1,'p_stmt','parser.py',184),
+  ('stmt -> gather_stmt','stmt',1,'p_stmt','parser.py',185),
+  ('stmt -> bloco_stmt','stmt',1,'p_stmt','parser.py',186),
+  ('stmt -> COMMENT','stmt',1,'p_stmt','parser.py',187),
+  ('stmt -> RETURN expr SEMICOLON','stmt',3,'p_stmt_return','parser.py',191),
+  ('for_stmt -> FOR LPAREN ID IN expr RPAREN inicio_for LBRACE stmts RBRACE','for_stmt',10,'p_for_stmt','parser.py',196),
+  ('inicio_for -> <empty>','inicio_for',0,'p_inicio_for','parser.py',200),
+  ('while_stmt -> WHILE LPAREN expr RPAREN LBRACE stmts RBRACE','while_stmt',7,'p_while_stmt','parser.py',207),
+  ('input -> INPUT LPAREN args RPAREN','input',4,'p_input','parser.py',211),
+  ('output -> OUTPUT LPAREN args RPAREN','output',4,'p_output','parser.py',215),
+  ('receive_stmt -> ID DOT RECEIVE COLON expr SEMICOLON','receive_stmt',6,'p_receive_stmt','parser.py',220),
+  ('send_stmt -> ID DOT SEND COLON expr SEMICOLON','send_stmt',6,'p_send_stmt','parser.py',225),
+  ('scatter_stmt -> ID DOT SCATTER COLON expr SEMICOLON','scatter_stmt',6,'p_scatter_stmt','parser.py',234),
+  ('scatter_stmt -> ID DOT BROADCAST COLON expr SEMICOLON','scatter_stmt',6,'p_scatter_stmt','parser.py',235),
+  ('gather_stmt -> ID DOT GATHER COLON expr SEMICOLON','gather_stmt',6,'p_gather_stmt','parser.py',240),
+  ('params -> ID COMMA params','params',3,'p_params','parser.py',245),
+  ('params -> ID','params',1,'p_params','parser.py',246),
+  ('params -> <empty>','params',0,'p_params','parser.py',247),
+  ('def_funcao -> DEF ID LPAREN params RPAREN inicio_funcao LBRACE stmts RBRACE','def_funcao',9,'p_def_funcao','parser.py',257),
+  ('inicio_funcao -> <empty>','inicio_funcao',0,'p_inicio_funcao','parser.py',262),
+  ('expr -> INPUT LPAREN args RPAREN','expr',4,'p_expr_input','parser.py',279),
+  ('expr -> OUTPUT LPAREN args RPAREN','expr',4,'p_expr_output','parser.py',283),
+  ('chamada_funcao -> ID LPAREN args RPAREN','chamada_funcao',4,'p_chamada_funcao','parser.py',288),
+  ('args -> expr_list','args',1,'p_args','parser.py',306),
+  ('args -> <empty>','args',0,'p_args','parser.py',307),
+  ('expr -> chamada_funcao','expr',1,'p_expr','parser.py',312),
+  ('expr -> expr_binop','expr',1,'p_expr','parser.py',313),
+  ('expr -> expr_comparacao','expr',1,'p_expr','parser.py',314),
+  ('expr -> expr_lista','expr',1,'p_expr','parser.py',315),
+  ('expr -> expr_simples','expr',1,'p_expr','parser.py',316),
+  ('expr_binop -> expr PLUS expr','expr_binop',3,'p_expr_binop','parser.py',320),
+  ('expr_binop -> expr MINUS expr','expr_binop',3,'p_expr_binop','parser.py',321),
+  ('expr_binop -> expr MULT expr','expr_binop',3,'p_expr_binop','parser.py',322),
+  ('expr_binop -> expr DIV expr','expr_binop',3,'p_expr_binop','parser.py',323),
+  ('expr_comparacao -> expr LT expr','expr_comparacao',3,'p_expr_comparacao','parser.py',327),
+  ('expr_comparacao -> expr LE expr','expr_comparacao',3,'p_expr_comparacao','parser.py',328),
+  ('expr_comparacao -> expr GT expr','expr_comparacao',3,'p_expr_comparacao','parser.py',329),
+  ('expr_comparacao -> expr GE expr','expr_comparacao',3,'p_expr_comparacao','parser.py',330),
+  ('expr_comparacao -> expr EQ expr','expr_comparacao',3,'p_expr_comparacao','parser.py',331),
+  ('expr_comparacao -> expr NE expr','expr_comparacao',3,'p_expr_comparacao','parser.py',332),
+  ('expr_lista -> LBRACKET expr_list RBRACKET','expr_lista',3,'p_expr_lista','parser.py',336),
+  ('expr_lista -> LBRACKET RBRACKET','expr_lista',2,'p_expr_lista','parser.py',337),
+  ('expr -> LBRACE pares RBRACE','expr',3,'p_expr_mapa','parser.py',342),
+  ('expr -> LBRACE RBRACE','expr',2,'p_expr_mapa','parser.py',343),
+  ('pares -> expr COLON expr','pares',3,'p_pares','parser.py',348),
+  ('pares -> expr COLON expr COMMA pares','pares',5,'p_pares','parser.py',349),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_parenteses','parser.py',353),
+  ('expr -> expr LBRACKET expr RBRACKET','expr',4,'p_expr_indice','parser.py',358),
+  ('expr -> expr LBRACKET expr COLON expr RBRACKET','expr',6,'p_expr_fatia','parser.py',363),
+  ('expr -> expr LBRACKET COLON expr RBRACKET','expr',5,'p_expr_fatia','parser.py',364),
+  ('expr -> expr LBRACKET expr COLON RBRACKET','expr',5,'p_expr_fatia','parser.py',365),
+  ('expr_list -> expr','expr_list',1,'p_expr_list','parser.py',375),
+  ('expr_list -> expr COMMA expr_list','expr_list',3,'p_expr_list','parser.py',376),
+  ('expr_simples -> ID','expr_simples',1,'p_expr_simples','parser.py',380),
+  ('expr_simples -> NUM','expr_simples',1,'p_expr_simples','parser.py',381),
+  ('expr_simples -> FLOAT','expr_simples',1,'p_expr_simples','parser.py',382),
+  ('expr_simples -> STRING','expr_simples',1,'p_expr_simples','parser.py',383),
+  ('expr_simples -> TRUE','expr_simples',1,'p_expr_simples','parser.py',384),
+  ('expr_simples -> FALSE','expr_simples',1,'p_expr_simples','parser.py',385),
+  ('expr_simples -> ID DOT ID','expr_simples',3,'p_expr_simples','parser.py',386),
+  ('if_stmt -> IF LPAREN expr RPAREN LBRACE stmts RBRACE','if_stmt',7,'p_if_stmt','parser.py',408),
+  ('if_stmt -> IF LPAREN expr RPAREN LBRACE stmts RBRACE ELSE LBRACE stmts RBRACE','if_stmt',11,'p_if_stmt','parser.py',409),
 ]
@@ -0,0 +1,142 @@
+
+# parsetab_incremental.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'stmtsnonassocLTLEGTGEEQNEleftPLUSMINUSleftMULTDIVleftLBRACKETASSIGN BOOL BROADCAST COLON COMMA COMMENT C_CHANNEL DEF DIV DIV_ASSIGN DOT ELSE EQ FALSE FLOAT FLOAT_TYPE FOR GATHER GE GT ID IF IN INPUT INT LBRACE LBRACKET LE LIST LPAREN LT MAP MATRIX MINUS MINUS_ASSIGN MULT MULT_ASSIGN NE NUM OUTPUT PAR PLUS PLUS_ASSIGN RBRACE RBRACKET RECEIVE RETURN RPAREN SCATTER SEMICOLON SEND SEQ SET STRING STRING_TYPE TRUE WHILEprograma_minipar : bloco_stmtbloco_stmt : bloco_SEQ\n                  | bloco_PARbloco_SEQ : SEQ LBRACE stmts RBRACEbloco_PAR : PAR LBRACE stmts RBRACEstmts : stmt\n             | stmt stmtstipo_var : BOOL\n                | INT\n                | FLOAT_TYPE\n                | STRING_TYPE\n                | C_CHANNEL\n                | LIST LT tipo_var GT\n                | MATRIX LT tipo_var GT\n                | SET LT tipo_var GT\n                | MAP LT tipo_var COMMA tipo_var GTdeclaracao : tipo_var ID ASSIGN exprdeclaracao : C_CHANNEL ASSIGN ID STRING NUM\n                  | C_CHANNEL ASSIGN ID STRING NUM opcoes_canaldeclaracao : C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET\n                  | C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET opcoes_canalportas : NUM\n              | NUM COMMA portasopcoes_canal : opcao_canal\n                    | opcao_canal COMMA opcoes_canalopcao_canal : ID ASSIGN NUM\n                   | ID ASSIGN STRING\n                   | ID ASSIGN TRUE\n                   | ID ASSIGN FALSEatribuicao : ID ASSIGN expratribuicao : ID indices ASSIGN expratribuicao : ID op_composto expr\n                  | ID indices op_composto exprop_composto : PLUS_ASSIGN\n                   | MINUS_ASSIGN\n                   | MULT_ASSIGN\n                   | DIV_ASSIGNindices : LBRACKET expr RBRACKET\n               | indices LBRACKET expr RBRACKETstmt : declaracao SEMICOLON\n            | atribuicao SEMICOLON\n            | if_stmt\n            | for_stmt\n            | while_stmt\n            | def_funcao\n            | input SEMICOLON\n            | output SEMICOLON\n            | chamada_funcao SEMICOLON\n            | receive_stmt\n            | send_stmt\n            | scatter_stmt\n            | gather_stmt\n            | bloco_stmt\n            | COMMENTstmt : RETURN expr SEMICOLONfor_stmt : FOR LPAREN ID IN expr RPAREN inicio_for LBRACE stmts RBRACEinicio_for :while_stmt : WHILE LPAREN expr RPAREN LBRACE stmts RBRACEinput : INPUT LPAREN args RPARENoutput : OUTPUT LPAREN args RPARENreceive_stmt : ID DOT RECEIVE COLON expr SEMICOLONsend_stmt : ID DOT SEND COLON expr SEMICOLONscatter_stmt : ID DOT SCATTER COLON expr SEMICOLON\n                    | ID DOT BROADCAST COLON expr SEMICOLONgather_stmt : ID DOT GATHER COLON expr SEMICOLONparams : ID COMMA params\n              | ID\n              | def_funcao : DEF ID LPAREN params RPAREN inicio_funcao LBRACE stmts RBRACEinicio_funcao :expr : INPUT LPAREN args RPARENexpr : OUTPUT LPAREN args RPARENchamada_funcao : ID LPAREN args RPARENargs : expr_list\n            | expr : chamada_funcao\n            | expr_binop\n            | expr_comparacao\n            | expr_lista\n            | expr_simplesexpr_binop : expr PLUS expr\n                  | expr MINUS expr\n                  | expr MULT expr\n                  | expr DIV exprexpr_comparacao : expr LT expr\n                       | expr LE expr\n                       | expr GT expr\n                       | expr GE expr\n                       | expr EQ expr\n                       | expr NE exprexpr_lista : LBRACKET expr_list RBRACKET\n                  | LBRACKET RBRACKETexpr : LBRACE pares RBRACE\n            | LBRACE RBRACEpares : expr COLON expr\n             | expr COLON expr COMMA paresexpr : LPAREN expr RPARENexpr : expr LBRACKET expr RBRACKETexpr : expr LBRACKET expr COLON expr RBRACKET\n            | expr LBRACKET COLON expr RBRACKET\n            | expr LBRACKET expr COLON RBRACKETexpr_list : expr\n                 | expr COMMA expr_listexpr_simples : ID\n                    | NUM\n                    | FLOAT\n                    | STRING\n                    | TRUE\n                    | FALSE\n                    | ID DOT IDif_stmt : IF LPAREN expr RPAREN LBRACE stmts RBRACE\n               | IF LPAREN expr RPAREN LBRACE stmts RBRACE ELSE LBRACE stmts RBRACE'
+    
+_lr_action_items = {'COMMENT':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,85,86,87,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[17,17,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,17,17,-55,-4,-5,17,17,-61,-62,-63,-64,-65,-111,-58,17,17,17,-69,-56,-112,]),'RETURN':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,85,86,87,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[18,18,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,18,18,-55,-4,-5,18,18,-61,-62,-63,-64,-65,-111,-58,18,18,18,-69,-56,-112,]),'C_CHANNEL':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,81,82,83,84,85,86,87,179,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[21,21,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,131,131,131,131,21,21,-55,131,-4,-5,21,21,-61,-62,-63,-64,-65,-111,-58,21,21,21,-69,-56,-112,]),'ID':([0,2,5,6,7,8,12,13,14,15,16,17,18,19,21,25,28,29,30,31,32,33,41,42,43,44,45,48,55,56,64,66,67,69,70,71,72,73,74,75,76,77,79,80,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,108,109,111,112,113,127,138,153,155,162,163,164,165,166,170,176,177,178,180,181,183,195,197,199,200,206,207,208,209,210,211,222,226,227,229,231,232,241,243,245,247,248,],[20,20,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,57,63,-12,78,-2,-3,-8,-9,-10,-11,-40,-41,-46,-47,-48,57,57,57,57,57,57,57,-34,-35,-36,-37,123,57,125,57,57,57,20,20,-55,57,57,57,57,57,57,57,57,57,57,57,57,57,156,57,57,57,57,172,57,57,57,57,57,57,57,57,57,-13,-14,-15,-4,-5,57,212,20,20,172,57,-61,-62,-63,-64,-65,-16,212,212,-111,-58,20,20,20,-69,-56,-112,]),'IF':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,85,86,87,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[22,22,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,22,22,-55,-4,-5,22,22,-61,-62,-63,-64,-65,-111,-58,22,22,22,-69,-56,-112,]),'FOR':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,85,86,87,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[23,23,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,23,23,-55,-4,-5,23,23,-61,-62,-63,-64,-65,-111,-58,23,23,23,-69,-56,-112,]),'WHILE':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,85,86,87,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[24,24,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,24,24,-55,-4,-5,24,24,-61,-62,-63,-64,-65,-111,-58,24,24,24,-69,-56,-112,]),'DEF':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,85,86,87,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[25,25,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,25,25,-55,-4,-5,25,25,-61,-62,-63,-64,-65,-111,-58,25,25,25,-69,-56,-112,]),'INPUT':([0,2,5,6,7,8,12,13,14,15,16,17,18,28,29,41,42,43,44,45,48,55,56,64,66,67,69,70,71,72,73,75,77,79,80,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,180,181,183,197,199,206,207,208,209,210,211,229,231,232,241,243,245,247,248,],[26,26,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,47,-2,-3,-40,-41,-46,-47,-48,47,47,47,47,47,47,47,-34,-35,-36,-37,47,47,47,47,26,26,-55,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-4,-5,47,26,26,47,-61,-62,-63,-64,-65,-111,-58,26,26,26,-69,-56,-112,]),'OUTPUT':([0,2,5,6,7,8,12,13,14,15,16,17,18,28,29,41,42,43,44,45,48,55,56,64,66,67,69,70,71,72,73,75,77,79,80,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,180,181,183,197,199,206,207,208,209,210,211,229,231,232,241,243,245,247,248,],[27,27,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,49,-2,-3,-40,-41,-46,-47,-48,49,49,49,49,49,49,49,-34,-35,-36,-37,49,49,49,49,27,27,-55,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-4,-5,49,27,27,49,-61,-62,-63,-64,-65,-111,-58,27,27,27,-69,-56,-112,]),'BOOL':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,81,82,83,84,85,86,87,179,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[30,30,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,30,30,30,30,30,30,-55,30,-4,-5,30,30,-61,-62,-63,-64,-65,-111,-58,30,30,30,-69,-56,-112,]),'INT':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,81,82,83,84,85,86,87,179,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[31,31,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,31,31,31,31,31,31,-55,31,-4,-5,31,31,-61,-62,-63,-64,-65,-111,-58,31,31,31,-69,-56,-112,]),'FLOAT_TYPE':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,81,82,83,84,85,86,87,179,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[32,32,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,32,32,32,32,32,32,-55,32,-4,-5,32,32,-61,-62,-63,-64,-65,-111,-58,32,32,32,-69,-56,-112,]),'STRING_TYPE':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,81,82,83,84,85,86,87,179,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[33,33,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,33,33,33,33,33,33,-55,33,-4,-5,33,33,-61,-62,-63,-64,-65,-111,-58,33,33,33,-69,-56,-112,]),'LIST':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,81,82,83,84,85,86,87,179,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[34,34,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,34,34,34,34,34,34,-55,34,-4,-5,34,34,-61,-62,-63,-64,-65,-111,-58,34,34,34,-69,-56,-112,]),'MATRIX':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,81,82,83,84,85,86,87,179,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[35,35,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,35,35,35,35,35,35,-55,35,-4,-5,35,35,-61,-62,-63,-64,-65,-111,-58,35,35,35,-69,-56,-112,]),'SET':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,81,82,83,84,85,86,87,179,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[36,36,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,36,36,36,36,36,36,-55,36,-4,-5,36,36,-61,-62,-63,-64,-65,-111,-58,36,36,36,-69,-56,-112,]),'MAP':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,81,82,83,84,85,86,87,179,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[37,37,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,37,37,37,37,37,37,-55,37,-4,-5,37,37,-61,-62,-63,-64,-65,-111,-58,37,37,37,-69,-56,-112,]),'SEQ':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,85,86,87,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[38,38,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,38,38,-55,-4,-5,38,38,-61,-62,-63,-64,-65,-111,-58,38,38,38,-69,-56,-112,]),'PAR':([0,2,5,6,7,8,12,13,14,15,16,17,28,29,41,42,43,44,45,85,86,87,180,181,197,199,207,208,209,210,211,229,231,232,241,243,245,247,248,],[39,39,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-40,-41,-46,-47,-48,39,39,-55,-4,-5,39,39,-61,-62,-63,-64,-65,-111,-58,39,39,39,-69,-56,-112,]),'$end':([1,2,5,6,7,8,12,13,14,15,16,17,28,29,40,41,42,43,44,45,87,180,181,207,208,209,210,211,229,231,245,247,248,],[0,-6,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-7,-40,-41,-46,-47,-48,-55,-4,-5,-61,-62,-63,-64,-65,-111,-58,-69,-56,-112,]),'RBRACE':([2,5,6,7,8,12,13,14,15,16,17,28,29,40,41,42,43,44,45,50,51,52,53,54,55,57,58,59,60,61,62,87,102,103,106,135,136,139,140,141,142,143,144,145,146,147,148,150,152,154,156,161,180,181,182,185,186,187,204,205,207,208,209,210,211,217,219,223,224,229,231,242,244,245,246,247,248,],[-6,-42,-43,-44,-45,-49,-50,-51,-52,-53,-54,-2,-3,-7,-40,-41,-46,-47,-48,-76,-77,-78,-79,-80,103,-104,-105,-106,-107,-108,-109,-55,152,-94,-92,180,181,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,-73,-4,-5,-98,-71,-72,-95,-101,-100,-61,-62,-63,-64,-65,229,231,-99,-96,-111,-58,245,247,-69,248,-56,-112,]),'SEMICOLON':([3,4,9,10,11,46,50,51,52,53,54,57,58,59,60,61,62,103,106,110,114,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,161,174,175,182,185,186,190,191,192,193,194,195,204,205,213,214,223,227,233,234,235,236,237,238,],[41,42,43,44,45,87,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,-94,-92,-30,-32,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,-17,-31,-33,-73,-59,-60,-98,-71,-72,207,208,209,210,211,-18,-101,-100,-19,-24,-99,-20,-26,-27,-28,-29,-25,-21,]),'LBRACE':([18,38,39,48,55,56,64,66,67,69,70,71,72,73,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,169,170,171,183,201,206,218,221,230,240,],[55,85,86,55,55,55,55,55,55,55,-34,-35,-36,-37,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,197,55,199,55,-70,55,-57,232,241,243,]),'LPAREN':([18,20,22,23,24,26,27,47,48,49,55,56,57,64,66,67,69,70,71,72,73,75,77,78,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,206,],[48,67,75,76,77,79,80,99,48,101,48,48,67,48,48,48,48,-34,-35,-36,-37,48,48,127,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'LBRACKET':([18,20,46,48,50,51,52,53,54,55,56,57,58,59,60,61,62,64,65,66,67,69,70,71,72,73,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,100,101,103,104,106,107,109,110,111,112,113,114,122,124,126,137,138,139,140,141,142,143,144,145,146,147,148,150,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,170,182,183,184,185,186,187,189,190,191,192,193,194,198,203,204,205,206,223,],[56,69,88,56,-76,-77,-78,-79,-80,56,56,-104,-105,-106,-107,-108,-109,56,113,56,56,56,-34,-35,-36,-37,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,88,56,-94,88,-92,88,56,88,56,56,56,88,88,88,88,88,56,88,88,88,88,88,88,88,88,88,88,-97,-93,56,-91,56,-110,88,88,88,88,-73,56,56,56,56,56,-38,196,56,-98,56,88,-71,-72,88,-39,88,88,88,88,88,88,88,-101,-100,56,-99,]),'NUM':([18,48,55,56,64,66,67,69,70,71,72,73,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,168,170,183,196,206,225,228,],[58,58,58,58,58,58,58,58,-34,-35,-36,-37,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,195,58,58,216,58,233,216,]),'FLOAT':([18,48,55,56,64,66,67,69,70,71,72,73,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,206,],[59,59,59,59,59,59,59,59,-34,-35,-36,-37,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'STRING':([18,48,55,56,64,66,67,69,70,71,72,73,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,123,138,153,155,162,163,164,165,166,170,183,206,225,],[60,60,60,60,60,60,60,60,-34,-35,-36,-37,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,168,60,60,60,60,60,60,60,60,60,60,60,234,]),'TRUE':([18,48,55,56,64,66,67,69,70,71,72,73,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,206,225,],[61,61,61,61,61,61,61,61,-34,-35,-36,-37,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,235,]),'FALSE':([18,48,55,56,64,66,67,69,70,71,72,73,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,206,225,],[62,62,62,62,62,62,62,62,-34,-35,-36,-37,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,236,]),'ASSIGN':([20,21,63,65,167,189,212,],[64,74,109,111,-38,-39,225,]),'DOT':([20,57,],[68,108,]),'PLUS_ASSIGN':([20,65,167,189,],[70,70,-38,-39,]),'MINUS_ASSIGN':([20,65,167,189,],[71,71,-38,-39,]),'MULT_ASSIGN':([20,65,167,189,],[72,72,-38,-39,]),'DIV_ASSIGN':([20,65,167,189,],[73,73,-38,-39,]),'GT':([30,31,32,33,46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,130,131,132,133,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,176,177,178,182,184,185,186,187,190,191,192,193,194,198,202,203,204,205,222,223,],[-8,-9,-10,-11,95,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,95,-94,95,-92,95,95,95,95,95,95,176,-12,177,178,95,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,95,95,95,95,-73,-13,-14,-15,-98,95,-71,-72,95,95,95,95,95,95,95,222,95,-101,-100,-16,-99,]),'COMMA':([30,31,32,33,50,51,52,53,54,57,58,59,60,61,62,103,106,107,131,134,139,140,141,142,143,144,145,146,147,148,150,152,154,156,161,172,176,177,178,182,185,186,187,204,205,214,216,222,223,233,234,235,236,],[-8,-9,-10,-11,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,-94,-92,155,-12,179,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,-73,200,-13,-14,-15,-98,-71,-72,206,-101,-100,226,228,-16,-99,-26,-27,-28,-29,]),'LT':([34,35,36,37,46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,182,184,185,186,187,190,191,192,193,194,198,203,204,205,223,],[81,82,83,84,93,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,93,-94,93,-92,93,93,93,93,93,93,93,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,93,93,93,93,-73,-98,93,-71,-72,93,93,93,93,93,93,93,93,-101,-100,-99,]),'PLUS':([46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,182,184,185,186,187,190,191,192,193,194,198,203,204,205,223,],[89,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,89,-94,89,-92,89,89,89,89,89,89,89,-81,-82,-83,-84,89,89,89,89,89,89,-97,-93,-91,-110,89,89,89,89,-73,-98,89,-71,-72,89,89,89,89,89,89,89,89,-101,-100,-99,]),'MINUS':([46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,182,184,185,186,187,190,191,192,193,194,198,203,204,205,223,],[90,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,90,-94,90,-92,90,90,90,90,90,90,90,-81,-82,-83,-84,90,90,90,90,90,90,-97,-93,-91,-110,90,90,90,90,-73,-98,90,-71,-72,90,90,90,90,90,90,90,90,-101,-100,-99,]),'MULT':([46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,182,184,185,186,187,190,191,192,193,194,198,203,204,205,223,],[91,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,91,-94,91,-92,91,91,91,91,91,91,91,91,91,-83,-84,91,91,91,91,91,91,-97,-93,-91,-110,91,91,91,91,-73,-98,91,-71,-72,91,91,91,91,91,91,91,91,-101,-100,-99,]),'DIV':([46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,182,184,185,186,187,190,191,192,193,194,198,203,204,205,223,],[92,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,92,-94,92,-92,92,92,92,92,92,92,92,92,92,-83,-84,92,92,92,92,92,92,-97,-93,-91,-110,92,92,92,92,-73,-98,92,-71,-72,92,92,92,92,92,92,92,92,-101,-100,-99,]),'LE':([46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,182,184,185,186,187,190,191,192,193,194,198,203,204,205,223,],[94,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,94,-94,94,-92,94,94,94,94,94,94,94,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,94,94,94,94,-73,-98,94,-71,-72,94,94,94,94,94,94,94,94,-101,-100,-99,]),'GE':([46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,182,184,185,186,187,190,191,192,193,194,198,203,204,205,223,],[96,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,96,-94,96,-92,96,96,96,96,96,96,96,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,96,96,96,96,-73,-98,96,-71,-72,96,96,96,96,96,96,96,96,-101,-100,-99,]),'EQ':([46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,182,184,185,186,187,190,191,192,193,194,198,203,204,205,223,],[97,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,97,-94,97,-92,97,97,97,97,97,97,97,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,97,97,97,97,-73,-98,97,-71,-72,97,97,97,97,97,97,97,97,-101,-100,-99,]),'NE':([46,50,51,52,53,54,57,58,59,60,61,62,100,103,104,106,107,110,114,122,124,126,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,157,158,159,160,161,182,184,185,186,187,190,191,192,193,194,198,203,204,205,223,],[98,-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,98,-94,98,-92,98,98,98,98,98,98,98,-81,-82,-83,-84,None,None,None,None,None,None,-97,-93,-91,-110,98,98,98,98,-73,-98,98,-71,-72,98,98,98,98,98,98,98,98,-101,-100,-99,]),'RPAREN':([50,51,52,53,54,57,58,59,60,61,62,67,79,80,99,100,101,103,106,107,115,116,124,126,127,128,129,139,140,141,142,143,144,145,146,147,148,149,150,151,152,154,156,161,172,173,182,185,186,188,198,200,204,205,220,223,],[-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,-75,-75,-75,-75,150,-75,-94,-92,-102,161,-74,169,171,-68,174,175,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,185,-97,186,-93,-91,-110,-73,-67,201,-98,-71,-72,-103,218,-68,-101,-100,-66,-99,]),'COLON':([50,51,52,53,54,57,58,59,60,61,62,88,103,104,106,117,118,119,120,121,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,161,182,185,186,204,205,223,],[-76,-77,-78,-79,-80,-104,-105,-106,-107,-108,-109,138,-94,153,-92,162,163,164,165,166,183,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,-73,-98,-71,-72,-101,-100,-99,]),'RBRACKET':([50,51,52,53,54,56,57,58,59,60,61,62,103,105,106,107,122,137,139,140,141,142,143,144,145,146,147,148,150,152,154,156,160,161,182,183,184,185,186,188,203,204,205,215,216,223,239,],[-76,-77,-78,-79,-80,106,-104,-105,-106,-107,-108,-109,-94,154,-92,-102,167,182,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-97,-93,-91,-110,189,-73,-98,204,205,-71,-72,-103,223,-101,-100,227,-22,-99,-23,]),'RECEIVE':([68,],[117,]),'SEND':([68,],[118,]),'SCATTER':([68,],[119,]),'BROADCAST':([68,],[120,]),'GATHER':([68,],[121,]),'IN':([125,],[170,]),'ELSE':([229,],[240,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'stmts':([0,2,85,86,197,199,232,241,243,],[1,40,135,136,217,219,242,244,246,]),'stmt':([0,2,85,86,197,199,232,241,243,],[2,2,2,2,2,2,2,2,2,]),'declaracao':([0,2,85,86,197,199,232,241,243,],[3,3,3,3,3,3,3,3,3,]),'atribuicao':([0,2,85,86,197,199,232,241,243,],[4,4,4,4,4,4,4,4,4,]),'if_stmt':([0,2,85,86,197,199,232,241,243,],[5,5,5,5,5,5,5,5,5,]),'for_stmt':([0,2,85,86,197,199,232,241,243,],[6,6,6,6,6,6,6,6,6,]),'while_stmt':([0,2,85,86,197,199,232,241,243,],[7,7,7,7,7,7,7,7,7,]),'def_funcao':([0,2,85,86,197,199,232,241,243,],[8,8,8,8,8,8,8,8,8,]),'input':([0,2,85,86,197,199,232,241,243,],[9,9,9,9,9,9,9,9,9,]),'output':([0,2,85,86,197,199,232,241,243,],[10,10,10,10,10,10,10,10,10,]),'chamada_funcao':([0,2,18,48,55,56,64,66,67,69,75,77,79,80,85,86,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,197,199,206,232,241,243,],[11,11,50,50,50,50,50,50,50,50,50,50,50,50,11,11,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,11,11,50,11,11,11,]),'receive_stmt':([0,2,85,86,197,199,232,241,243,],[12,12,12,12,12,12,12,12,12,]),'send_stmt':([0,2,85,86,197,199,232,241,243,],[13,13,13,13,13,13,13,13,13,]),'scatter_stmt':([0,2,85,86,197,199,232,241,243,],[14,14,14,14,14,14,14,14,14,]),'gather_stmt':([0,2,85,86,197,199,232,241,243,],[15,15,15,15,15,15,15,15,15,]),'bloco_stmt':([0,2,85,86,197,199,232,241,243,],[16,16,16,16,16,16,16,16,16,]),'tipo_var':([0,2,81,82,83,84,85,86,179,197,199,232,241,243,],[19,19,130,132,133,134,19,19,202,19,19,19,19,19,]),'bloco_SEQ':([0,2,85,86,197,199,232,241,243,],[28,28,28,28,28,28,28,28,28,]),'bloco_PAR':([0,2,85,86,197,199,232,241,243,],[29,29,29,29,29,29,29,29,29,]),'expr':([18,48,55,56,64,66,67,69,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,206,],[46,100,104,107,110,114,107,122,124,126,107,107,137,139,140,141,142,143,144,145,146,147,148,107,107,157,158,159,160,184,187,107,190,191,192,193,194,198,203,104,]),'expr_binop':([18,48,55,56,64,66,67,69,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,206,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'expr_comparacao':([18,48,55,56,64,66,67,69,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,206,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'expr_lista':([18,48,55,56,64,66,67,69,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,206,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'expr_simples':([18,48,55,56,64,66,67,69,75,77,79,80,88,89,90,91,92,93,94,95,96,97,98,99,101,109,111,112,113,138,153,155,162,163,164,165,166,170,183,206,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'indices':([20,],[65,]),'op_composto':([20,65,],[66,112,]),'pares':([55,206,],[102,224,]),'expr_list':([56,67,79,80,99,101,155,],[105,116,116,116,116,116,188,]),'args':([67,79,80,99,101,],[115,128,129,149,151,]),'params':([127,200,],[173,220,]),'opcoes_canal':([195,226,227,],[213,237,238,]),'opcao_canal':([195,226,227,],[214,214,214,]),'portas':([196,228,],[215,239,]),'inicio_funcao':([201,],[221,]),'inicio_for':([218,],[230,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> stmts","S'",1,None,None,None),
+  ('programa_minipar -> bloco_stmt','programa_minipar',1,'p_programa_minipar','parser.py',29),
+  ('bloco_stmt -> bloco_SEQ','bloco_stmt',1,'p_bloco_stmt','parser.py',34),
+  ('bloco_stmt -> bloco_PAR','bloco_stmt',1,'p_bloco_stmt','parser.py',35),
+  ('bloco_SEQ -> SEQ LBRACE stmts RBRACE','bloco_SEQ',4,'p_bloco_SEQ','parser.py',39),
+  ('bloco_PAR -> PAR LBRACE stmts RBRACE','bloco_PAR',4,'p_bloco_PAR','parser.py',45),
+  ('stmts -> stmt','stmts',1,'p_stmts','parser.py',50),
+  ('stmts -> stmt stmts','stmts',2,'p_stmts','parser.py',51),
+  ('tipo_var -> BOOL','tipo_var',1,'p_tipo_var','parser.py',56),
+  ('tipo_var -> INT','tipo_var',1,'p_tipo_var','parser.py',57),
+  ('tipo_var -> FLOAT_TYPE','tipo_var',1,'p_tipo_var','parser.py',58),
+  ('tipo_var -> STRING_TYPE','tipo_var',1,'p_tipo_var','parser.py',59),
+  ('tipo_var -> C_CHANNEL','tipo_var',1,'p_tipo_var','parser.py',60),
+  ('tipo_var -> LIST LT tipo_var GT','tipo_var',4,'p_tipo_var','parser.py',61),
+  ('tipo_var -> MATRIX LT tipo_var GT','tipo_var',4,'p_tipo_var','parser.py',62),
+  ('tipo_var -> SET LT tipo_var GT','tipo_var',4,'p_tipo_var','parser.py',63),
+  ('tipo_var -> MAP LT tipo_var COMMA tipo_var GT','tipo_var',6,'p_tipo_var','parser.py',64),
+  ('declaracao -> tipo_var ID ASSIGN expr','declaracao',4,'p_declaracao','parser.py',77),
+  ('declaracao -> C_CHANNEL ASSIGN ID STRING NUM','declaracao',5,'p_declaracao_canal','parser.py',100),
+  ('declaracao -> C_CHANNEL ASSIGN ID STRING NUM opcoes_canal','declaracao',6,'p_declaracao_canal','parser.py',101),
+  ('declaracao -> C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET','declaracao',7,'p_declaracao_grupo','parser.py',113),
+  ('declaracao -> C_CHANNEL ASSIGN ID STRING LBRACKET portas RBRACKET opcoes_canal','declaracao',8,'p_declaracao_grupo','parser.py',114),
+  ('portas -> NUM','portas',1,'p_portas','parser.py',119),
+  ('portas -> NUM COMMA portas','portas',3,'p_portas','parser.py',120),
+  ('opcoes_canal -> opcao_canal','opcoes_canal',1,'p_opcoes_canal','parser.py',125),
+  ('opcoes_canal -> opcao_canal COMMA opcoes_canal','opcoes_canal',3,'p_opcoes_canal','parser.py',126),
+  ('opcao_canal -> ID ASSIGN NUM','opcao_canal',3,'p_opcao_canal','parser.py',130),
+  ('opcao_canal -> ID ASSIGN STRING','opcao_canal',3,'p_opcao_canal','parser.py',131),
+  ('opcao_canal -> ID ASSIGN TRUE','opcao_canal',3,'p_opcao_canal','parser.py',132),
+  ('opcao_canal -> ID ASSIGN FALSE','opcao_canal',3,'p_opcao_canal','parser.py',133),
+  ('atribuicao -> ID ASSIGN expr','atribuicao',3,'p_atribuicao','parser.py',142),
+  ('atribuicao -> ID indices ASSIGN expr','atribuicao',4,'p_atribuicao_indice','parser.py',147),
+  ('atribuicao -> ID op_composto expr','atribuicao',3,'p_atribuicao_composta','parser.py',152),
+  ('atribuicao -> ID indices op_composto expr','atribuicao',4,'p_atribuicao_composta','parser.py',153),
+  ('op_composto -> PLUS_ASSIGN','op_composto',1,'p_op_composto','parser.py',160),
+  ('op_composto -> MINUS_ASSIGN','op_composto',1,'p_op_composto','parser.py',161),
+  ('op_composto -> MULT_ASSIGN','op_composto',1,'p_op_composto','parser.py',162),
+  ('op_composto -> DIV_ASSIGN','op_composto',1,'p_op_composto','parser.py',163),
+  ('indices -> LBRACKET expr RBRACKET','indices',3,'p_indices','parser.py',167),
+  ('indices -> indices LBRACKET expr RBRACKET','indices',4,'p_indices','parser.py',168),
+  ('stmt -> declaracao SEMICOLON','stmt',2,'p_stmt','parser.py',173),
+  ('stmt -> atribuicao SEMICOLON','stmt',2,'p_stmt','parser.py',174),
+  ('stmt -> if_stmt','stmt',1,'p_stmt','parser.py',175),
+  ('stmt -> for_stmt','stmt',1,'p_stmt','parser.py',176),
+  ('stmt -> while_stmt','stmt',1,'p_stmt','parser.py',177),
+  ('stmt -> def_funcao','stmt',1,'p_stmt','parser.py',178),
+  ('stmt -> input SEMICOLON','stmt',2,'p_stmt','parser.py',179),
+  ('stmt -> output SEMICOLON','stmt',2,'p_stmt','parser.py',180),
+  ('stmt -> chamada_funcao SEMICOLON','stmt',2,'p_stmt','parser.py',181),
+  ('stmt -> receive_stmt','stmt',1,'p_stmt','parser.py',182),
+  ('stmt -> send_stmt','stmt',1,'p_stmt','parser.py',183),
+  ('stmt -> scatter_stmt','stmt',1,'p_stmt','parser.py',184),
+  ('stmt -> gather_stmt','stmt',1,'p_stmt','parser.py',185),
+  ('stmt -> bloco_stmt','stmt',1,'p_stmt','parser.py',186),
+  ('stmt -> COMMENT','stmt',1,'p_stmt','parser.py',187),
+  ('stmt -> RETURN expr SEMICOLON','stmt',3,'p_stmt_return','parser.py',191),
+  ('for_stmt -> FOR LPAREN ID IN expr RPAREN inicio_for LBRACE stmts RBRACE','for_stmt',10,'p_for_stmt','parser.py',196),
+  ('inicio_for -> <empty>','inicio_for',0,'p_inicio_for','parser.py',200),
+  ('while_stmt -> WHILE LPAREN expr RPAREN LBRACE stmts RBRACE','while_stmt',7,'p_while_stmt','parser.py',207),
+  ('input -> INPUT LPAREN args RPAREN','input',4,'p_input','parser.py',211),
+  ('output -> OUTPUT LPAREN args RPAREN','output',4,'p_output','parser.py',215),
+  ('receive_stmt -> ID DOT RECEIVE COLON expr SEMICOLON','receive_stmt',6,'p_receive_stmt','parser.py',220),
+  ('send_stmt -> ID DOT SEND COLON expr SEMICOLON','send_stmt',6,'p_send_stmt','parser.py',225),
+  ('scatter_stmt -> ID DOT SCATTER COLON expr SEMICOLON','scatter_stmt',6,'p_scatter_stmt','parser.py',234),
+  ('scatter_stmt -> ID DOT BROADCAST COLON expr SEMICOLON','scatter_stmt',6,'p_scatter_stmt','parser.py',235),
+  ('gather_stmt -> ID DOT GATHER COLON expr SEMICOLON','gather_stmt',6,'p_gather_stmt','parser.py',240),
+  ('params -> ID COMMA params','params',3,'p_params','parser.py',245),
+  ('params -> ID','params',1,'p_params','parser.py',246),
+  ('params -> <empty>','params',0,'p_params','parser.py',247),
+  ('def_funcao -> DEF ID LPAREN params RPAREN inicio_funcao LBRACE stmts RBRACE','def_funcao',9,'p_def_funcao','parser.py',257),
+  ('inicio_funcao -> <empty>','inicio_funcao',0,'p_inicio_funcao','parser.py',262),
+  ('expr -> INPUT LPAREN args RPAREN','expr',4,'p_expr_input','parser.py',279),
+  ('expr -> OUTPUT LPAREN args RPAREN','expr',4,'p_expr_output','parser.py',283),
+  ('chamada_funcao -> ID LPAREN args RPAREN','chamada_funcao',4,'p_chamada_funcao','parser.py',288),
+  ('args -> expr_list','args',1,'p_args','parser.py',306),
+  ('args -> <empty>','args',0,'p_args','parser.py',307),
+  ('expr -> chamada_funcao','expr',1,'p_expr','parser.py',312),
+  ('expr -> expr_binop','expr',1,'p_expr','parser.py',313),
+  ('expr -> expr_comparacao','expr',1,'p_expr','parser.py',314),
+  ('expr -> expr_lista','expr',1,'p_expr','parser.py',315),
+  ('expr -> expr_simples','expr',1,'p_expr','parser.py',316),
+  ('expr_binop -> expr PLUS expr','expr_binop',3,'p_expr_binop','parser.py',320),
+  ('expr_binop -> expr MINUS expr','expr_binop',3,'p_expr_binop','parser.py',321),
+  ('expr_binop -> expr MULT expr','expr_binop',3,'p_expr_binop','parser.py',322),
+  ('expr_binop -> expr DIV expr','expr_binop',3,'p_expr_binop','parser.py',323),
+  ('expr_comparacao -> expr LT expr','expr_comparacao',3,'p_expr_comparacao','parser.py',327),
+  ('expr_comparacao -> expr LE expr','expr_comparacao',3,'p_expr_comparacao','parser.py',328),
+  ('expr_comparacao -> expr GT expr','expr_comparacao',3,'p_expr_comparacao','parser.py',329),
+  ('expr_comparacao -> expr GE expr','expr_comparacao',3,'p_expr_comparacao','parser.py',330),
+  ('expr_comparacao -> expr EQ expr','expr_comparacao',3,'p_expr_comparacao','parser.py',331),
+  ('expr_comparacao -> expr NE expr','expr_comparacao',3,'p_expr_comparacao','parser.py',332),
+  ('expr_lista -> LBRACKET expr_list RBRACKET','expr_lista',3,'p_expr_lista','parser.py',336),
+  ('expr_lista -> LBRACKET RBRACKET','expr_lista',2,'p_expr_lista','parser.py',337),
+  ('expr -> LBRACE pares RBRACE','expr',3,'p_expr_mapa','parser.py',342),
+  ('expr -> LBRACE RBRACE','expr',2,'p_expr_mapa','parser.py',343),
+  ('pares -> expr COLON expr','pares',3,'p_pares','parser.py',348),
+  ('pares -> expr COLON expr COMMA pares','pares',5,'p_pares','parser.py',349),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_parenteses','parser.py',353),
+  ('expr -> expr LBRACKET expr RBRACKET','expr',4,'p_expr_indice','parser.py',358),
+  ('expr -> expr LBRACKET expr COLON expr RBRACKET','expr',6,'p_expr_fatia','parser.py',363),
+  ('expr -> expr LBRACKET COLON expr RBRACKET','expr',5,'p_expr_fatia','parser.py',364),
+  ('expr -> expr LBRACKET expr COLON RBRACKET','expr',5,'p_expr_fatia','parser.py',365),
+  ('expr_list -> expr','expr_list',1,'p_expr_list','parser.py',375),
+  ('expr_list -> expr COMMA expr_list','expr_list',3,'p_expr_list','parser.py',376),
+  ('expr_simples -> ID','expr_simples',1,'p_expr_simples','parser.py',380),
+  ('expr_simples -> NUM','expr_simples',1,'p_expr_simples','parser.py',381),
+  ('expr_simples -> FLOAT','expr_simples',1,'p_expr_simples','parser.py',382),
+  ('expr_simples -> STRING','expr_simples',1,'p_expr_simples','parser.py',383),
+  ('expr_simples -> TRUE','expr_simples',1,'p_expr_simples','parser.py',384),
+  ('expr_simples -> FALSE','expr_simples',1,'p_expr_simples','parser.py',385),
+  ('expr_simples -> ID DOT ID','expr_simples',3,'p_expr_simples','parser.py',386),
+  ('if_stmt -> IF LPAREN expr RPAREN LBRACE stmts RBRACE','if_stmt',7,'p_if_stmt','parser.py',408),
+  ('if_stmt -> IF LPAREN expr RPAREN LBRACE stmts RBRACE ELSE LBRACE stmts RBRACE','if_stmt',11,'p_if_stmt','parser.py',409),
+]
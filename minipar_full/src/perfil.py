@@ -0,0 +1,244 @@
+# src/perfil.py
+"""
+Perfil determinístico de programas MiniPar: visitas, tempo total e tempo
+próprio por nó da árvore (tipo e linha) e por linha do código, mais as
+pilhas no formato "collapsed" (flamegraph.pl, speedscope, inferno).
+
+O perfil substitui o `visitar` de um Executor específico (instalar); sem
+ele o Executor não muda, então o perfil desligado não custa nada.
+
+PerfilAmostragem não toca no Executor: uma thread olha periodicamente a
+pilha Python de cada thread (sys._current_frames) e anota o nó MiniPar em
+execução, o ramo de PAR e a operação de canal em andamento. Serve para
+loops quentes e programas longos, onde o perfil determinístico distorce.
+"""
+import os
+import sys
+import threading
+import time
+
+import nos
+from interpreter import Executor
+
+class _Tabela:
+    """Estatísticas de uma thread (juntadas só no relatório, sem trava por visita)."""
+    def __init__(self):
+        self.nos = {}      # {(tipo, linha): [visitas, total, próprio]}
+        self.linhas = {}   # {linha: [visitas, total, próprio]}
+        self.pilhas = {}   # {"Programa;BlocoSEQ:1;While:3": próprio}
+        self.pilha = []    # Quadros ativos: [nó, caminho, início, tempo dos filhos]
+        self.ativos = {}   # Chaves na pilha (recursão não conta o total duas vezes)
+
+class PerfilDeterministico:
+    def __init__(self):
+        self._local = threading.local()
+        self._tabelas = []
+        self._trava = threading.Lock()
+        self._bases = {}  # {id do comando de um ramo de PAR: caminho do PAR + ramo}
+
+    def instalar(self, executor):
+        """Passa a medir todas as visitas feitas por `executor` (inclusive nos ramos de PAR)."""
+        visitar = executor.visitar
+        relogio = time.perf_counter
+
+        def visitar_com_perfil(no):
+            tabela = self._tabela()
+            pilha = tabela.pilha
+            tipo = type(no).__name__
+            linha = no.linha
+            rotulo = tipo if linha is None else f"{tipo}:{linha}"
+            if pilha:
+                caminho = f"{pilha[-1][1]};{rotulo}"
+            else:
+                base = self._bases.get(id(no))
+                caminho = f"{base};{rotulo}" if base else rotulo
+            if tipo == 'BlocoPAR':
+                for i, stmt in enumerate(no.stmts):
+                    self._bases[id(stmt)] = f"{caminho};ramo {i + 1}"
+            chaves = ((tipo, linha), linha)
+            for chave in chaves:
+                tabela.ativos[chave] = tabela.ativos.get(chave, 0) + 1
+            quadro = [no, caminho, 0.0, 0.0]
+            pilha.append(quadro)
+            quadro[2] = inicio = relogio()
+            try:
+                return visitar(no)
+            finally:
+                total = relogio() - inicio
+                pilha.pop()
+                proprio = total - quadro[3]
+                if pilha:
+                    pilha[-1][3] += total
+                for chave, estatisticas in zip(chaves, (tabela.nos, tabela.linhas)):
+                    item = estatisticas.get(chave)
+                    if item is None:
+                        item = estatisticas[chave] = [0, 0.0, 0.0]
+                    item[0] += 1
+                    item[2] += proprio
+                    tabela.ativos[chave] -= 1
+                    if not tabela.ativos[chave]:
+                        item[1] += total
+                tabela.pilhas[caminho] = tabela.pilhas.get(caminho, 0.0) + proprio
+
+        executor.visitar = visitar_com_perfil
+
+    def _tabela(self):
+        tabela = getattr(self._local, 'tabela', None)
+        if tabela is None:
+            tabela = self._local.tabela = _Tabela()
+            with self._trava:
+                self._tabelas.append(tabela)
+        return tabela
+
+    def _juntar(self, atributo):
+        juntos = {}
+        with self._trava:
+            tabelas = list(self._tabelas)
+        for tabela in tabelas:
+            for chave, item in getattr(tabela, atributo).items():
+                if isinstance(item, float):
+                    juntos[chave] = juntos.get(chave, 0.0) + item
+                else:
+                    alvo = juntos.setdefault(chave, [0, 0.0, 0.0])
+                    for i, valor in enumerate(item):
+                        alvo[i] += valor
+        return juntos
+
+    def por_no(self):
+        return self._juntar('nos')
+
+    def por_linha(self):
+        return self._juntar('linhas')
+
+    def pilhas(self):
+        """Pilhas no formato collapsed: uma linha "quadro;quadro;... microssegundos" por caminho."""
+        return ''.join(f"{caminho} {round(segundos * 1e6)}\n"
+                       for caminho, segundos in sorted(self._juntar('pilhas').items())
+                       if round(segundos * 1e6) > 0)
+
+    def relatorio(self, codigo=None, limite=20):
+        """Tabelas por linha e por nó, ordenadas pelo tempo próprio."""
+        fontes = codigo.splitlines() if codigo else []
+        saida = ["Perfil por linha (tempos em ms; o tempo próprio de um PAR é a espera pelos ramos)",
+                 f"{'linha':>6} {'visitas':>10} {'total':>10} {'próprio':>10}  código"]
+        linhas = sorted(self.por_linha().items(), key=lambda par: par[1][2], reverse=True)
+        for linha, (visitas, total, proprio) in linhas[:limite]:
+            texto = fontes[linha - 1].strip() if linha and linha <= len(fontes) else ''
+            saida.append(f"{linha if linha else '-':>6} {visitas:>10} {total * 1000:>10.3f} "
+                         f"{proprio * 1000:>10.3f}  {texto}")
+        saida += ["", "Perfil por nó",
+                  f"{'nó':<24} {'visitas':>10} {'total':>10} {'próprio':>10}"]
+        nos = sorted(self.por_no().items(), key=lambda par: par[1][2], reverse=True)
+        for (tipo, linha), (visitas, total, proprio) in nos[:limite]:
+            rotulo = tipo if linha is None else f"{tipo}:{linha}"
+            saida.append(f"{rotulo:<24} {visitas:>10} {total * 1000:>10.3f} {proprio * 1000:>10.3f}")
+        return '\n'.join(saida) + '\n'
+
+# --------------------------------------
+# Perfil por amostragem
+# --------------------------------------
+_VISITAR = Executor.visitar.__code__
+_RAMO = Executor._executar_ramo.__code__
+_OPERACOES_CANAL = (nos.Send, nos.Receive, nos.Scatter, nos.Broadcast, nos.Gather)
+_MODULOS_CANAL = ('channels.py', 'multiplex.py')
+
+class PerfilAmostragem:
+    """
+    Amostra a cada `intervalo` segundos, numa thread própria, o nó MiniPar
+    em execução em cada thread. O custo fica na thread de amostragem (e no
+    GIL que ela toma por alguns microssegundos por amostra); o Executor
+    roda sem alteração.
+    """
+    def __init__(self, intervalo=0.01):
+        self.intervalo = intervalo
+        self.amostras = 0          # Amostras de threads executando MiniPar
+        self.custo = 0.0           # Segundos gastos amostrando
+        self.inicio = None
+        self.fim = None
+        self.nos = {}              # {(tipo, linha): amostras como nó mais interno}
+        self.linhas = {}           # {linha: amostras}
+        self.ramos = {}            # {ramo de PAR ou 'principal': amostras}
+        self.canais = {}           # {"canal.receive em _garantir": amostras}
+        self._pilhas = {}          # {caminho: amostras}
+        self._parar = threading.Event()
+        self._thread = None
+
+    def iniciar(self):
+        self.inicio = time.perf_counter()
+        self._thread = threading.Thread(target=self._laco, name='perfil-amostragem', daemon=True)
+        self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+        if self._thread:
+            self._thread.join()
+        self.fim = time.perf_counter()
+
+    def _laco(self):
+        proprio = threading.get_ident()
+        while not self._parar.wait(self.intervalo):
+            inicio = time.perf_counter()
+            for ident, quadro in sys._current_frames().items():
+                if ident != proprio:
+                    self._amostrar(quadro)
+            self.custo += time.perf_counter() - inicio
+
+    def _amostrar(self, quadro):
+        visitados = []   # Nós MiniPar, do mais interno para o mais externo
+        ramo = None
+        funcao_canal = None  # Função mais interna de channels.py/multiplex.py (ex: _garantir = esperando dados)
+        while quadro is not None:
+            codigo = quadro.f_code
+            if funcao_canal is None and not visitados and os.path.basename(codigo.co_filename) in _MODULOS_CANAL:
+                funcao_canal = codigo.co_name
+            if codigo is _VISITAR:
+                visitados.append(quadro.f_locals['no'])
+            elif codigo is _RAMO and ramo is None:
+                stmt = quadro.f_locals['stmt']
+                ramo = f"ramo {type(stmt).__name__}:{stmt.linha}"
+            quadro = quadro.f_back
+        if not visitados:
+            return  # Thread que não está executando MiniPar (ex: envio em segundo plano)
+        self.amostras += 1
+        no = visitados[0]
+        chave = (type(no).__name__, no.linha)
+        self.nos[chave] = self.nos.get(chave, 0) + 1
+        self.linhas[no.linha] = self.linhas.get(no.linha, 0) + 1
+        ramo = ramo or 'principal'
+        self.ramos[ramo] = self.ramos.get(ramo, 0) + 1
+        operacao = next((v for v in visitados if isinstance(v, _OPERACOES_CANAL)), None)
+        if operacao is not None:
+            rotulo = f"{operacao.canal}.{type(operacao).__name__.lower()}"
+            if funcao_canal:
+                rotulo += f" em {funcao_canal}"
+            self.canais[rotulo] = self.canais.get(rotulo, 0) + 1
+        rotulos = [tipo if linha is None else f"{tipo}:{linha}"
+                   for tipo, linha in ((type(v).__name__, v.linha) for v in reversed(visitados))]
+        if ramo != 'principal':
+            rotulos.insert(0, ramo)
+        caminho = ';'.join(rotulos)
+        self._pilhas[caminho] = self._pilhas.get(caminho, 0) + 1
+
+    def pilhas(self):
+        """Pilhas no formato collapsed, com o número de amostras de cada caminho."""
+        return ''.join(f"{caminho} {quantidade}\n" for caminho, quantidade in sorted(dict(self._pilhas).items()))
+
+    def relatorio(self, codigo=None, limite=20):
+        """Amostras por linha, por nó, por ramo de PAR e por operação de canal (pode ser chamado durante a execução)."""
+        fontes = codigo.splitlines() if codigo else []
+        total = max(self.amostras, 1)
+        duracao = (self.fim or time.perf_counter()) - self.inicio
+        saida = [f"Perfil por amostragem: {self.amostras} amostras a cada {self.intervalo * 1000:g} ms, "
+                 f"custo {self.custo * 1000:.1f} ms ({100 * self.custo / max(duracao, 1e-9):.2f}% de {duracao:.2f}s)",
+                 "", f"{'linha':>6} {'amostras':>9} {'%':>6}  código"]
+        for linha, quantidade in sorted(dict(self.linhas).items(), key=lambda par: par[1], reverse=True)[:limite]:
+            texto = fontes[linha - 1].strip() if linha and linha <= len(fontes) else ''
+            saida.append(f"{linha if linha else '-':>6} {quantidade:>9} {100 * quantidade / total:>6.1f}  {texto}")
+        for titulo, tabela in (("nó", {f"{t}:{l}" if l is not None else t: q for (t, l), q in self.nos.items()}),
+                               ("ramo", self.ramos), ("canal", self.canais)):
+            if not tabela:
+                continue
+            saida += ["", f"{titulo:<32} {'amostras':>9} {'%':>6}"]
+            for rotulo, quantidade in sorted(dict(tabela).items(), key=lambda par: par[1], reverse=True)[:limite]:
+                saida.append(f"{rotulo:<32} {quantidade:>9} {100 * quantidade / total:>6.1f}")
+        return '\n'.join(saida) + '\n'
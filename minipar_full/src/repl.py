@@ -0,0 +1,126 @@
+# src/repl.py
+"""
+REPL do MiniPar: um Executor e uma tabela de símbolos vivos durante toda a
+sessão. Cada entrada é analisada sozinha contra o que já foi declarado e só
+ela é executada; nada do que veio antes é analisado de novo.
+
+Uso: python repl.py   (ou python main.py sem programa)
+
+Comandos: :vars, :carregar arquivo.mp, :ajuda, :sair
+"""
+import contextlib
+import io
+import sys
+
+import parser as ps
+import interpreter
+import nos
+from symbol_table import TabelaSimbolos
+
+try:
+    import readline  # noqa: F401 - histórico e edição de linha, quando disponível
+except ImportError:
+    pass
+
+AJUDA = """Digite comandos MiniPar (ex: Int x = 2; output(x);). Blocos podem ocupar várias linhas.
+  :vars               variáveis e valores atuais
+  :carregar ARQUIVO   executa os comandos de um arquivo na sessão
+  :sair               encerra (também Ctrl-D)"""
+
+class Sessao:
+    """Estado da REPL: o Executor (valores) e a tabela do parser (nomes e funções já declarados)."""
+    def __init__(self, saida=None):
+        self.executor = interpreter.Executor(saida=saida)
+        self.tabela = TabelaSimbolos()
+
+    def executar(self, codigo):
+        """Analisa e executa um trecho; retorna False se houve erro na análise (nada é executado)."""
+        global_ = self.tabela.escopo_global
+        anteriores = (dict(global_.simbolos), dict(self.tabela.funcoes))
+        mensagens = io.StringIO()
+        with contextlib.redirect_stdout(mensagens):
+            stmts = ps.analisar_incremental(codigo, self.tabela)
+        self.tabela.escopo_atual = global_
+        if mensagens.getvalue() or stmts is None:
+            # Trecho com erro: a tabela volta a ser a de antes dele
+            print(mensagens.getvalue(), end='')
+            global_.simbolos, self.tabela.funcoes = anteriores
+            return False
+        try:
+            # Canais declarados continuam abertos para os próximos trechos
+            self.executor.executar(nos.BlocoSEQ([s for s in stmts if isinstance(s, nos.No)]), fechar_canais=False)
+        except Exception as e:
+            print(f"Erro durante a execução: {type(e).__name__}: {e}")
+        finally:
+            self._sincronizar()
+        return True
+
+    def _sincronizar(self):
+        """Deixa no parser exatamente as variáveis que existem na execução (um erro pode interromper declarações)."""
+        self.tabela.escopo_global.simbolos = {
+            nome: {'tipo': simbolo['tipo'], 'valor': None}
+            for nome, simbolo in self.executor.tabela.escopo_global.simbolos.items()
+        }
+
+    def variaveis(self):
+        return self.executor.tabela.escopo_global.simbolos
+
+def completo(codigo):
+    """Um trecho está completo quando as chaves fecham e ele termina em ';' ou '}'."""
+    texto = codigo.strip()
+    return texto.count('{') <= texto.count('}') and texto.endswith((';', '}'))
+
+def _comando(sessao, linha):
+    """Trata os comandos iniciados por ':'; retorna False para encerrar."""
+    nome, _, argumento = linha[1:].strip().partition(' ')
+    if nome in ('sair', 'q'):
+        return False
+    if nome == 'vars':
+        for variavel, simbolo in sessao.variaveis().items():
+            print(f"  {simbolo['tipo']} {variavel} = {simbolo['valor']!r}")
+    elif nome == 'carregar' and argumento:
+        try:
+            with open(argumento.strip(), 'r') as arquivo:
+                sessao.executar(arquivo.read())
+        except OSError as e:
+            print(f"Erro: {e}")
+    else:
+        print(AJUDA)
+    return True
+
+def main(saida=None):
+    sessao = Sessao(saida)
+    interativo = sys.stdin.isatty()
+    if interativo:
+        print("MiniPar REPL - :ajuda para os comandos, :sair para encerrar")
+    linhas = []
+    while True:
+        try:
+            linha = input(('... ' if linhas else '>>> ') if interativo else '')
+        except EOFError:
+            break
+        except KeyboardInterrupt:
+            print()
+            linhas = []
+            continue
+        if not linhas and linha.strip().startswith(':'):
+            if not _comando(sessao, linha):
+                break
+            continue
+        linhas.append(linha)
+        codigo = '\n'.join(linhas)
+        # Linha vazia no meio de um trecho força a execução (e mostra o erro, se incompleto)
+        if not codigo.strip():
+            linhas = []
+        elif completo(codigo) or (len(linhas) > 1 and not linha.strip()):
+            linhas = []
+            try:
+                sessao.executar(codigo)
+            except KeyboardInterrupt:
+                print("\nInterrompido")
+    sessao.executor.fechar_canais()
+    if interativo:
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# src/saida.py
+"""
+Destinos da saída dos programas (output). Todo destino também se comporta
+como um arquivo de texto (write/flush), então pode ser usado com
+contextlib.redirect_stdout ou passado ao interpretador legado.
+
+Os ramos de um PAR avisam o destino quando começam e terminam (abrir_ramos,
+entrar, sair, juntar_ramos); só a SaidaBuffer usa esses avisos.
+"""
+import queue
+import sys
+import threading
+
+_FIM = object()  # Sentinela que encerra a leitura de uma SaidaFila
+
+class Saida:
+    """Destino base: recebe trechos de texto na ordem em que são escritos."""
+    def escrever(self, texto):
+        raise NotImplementedError
+
+    def fechar(self):
+        pass
+
+    def esvaziar(self):
+        """Entrega o que estiver em buffer (fim do programa, antes de um input)."""
+        pass
+
+    # Ramos de PAR: abrir_ramos e juntar_ramos na thread do PAR, entrar e sair na thread do ramo
+    def abrir_ramos(self, quantidade):
+        return [None] * quantidade
+
+    def entrar(self, ramo):
+        pass
+
+    def sair(self, ramo):
+        pass
+
+    def juntar_ramos(self, ramos):
+        pass
+
+    def write(self, texto):
+        self.escrever(texto)
+        return len(texto)
+
+    def flush(self):
+        pass
+
+class SaidaPadrao(Saida):
+    """Escreve no sys.stdout atual (o comportamento de sempre do interpretador)."""
+    def escrever(self, texto):
+        sys.stdout.write(texto)
+
+class SaidaLista(Saida):
+    """Guarda tudo em memória."""
+    def __init__(self):
+        self.trechos = []
+        self._trava = threading.Lock()
+
+    def escrever(self, texto):
+        with self._trava:
+            self.trechos.append(texto)
+
+    def valor(self):
+        with self._trava:
+            return ''.join(self.trechos)
+
+class SaidaFila(Saida):
+    """
+    Saída consumida por outra thread enquanto o programa roda (streaming).
+    O buffer é limitado: se o consumidor atrasar, quem escreve bloqueia em
+    vez de acumular memória sem limite.
+    """
+    def __init__(self, capacidade=256):
+        self._fila = queue.Queue(maxsize=capacidade)
+
+    def escrever(self, texto):
+        if texto:
+            self._fila.put(texto)
+
+    def fechar(self):
+        self._fila.put(_FIM)
+
+    def lotes(self, maximo=64 * 1024):
+        """Gera o texto disponível agrupado (até `maximo` caracteres) até a saída ser fechada."""
+        while True:
+            item = self._fila.get()
+            if item is _FIM:
+                return
+            lote, tamanho = [item], len(item)
+            while tamanho < maximo:
+                try:
+                    item = self._fila.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _FIM:
+                    yield ''.join(lote)
+                    return
+                lote.append(item)
+                tamanho += len(item)
+            yield ''.join(lote)
+
+class _Buffer:
+    """Texto pendente de uma thread (ou de um ramo de PAR)."""
+    def __init__(self, rotulo=None, pai=None):
+        self.trechos = []
+        self.tamanho = 0
+        self.rotulo = rotulo        # Ex: '2.1' = primeiro ramo do PAR dentro do segundo ramo
+        self.pai = pai
+        self.inicio_linha = True
+
+class SaidaBuffer(Saida):
+    """
+    Buffer por thread na frente de outro destino: cada thread acumula seu
+    texto e entrega em blocos de até `tamanho` caracteres (sempre em linhas
+    inteiras), sem disputar o destino a cada output.
+
+    marcar: prefixa cada linha com o ramo do PAR que a escreveu ([1], [2.1]...).
+    ordenada: a saída de cada ramo só sai quando ele termina e na ordem dos
+    ramos no código, então fica contígua e igual em toda execução (mas um PAR
+    longo só mostra sua saída no final).
+    """
+    def __init__(self, destino=None, tamanho=64 * 1024, marcar=False, ordenada=False):
+        self.destino = destino or SaidaPadrao()
+        self.tamanho = tamanho
+        self.marcar = marcar
+        self.ordenada = ordenada
+        self._local = threading.local()
+        self._trava = threading.Lock()  # Uma entrega por vez no destino
+
+    def _atual(self):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._local.buffer = _Buffer()
+        return buffer
+
+    def escrever(self, texto):
+        buffer = self._atual()
+        if self.marcar and buffer.rotulo:
+            texto = self._com_rotulo(buffer, texto)
+        buffer.trechos.append(texto)
+        buffer.tamanho += len(texto)
+        if buffer.tamanho >= self.tamanho and not self._retido(buffer):
+            self._descarregar(buffer, linhas_inteiras=True)
+
+    def _com_rotulo(self, buffer, texto):
+        partes = []
+        for i, linha in enumerate(texto.split('\n')):
+            if i:
+                partes.append('\n')
+                buffer.inicio_linha = True
+            if linha:
+                if buffer.inicio_linha:
+                    partes.append(f"[{buffer.rotulo}] ")
+                    buffer.inicio_linha = False
+                partes.append(linha)
+        return ''.join(partes)
+
+    def _retido(self, buffer):
+        """No modo ordenado, a saída de um ramo espera o ramo (e os anteriores) terminarem."""
+        return self.ordenada and buffer.pai is not None
+
+    def _descarregar(self, buffer, linhas_inteiras=False):
+        texto = ''.join(buffer.trechos)
+        resto = ''
+        if linhas_inteiras:
+            corte = texto.rfind('\n') + 1
+            texto, resto = texto[:corte], texto[corte:]
+        buffer.trechos = [resto] if resto else []
+        buffer.tamanho = len(resto)
+        if texto:
+            with self._trava:
+                self.destino.escrever(texto)
+
+    def abrir_ramos(self, quantidade):
+        pai = self._atual()
+        if not self._retido(pai):
+            self._descarregar(pai)  # O que foi escrito antes do PAR sai antes dos ramos
+        prefixo = f"{pai.rotulo}." if pai.rotulo else ''
+        return [_Buffer(f"{prefixo}{i + 1}", pai) for i in range(quantidade)]
+
+    def entrar(self, ramo):
+        self._local.buffer = ramo
+
+    def sair(self, ramo):
+        self._local.buffer = None
+        if not self.ordenada:
+            self._descarregar(ramo)
+
+    def juntar_ramos(self, ramos):
+        if not self.ordenada:
+            return
+        # Na thread do PAR: passa a saída dos ramos, em ordem, para o buffer de quem executou o PAR
+        pai = self._atual()
+        for ramo in ramos:
+            pai.trechos.extend(ramo.trechos)
+            pai.tamanho += ramo.tamanho
+        if pai.tamanho >= self.tamanho and not self._retido(pai):
+            self._descarregar(pai, linhas_inteiras=True)
+
+    def esvaziar(self):
+        """Entrega o buffer desta thread (os ramos de PAR entregam o seu ao terminar)."""
+        buffer = self._atual()
+        if not self._retido(buffer):
+            self._descarregar(buffer)
+        self.destino.esvaziar()
+        self.destino.flush()
+
+    def flush(self):
+        self.esvaziar()
@@ -0,0 +1,330 @@
+# src/servico.py
+"""
+Serviço HTTP local de execução para a IDE (IDE/index.html).
+
+O processo principal mantém o parser carregado e um cache de programas já
+analisados; a execução acontece num pool de processos criados de antemão
+(fork depois dos imports; os substitutos vêm de um forkserver), então cada
+pedido não paga o custo de iniciar o Python, importar o PLY e montar as
+tabelas do parser.
+
+Uso: python servico.py [--porta 8765] [--trabalhadores N] [--limite 10]
+
+POST /executar         {"codigo": "...", "entrada": "..."}  ->  {"saida": "...", "erros": "...", ...}
+POST /executar/fluxo   o mesmo pedido; a resposta vem em partes, um objeto JSON por
+                       linha ({"saida"}, {"erros"}, ... {"fim"}) enquanto o programa roda
+GET  /                 a IDE
+GET  /saude            estado do pool e do cache
+
+Os POST só são aceitos com Content-Type: application/json e com Host (e
+Origin, quando o navegador a envia) apontando para o próprio serviço, então
+uma página de outro site não consegue executar programas por ele.
+"""
+import argparse
+import collections
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import multiprocessing.forkserver
+import os
+import pickle
+import queue
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import parser as ps
+import interpreter
+import metricas
+from saida import SaidaFila
+
+IDE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'IDE', 'index.html')
+TAMANHO_CACHE = 256        # Programas analisados mantidos em memória
+LIMITE_CODIGO = 1 << 20    # Bytes aceitos por pedido
+CAPACIDADE_SAIDA = 256     # Trechos de saída em buffer por execução antes de o programa esperar
+
+# --------------------------------------
+# Análise com cache
+# --------------------------------------
+class CacheProgramas:
+    """Árvores sintáticas por hash do código (LRU); o parser não é reentrante, então a análise é serializada."""
+    def __init__(self, tamanho=TAMANHO_CACHE):
+        self.tamanho = tamanho
+        self.programas = collections.OrderedDict()  # {hash: (árvore serializada, mensagens do parser)}
+        self.acertos = 0
+        self.faltas = 0
+        self._trava = threading.Lock()
+
+    def obter(self, codigo):
+        """Retorna (árvore serializada ou None, mensagens do parser, veio do cache)."""
+        chave = hashlib.sha256(codigo.encode()).hexdigest()
+        with self._trava:
+            if chave in self.programas:
+                self.programas.move_to_end(chave)
+                self.acertos += 1
+                return self.programas[chave] + (True,)
+            self.faltas += 1
+            mensagens = io.StringIO()
+            with contextlib.redirect_stdout(mensagens):
+                arvore = ps.analisar(codigo)
+            compilado = (pickle.dumps(arvore) if arvore else None, mensagens.getvalue())
+            self.programas[chave] = compilado
+            if len(self.programas) > self.tamanho:
+                self.programas.popitem(last=False)
+            return compilado + (False,)
+
+# --------------------------------------
+# Pool de processos de execução
+# --------------------------------------
+def _executar(arvore, entrada, saida):
+    """
+    Executa um programa já analisado; a saída (e as mensagens de erro) vão
+    para `saida`. `entrada` é o texto do stdin ou um objeto de arquivo.
+    """
+    sys.stdin = io.StringIO(entrada) if isinstance(entrada, str) else entrada
+    metricas.reiniciar()  # Os canais de execuções anteriores não acumulam no processo
+    executor = interpreter.Executor(saida=saida)
+    with contextlib.redirect_stdout(saida):
+        try:
+            executor.executar(arvore)
+        except Exception as e:
+            print(f"Erro durante a execução: {type(e).__name__}: {e}")
+    # Os canais abertos pelo programa são fechados pelo próprio executar
+    saida.fechar()
+
+def _laco_processo(conexao):
+    """Executa pedidos, repassando a saída em trechos enquanto o programa roda."""
+    while True:
+        try:
+            arvore, entrada = conexao.recv()
+        except EOFError:
+            return
+        inicio = time.perf_counter()
+        saida = SaidaFila(CAPACIDADE_SAIDA)
+        execucao = threading.Thread(target=_executar, args=(pickle.loads(arvore), entrada, saida), daemon=True)
+        execucao.start()
+        for lote in saida.lotes():
+            conexao.send(('saida', lote))  # Bloqueia se o cliente HTTP não estiver lendo
+        execucao.join()
+        conexao.send(('fim', time.perf_counter() - inicio))
+
+class _Processo:
+    def __init__(self, contexto, alvo):
+        self.conexao, filho = contexto.Pipe()
+        self.processo = contexto.Process(target=alvo, args=(filho,), daemon=True)
+        self.processo.start()
+        filho.close()
+
+    def encerrar(self):
+        self.processo.terminate()
+        self.processo.join()
+        self.conexao.close()
+
+class PoolExecucao:
+    """
+    Processos de execução criados de antemão. Se um pedido não termina
+    (limite de tempo, falha ou cliente que desistiu no meio), o processo é
+    encerrado e substituído por um novo.
+
+    `alvo` é o laço executado em cada processo: recebe pedidos pela conexão
+    e responde com zero ou mais eventos, o último do tipo 'fim'.
+    """
+    def __init__(self, quantidade, alvo=_laco_processo):
+        # Os primeiros processos são criados com fork, ainda sem outros threads
+        # no processo; as substituições acontecem nos threads que atendem os
+        # pedidos, onde fork pode herdar travas presas, então vêm do forkserver
+        # (iniciado aqui, já com o parser e o interpretador importados).
+        self._contexto = multiprocessing.get_context('fork')
+        self._contexto_substitutos = multiprocessing.get_context('forkserver')
+        self._contexto_substitutos.set_forkserver_preload(['parser', 'interpreter'])
+        multiprocessing.forkserver.ensure_running()
+        self._alvo = alvo
+        self._livres = queue.Queue()
+        self.quantidade = quantidade
+        for _ in range(quantidade):
+            self._livres.put(_Processo(self._contexto, alvo))
+
+    def executar(self, pedido, limite):
+        """Gera os eventos do pedido ((tipo, valor)) até o ('fim', ...), em no máximo `limite` segundos."""
+        processo = self._livres.get()
+        concluido = False
+        try:
+            processo.conexao.send(pedido)
+            prazo = time.monotonic() + limite
+            while not concluido:
+                if not processo.conexao.poll(max(0, prazo - time.monotonic())):
+                    raise TimeoutError(f"Execução excedeu {limite}s")
+                tipo, valor = processo.conexao.recv()
+                concluido = tipo == 'fim'
+                yield tipo, valor
+        finally:
+            if not concluido:
+                processo.encerrar()
+                processo = _Processo(self._contexto_substitutos, self._alvo)
+            self._livres.put(processo)
+
+    def livres(self):
+        return self._livres.qsize()
+
+    def encerrar(self):
+        for _ in range(self.quantidade):
+            self._livres.get().encerrar()
+
+# --------------------------------------
+# HTTP
+# --------------------------------------
+class Servico:
+    def __init__(self, trabalhadores, limite):
+        self.cache = CacheProgramas()
+        self.pool = PoolExecucao(trabalhadores)
+        self.limite = limite
+
+    def eventos(self, codigo, entrada=''):
+        """
+        Analisa (ou busca no cache) e executa um programa, gerando eventos:
+        {'erros': ...} do parser, {'saida': ...} enquanto o programa escreve
+        e, por último, {'fim': True, ...} com os tempos.
+        """
+        inicio = time.perf_counter()
+        arvore, erros, em_cache = self.cache.obter(codigo)
+        if erros:
+            yield {'erros': erros}
+        fim = {'fim': True, 'cache': em_cache}
+        if arvore is not None:
+            execucao = self.pool.executar((arvore, entrada), self.limite)
+            try:
+                for tipo, valor in execucao:
+                    if tipo == 'saida':
+                        yield {'saida': valor}
+                    else:
+                        fim['segundos_execucao'] = valor
+            except TimeoutError as e:
+                yield {'erros': f"{e}\n"}
+            except (EOFError, OSError) as e:
+                yield {'erros': f"Processo de execução falhou: {e}\n"}
+            finally:
+                execucao.close()
+        fim['segundos'] = time.perf_counter() - inicio
+        yield fim
+
+    def executar(self, codigo, entrada=''):
+        """Executa até o fim e retorna a saída completa."""
+        resposta = {'saida': '', 'erros': ''}
+        for evento in self.eventos(codigo, entrada):
+            resposta['saida'] += evento.pop('saida', '')
+            resposta['erros'] += evento.pop('erros', '')
+            evento.pop('fim', None)
+            resposta.update(evento)
+        return resposta
+
+def hosts_do_servico(host, porta):
+    """Valores de Host aceitos; None (qualquer um) quando o serviço escuta em todas as interfaces."""
+    if host in ('', '0.0.0.0', '::'):
+        return None
+    nomes = {host}
+    if host in ('127.0.0.1', 'localhost', '::1'):
+        nomes |= {'127.0.0.1', 'localhost', '[::1]'}
+    return {f"{nome}:{porta}" for nome in nomes}
+
+class ManipuladorHTTP(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Necessário para a resposta em partes (chunked)
+    servico = None  # Definido em main()
+    hosts = None    # Valores de Host aceitos nos POST (ver hosts_do_servico)
+
+    def do_GET(self):
+        if self.path in ('/', '/index.html'):
+            with open(IDE, 'rb') as arquivo:
+                self._responder(200, arquivo.read(), 'text/html; charset=utf-8')
+        elif self.path == '/saude':
+            cache = self.servico.cache
+            self._responder_json(200, {
+                'trabalhadores': self.servico.pool.quantidade,
+                'livres': self.servico.pool.livres(),
+                'programas_em_cache': len(cache.programas),
+                'acertos_cache': cache.acertos,
+                'faltas_cache': cache.faltas,
+            })
+        else:
+            self._responder_json(404, {'erro': 'não encontrado'})
+
+    def do_POST(self):
+        if self.path not in ('/executar', '/executar/fluxo'):
+            return self._responder_json(404, {'erro': 'não encontrado'})
+        tipo = self.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if tipo != 'application/json':
+            return self._responder_json(415, {'erro': 'esperado Content-Type: application/json'})
+        if not self._mesma_origem():
+            return self._responder_json(403, {'erro': 'pedido de outra origem'})
+        tamanho = int(self.headers.get('Content-Length', 0))
+        if tamanho > LIMITE_CODIGO:
+            return self._responder_json(413, {'erro': 'programa grande demais'})
+        try:
+            pedido = json.loads(self.rfile.read(tamanho) or b'{}')
+            codigo = pedido['codigo']
+        except (ValueError, KeyError, TypeError):
+            return self._responder_json(400, {'erro': 'esperado JSON com o campo "codigo"'})
+        if self.path == '/executar':
+            return self._responder_json(200, self.servico.executar(codigo, pedido.get('entrada', '')))
+        # Fluxo: um objeto JSON por linha, enviado assim que a saída é produzida
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        eventos = self.servico.eventos(codigo, pedido.get('entrada', ''))
+        try:
+            for evento in eventos:
+                linha = json.dumps(evento).encode() + b'\n'
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(linha), linha))
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # O cliente desistiu; a execução é interrompida
+        finally:
+            eventos.close()
+
+    def _mesma_origem(self):
+        """Host é o do serviço (contra DNS rebinding) e a Origin, se houver, é a da própria IDE."""
+        host = self.headers.get('Host', '')
+        if self.hosts is not None and host not in self.hosts:
+            return False
+        origem = self.headers.get('Origin')
+        return origem is None or origem == f"http://{host}"
+
+    def _responder_json(self, status, corpo):
+        self._responder(status, json.dumps(corpo).encode(), 'application/json')
+
+    def _responder(self, status, corpo, tipo):
+        self.send_response(status)
+        self.send_header('Content-Type', tipo)
+        self.send_header('Content-Length', str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, formato, *args):
+        pass  # Sem uma linha no terminal por pedido
+
+def main():
+    argumentos = argparse.ArgumentParser(description="Serviço HTTP de execução do MiniPar")
+    argumentos.add_argument('--host', default='127.0.0.1')
+    argumentos.add_argument('--porta', type=int, default=8765)
+    argumentos.add_argument('--trabalhadores', type=int, default=os.cpu_count() or 2,
+                            help="processos de execução criados de antemão")
+    argumentos.add_argument('--limite', type=float, default=10.0, help="segundos máximos por execução")
+    opcoes = argumentos.parse_args()
+
+    ManipuladorHTTP.servico = Servico(opcoes.trabalhadores, opcoes.limite)
+    ManipuladorHTTP.hosts = hosts_do_servico(opcoes.host, opcoes.porta)
+    servidor = ThreadingHTTPServer((opcoes.host, opcoes.porta), ManipuladorHTTP)
+    print(f"[servico] IDE em http://{opcoes.host}:{opcoes.porta}/ ({opcoes.trabalhadores} trabalhadores)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        ManipuladorHTTP.servico.pool.encerrar()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# src/textos.py
+"""
+Concatenação de strings em laços: s = s + pedaço copia s inteira a cada
+passo (str é imutável e a variável ainda a referencia), O(n²) no total.
+
+A partir de LIMIAR caracteres, o + do Executor devolve um Texto: uma rope
+(árvore de concatenações) em que + custa O(1). O texto só é montado, uma
+vez e em O(n), quando é usado como string: output, send, comparação,
+índice, hash. len não monta nada.
+"""
+LIMIAR = 256  # Tamanho da string da esquerda a partir do qual + cria um Texto
+
+class Texto:
+    __slots__ = ('esquerda', 'direita', 'tamanho', '_valor')
+
+    def __init__(self, esquerda, direita):
+        self.esquerda = esquerda  # str ou Texto
+        self.direita = direita
+        self.tamanho = len(esquerda) + len(direita)
+        self._valor = None        # A string montada (depois da primeira vez)
+
+    def __str__(self):
+        if self._valor is None:
+            partes = []
+            pilha = [self]  # Sem recursão: a árvore de um laço tem um nível por pedaço
+            while pilha:
+                no = pilha.pop()
+                if type(no) is not Texto:
+                    partes.append(no)
+                elif no._valor is not None:
+                    partes.append(no._valor)
+                else:
+                    pilha.append(no.direita)
+                    pilha.append(no.esquerda)
+            self._valor = ''.join(partes)
+            self.esquerda = self.direita = None  # Os pedaços já estão em _valor
+        return self._valor
+
+    def __add__(self, outro):
+        if isinstance(outro, (str, Texto)):
+            return Texto(self, outro)
+        return NotImplemented
+
+    def __radd__(self, outro):
+        if isinstance(outro, str):
+            return Texto(outro, self)
+        return NotImplemented
+
+    def __mul__(self, vezes):
+        return str(self) * vezes
+
+    __rmul__ = __mul__
+
+    def __len__(self):
+        return self.tamanho
+
+    def __getitem__(self, indice):
+        return str(self)[indice]
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __contains__(self, trecho):
+        return valor(trecho) in str(self)
+
+    def _comparar(self, outro, comparacao):
+        if isinstance(outro, (str, Texto)):
+            return comparacao(str(self), str(outro))
+        return NotImplemented
+
+    def __eq__(self, outro):
+        return self._comparar(outro, str.__eq__)
+
+    def __ne__(self, outro):
+        return self._comparar(outro, str.__ne__)
+
+    def __lt__(self, outro):
+        return self._comparar(outro, str.__lt__)
+
+    def __le__(self, outro):
+        return self._comparar(outro, str.__le__)
+
+    def __gt__(self, outro):
+        return self._comparar(outro, str.__gt__)
+
+    def __ge__(self, outro):
+        return self._comparar(outro, str.__ge__)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __reduce__(self):
+        return (str, (str(self),))  # Serializado (pickle) como str: o outro lado não precisa de Texto
+
+def valor(x):
+    """x montado como str se for um Texto; qualquer outro valor volta sem mudança."""
+    return str(x) if type(x) is Texto else x
@@ -0,0 +1,255 @@
+# src/tipos.py
+"""
+Inferência de tipos: antes da execução, anota cada expressão com o tipo que
+ela garantidamente produz (`tipo_inferido`) e troca BinOp e Comparacao entre
+números (com ao menos um operando que é variável, literal ou outra operação
+especializada) por nós especializados (BinOpInt, BinOpFloat,
+ComparacaoNumerica).
+
+O Executor não confere os tipos declarados (Int x = 2.5; guarda um float),
+então o tipo de uma variável é a junção dos tipos de tudo o que o programa
+atribui a ela; o de um parâmetro, a junção dos argumentos de todas as
+chamadas; o de uma função, a junção dos seus returns. Tudo é calculado até
+um ponto fixo (os tipos só sobem: nada -> int -> num -> desconhecido).
+
+Tipos: 'int', 'float', 'num' (int ou float), 'str', 'bool', 'list', 'map',
+'set', 'range'; None é desconhecido.
+"""
+import nativas
+import nos
+
+_NADA = object()  # Nenhuma atribuição vista ainda (neutro da junção)
+NUMEROS = ('int', 'float', 'num')
+
+def juntar(a, b):
+    """Menor tipo que cobre a e b."""
+    if a is _NADA:
+        return b
+    if b is _NADA or a == b:
+        return a
+    if a in NUMEROS and b in NUMEROS:
+        return 'num'
+    return None
+
+def _tipo_aritmetica(op, esquerda, direita):
+    if _NADA in (esquerda, direita):
+        return _NADA
+    if esquerda in NUMEROS and direita in NUMEROS:
+        if op == '/':
+            return 'float'
+        if esquerda == direita == 'int':
+            return 'int'
+        return 'float' if 'float' in (esquerda, direita) else 'num'
+    if op == '+' and esquerda == direita and esquerda in ('str', 'list'):
+        return esquerda
+    return None
+
+_ELEMENTOS = {'Int': 'int', 'Float': 'float'}
+
+def _declarado(no):
+    """Tipo declarado de uma variável (como o parser guarda: 'Int', ('List', 'Float')...) ou de um índice dela."""
+    if type(no) is nos.ID:
+        return no.tipo
+    if type(no) is nos.Indice:
+        tipo = _declarado(no.lista)
+        if isinstance(tipo, tuple) and tipo[0] == 'Matrix':
+            return ('List', tipo[1])  # m[i] é uma linha
+        if isinstance(tipo, tuple) and tipo[0] in ('Map', 'Set'):
+            return None  # Os valores de um Map não são convertidos para o tipo declarado
+        return tipo[1] if isinstance(tipo, tuple) else None
+    return None
+
+def _tipo_elemento(no):
+    """Tipo da variável de um for que percorre `no`."""
+    if no.tipo_inferido is _NADA:
+        return _NADA
+    if no.tipo_inferido == 'str':
+        return 'str'
+    if no.tipo_inferido == 'range':
+        return 'int'  # range só aceita inteiros (iteradores.py)
+    tipo = _declarado(no)
+    if isinstance(tipo, tuple) and tipo[0] == 'List' and isinstance(tipo[1], str):
+        return _ELEMENTOS.get(tipo[1])  # List<Int>/List<Float> guardam só int/float
+    return None
+
+def _percorrer(no):
+    pilha = [no]
+    while pilha:
+        no = pilha.pop()
+        yield no
+        pilha.extend(no.filhos())
+
+def _locais(funcao):
+    """Nomes declarados dentro de uma função (parâmetros incluídos): vivem no escopo dela."""
+    nomes = {param['nome'] for param in funcao.params}
+    for no in _percorrer(nos.BlocoSEQ(funcao.stmts)):
+        if type(no) in (nos.DeclaracaoVariavel, nos.For):
+            nomes.add(no.id)
+    return nomes
+
+def _sempre_retorna(stmts):
+    """Se todo caminho pelos comandos termina num return (senão a função pode devolver None)."""
+    if not stmts:
+        return False
+    ultimo = stmts[-1]
+    if type(ultimo) is nos.Return:
+        return True
+    return type(ultimo) is nos.If and _sempre_retorna(ultimo.entao) and _sempre_retorna(ultimo.senao)
+
+class _Inferencia:
+    """
+    Estado de uma inferência. As chaves dos tipos são o nome (variável
+    global), (função, nome) para variáveis locais e (função, None) para o
+    retorno da função.
+    """
+    def __init__(self, arvore):
+        self.arvore = arvore
+        self.funcoes = {no.nome: no for no in _percorrer(arvore) if type(no) is nos.DefFuncao}
+        self.locais = {nome: _locais(funcao) for nome, funcao in self.funcoes.items()}
+        self.tipos = None     # Resultado da rodada anterior (None na primeira)
+        self.escritas = {}    # Junção dos tipos escritos em cada chave na rodada atual
+
+    def executar(self):
+        while True:
+            self.escritas = {}
+            self._anotar(self.arvore, None)
+            if self.escritas == self.tipos:
+                break
+            self.tipos = self.escritas
+        for no in _percorrer(self.arvore):
+            if no.tipo_inferido is _NADA:
+                no.tipo_inferido = None  # Só depende de si mesma (ex: x = x + 1 sem outra origem)
+        return {chave: None if tipo is _NADA else tipo for chave, tipo in self.tipos.items()}
+
+    def _chave(self, nome, funcao):
+        return (funcao, nome) if funcao and nome in self.locais[funcao] else nome
+
+    def _ler(self, chave):
+        if self.tipos is None:
+            return self.escritas.get(chave, _NADA)  # Primeira rodada: parte de "nada" para subir até o ponto fixo
+        return self.tipos.get(chave)  # Sem escrita nesta árvore (ex: outro trecho da REPL): desconhecido
+
+    def _escrever(self, chave, tipo):
+        self.escritas[chave] = juntar(self.escritas.get(chave, _NADA), tipo)
+
+    def _anotar(self, no, funcao):
+        """Anota `no` e seus filhos (`funcao`: nome da função em que o nó está, ou None)."""
+        classe = type(no)
+        dentro = no.nome if classe is nos.DefFuncao else funcao
+        for filho in no.filhos():
+            self._anotar(filho, dentro)
+        no.tipo_inferido = self._tipo(no, funcao)
+
+        if classe in (nos.DeclaracaoVariavel, nos.Atribuicao):
+            self._escrever(self._chave(no.id, funcao), no.expr.tipo_inferido if no.expr else None)
+        elif classe is nos.AtribuicaoComposta and not no.indices:
+            chave = self._chave(no.id, funcao)
+            self._escrever(chave, _tipo_aritmetica(no.op, self._ler(chave), no.expr.tipo_inferido))
+        elif classe is nos.For:
+            self._escrever(self._chave(no.id, funcao), _tipo_elemento(no.expr))
+        elif classe is nos.Receive:
+            self._escrever(self._chave(no.variavel, funcao), None)
+        elif classe is nos.Gather:
+            self._escrever(self._chave(no.variavel, funcao), 'list')
+        elif classe is nos.Return and funcao:
+            self._escrever((funcao, None), no.expr.tipo_inferido)
+        elif classe is nos.DefFuncao:
+            for param in no.params:
+                self._escrever((no.nome, param['nome']), _NADA)  # Sem chamadas: fica desconhecido
+            if not _sempre_retorna(no.stmts):
+                self._escrever((no.nome, None), None)
+        elif classe is nos.ChamadaFuncao and no.nome in self.funcoes:
+            for param, arg in zip(self.funcoes[no.nome].params, no.args):
+                self._escrever((no.nome, param['nome']), arg.tipo_inferido)
+        elif classe is nos.ChamadaFuncao and no.nome in nativas.ARGUMENTOS_FUNCAO:
+            # sort(v, "f"): f é chamada pela nativa, com argumentos que a inferência não vê
+            posicao = nativas.ARGUMENTOS_FUNCAO[no.nome]
+            if len(no.args) > posicao and type(no.args[posicao]) is nos.String and no.args[posicao].valor in self.funcoes:
+                for param in self.funcoes[no.args[posicao].valor].params:
+                    self._escrever((no.args[posicao].valor, param['nome']), None)
+
+    def _tipo(self, no, funcao):
+        """Tipo de um nó a partir dos tipos (já anotados) dos filhos."""
+        classe = type(no)
+        if classe is nos.Numero:
+            return 'int' if type(no.valor) is int else 'float'
+        if classe is nos.String:
+            return 'str'
+        if classe is nos.Bool:
+            return 'bool'
+        if classe is nos.ID:
+            return self._ler(self._chave(no.nome, funcao))
+        if isinstance(no, nos.BinOp):
+            return _tipo_aritmetica(no.op, no.esquerda.tipo_inferido, no.direita.tipo_inferido)
+        if isinstance(no, nos.Comparacao):
+            return 'bool'
+        if classe is nos.Lista:
+            return 'list'
+        if classe is nos.Mapa:
+            return 'map'
+        if classe is nos.Indice:
+            if no.lista.tipo_inferido == 'str':
+                return 'str'
+            # List<Int>/List<Float> guardam só int/float (listas.py)
+            tipo = _declarado(no)
+            return _ELEMENTOS.get(tipo) if isinstance(tipo, str) else None
+        if classe is nos.Fatia:
+            return no.lista.tipo_inferido if no.lista.tipo_inferido in ('str', 'list') else None
+        if classe is nos.Input:
+            return 'str'
+        if classe is nos.ChamadaFuncao:
+            if no.nome in self.funcoes:
+                return self._ler((no.nome, None))
+            tipos_args = [arg.tipo_inferido for arg in no.args]
+            return _NADA if _NADA in tipos_args else nativas.tipo_retorno(no.nome, tipos_args)
+        return None
+
+def inferir(arvore):
+    """Anota as expressões da árvore e retorna os tipos das variáveis ({nome ou (função, nome): tipo})."""
+    return _Inferencia(arvore).executar()
+
+# --------------------------------------
+# Especialização
+# --------------------------------------
+_OPERACOES = (nos.BinOp, nos.Comparacao)
+
+def _especializavel(no):
+    """
+    Operação entre números com pelo menos um operando lido direto pelo nó
+    especializado (variável, literal ou outra operação especializada). Um
+    operando como v[i] ou f(x) passa por _operando antes do mesmo visitar;
+    com os dois assim, o nó especializado fica mais lento que o genérico.
+    """
+    return (no.esquerda.tipo_inferido in NUMEROS and no.direita.tipo_inferido in NUMEROS
+            and (_lido_direto(no.esquerda) or _lido_direto(no.direita)))
+
+def _lido_direto(no):
+    classe = type(no)
+    return classe is nos.ID or classe is nos.Numero or (classe in _OPERACOES and _especializavel(no))
+
+def _especializado(no):
+    """Nó especializado equivalente a `no`, ou o próprio `no`."""
+    classe = type(no)
+    if classe not in _OPERACOES or not _especializavel(no):
+        return no
+    tipos = (no.esquerda.tipo_inferido, no.direita.tipo_inferido)
+    if classe is nos.Comparacao:
+        novo = nos.ComparacaoNumerica(no.op, no.esquerda, no.direita, linha=no.linha)
+    elif tipos == ('int', 'int'):
+        novo = nos.BinOpInt(no.op, no.esquerda, no.direita, linha=no.linha)
+    else:
+        novo = nos.BinOpFloat(no.op, no.esquerda, no.direita, linha=no.linha)
+    novo.tipo_inferido = no.tipo_inferido
+    return novo
+
+def especializar(arvore):
+    """Infere os tipos e troca, na própria árvore, as operações numéricas pelos nós especializados."""
+    inferir(arvore)
+    for no in _percorrer(arvore):
+        for campo in no.campos:
+            valor = getattr(no, campo)
+            if isinstance(valor, nos.No):
+                setattr(no, campo, _especializado(valor))
+            elif isinstance(valor, list):
+                valor[:] = [_especializado(item) if isinstance(item, nos.No) else item for item in valor]
+    return arvore
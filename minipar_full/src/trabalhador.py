@@ -0,0 +1,119 @@
+# src/trabalhador.py
+"""
+Trabalhador para PAR distribuído: recebe ramos de PAR de um coordenador
+(main.py --trabalhadores ...), executa e devolve as escritas.
+
+Uso: python trabalhador.py <porta> [--host HOST] [--metricas ARQUIVO]
+
+Os quadros são autenticados com a chave de MINIPAR_CHAVE (ver distribuido.py);
+sem ela, só é possível escutar em endereços de loopback.
+"""
+import argparse
+import copy
+import socket
+import sys
+import threading
+import distribuido
+import metricas
+from channels import Canal
+from interpreter import Executor
+
+class ExecutorRemoto(Executor):
+    """Executor que guarda a saída para devolvê-la ao coordenador."""
+    def __init__(self):
+        super().__init__()
+        self.linhas = []
+
+    def escrever(self, texto):
+        self.linhas.append(texto)
+
+def executar_ramo(pedido):
+    """Executa um ramo com as variáveis capturadas e monta a resposta."""
+    executor = ExecutorRemoto()
+    executor.funcoes.update(pedido.get('funcoes', {}))  # Funções do programa chamadas pelo ramo
+    escopo = executor.tabela.escopo_global
+    variaveis = pedido['variaveis']
+    iniciais = copy.deepcopy(variaveis)
+    for nome, (tipo, valor) in variaveis.items():
+        escopo.declarar_variavel(nome, tipo, valor)
+    erro = None
+    try:
+        executor.visitar(pedido['ramo'])
+    except Exception as e:
+        erro = f"{type(e).__name__}: {e}"
+    escritas = {
+        nome: (simbolo['tipo'], simbolo['valor'])
+        for nome, simbolo in escopo.simbolos.items()
+        if nome not in iniciais or simbolo['valor'] != iniciais[nome][1]
+    }
+    return {'id': pedido['id'], 'escritas': escritas, 'saida': executor.linhas, 'erro': erro}
+
+class Trabalhador:
+    def __init__(self, host, porta, chave=None):
+        self.host = host
+        self.porta = porta
+        self.chave = distribuido.chave_configurada() if chave is None else chave
+        if not self.chave and not distribuido.endereco_local(host):
+            raise ValueError(f"sem a chave em {distribuido.VARIAVEL_CHAVE}, o trabalhador só escuta em "
+                             f"loopback (recebido --host {host})")
+        self.ativos = 0  # Ramos recebidos e ainda não concluídos
+        self._trava_contagem = threading.Lock()
+        self._trava_execucao = threading.Lock()  # Um ramo por vez (um trabalhador por núcleo)
+
+    def servir(self):
+        """Aceita coordenadores indefinidamente, um thread por conexão."""
+        servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        servidor.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        servidor.bind((self.host, self.porta))
+        servidor.listen()
+        print(f"[trabalhador] Aguardando ramos em {self.host}:{self.porta}...")
+        try:
+            while True:
+                conexao, endereco = servidor.accept()
+                threading.Thread(target=self._atender, args=(conexao, endereco), daemon=True).start()
+        finally:
+            servidor.close()
+
+    def _atender(self, conexao, endereco):
+        """Atende os pedidos de um coordenador até ele fechar a conexão."""
+        canal = Canal(f"coordenador-{endereco[0]}:{endereco[1]}", *endereco)
+        canal.connection = conexao
+        while True:
+            try:
+                pedido = distribuido.desempacotar(canal.receber_bytes(), self.chave)
+            except distribuido.ErroAutenticacao as e:
+                print(f"[trabalhador] Conexão de {endereco[0]}:{endereco[1]} recusada: {e}")
+                break
+            except ConnectionError:
+                break
+            with self._trava_contagem:
+                self.ativos += 1
+            with self._trava_execucao:
+                resposta = executar_ramo(pedido)
+            with self._trava_contagem:
+                self.ativos -= 1
+                resposta['carga'] = self.ativos
+            canal.enviar_bytes(distribuido.empacotar(resposta, self.chave))
+        conexao.close()
+
+def main():
+    argumentos = argparse.ArgumentParser(description="Trabalhador para PAR distribuído do MiniPar")
+    argumentos.add_argument('porta', type=int)
+    argumentos.add_argument('--host', default='127.0.0.1')
+    argumentos.add_argument('--metricas', metavar='ARQUIVO',
+                            help="grava as métricas dos canais ao sair e a cada SIGUSR1 (.json ou OpenMetrics)")
+    opcoes = argumentos.parse_args()
+    if opcoes.metricas:
+        metricas.exportar_ao_sair(opcoes.metricas)
+    try:
+        trabalhador = Trabalhador(opcoes.host, opcoes.porta)
+    except ValueError as e:
+        print(f"Erro: {e}")
+        sys.exit(2)
+    try:
+        trabalhador.servir()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
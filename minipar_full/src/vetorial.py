@@ -0,0 +1,328 @@
+# src/vetorial.py
+"""
+Operações vetoriais sobre listas numéricas: + - * / elemento a elemento
+entre listas e escalares (e entre listas, exceto +, que concatena) e as
+nativas add, dot, sum, matmul, exp, relu e sigmoid. Uma Matriz
+(matriz.py) opera com outra do mesmo formato, com um escalar ou com um
+vetor do tamanho de uma linha (aplicado a cada linha), + incluído.
+
+Com NumPy instalado, operações com floats sobre pelo menos LIMIAR elementos
+viram uma chamada NumPy só; sem NumPy, em listas pequenas (onde converter
+custa mais que o laço) e entre inteiros (NumPy estoura em 64 bits, o
+MiniPar não) o cálculo é em Python. Os dois caminhos devolvem o mesmo:
+ListaTipada (listas.py) para vetores, lista de ListaTipada para matrizes e
+int/float para escalares; Matriz quando um dos operandos é Matriz.
+"""
+import array
+import itertools
+import math
+import operator
+
+from listas import ListaTipada
+from matriz import ErroMatriz, LinhaMatriz, Matriz
+
+try:
+    import numpy
+except ImportError:  # NumPy é opcional
+    numpy = None
+
+LIMIAR = 64  # Elementos a partir dos quais vale converter para NumPy
+
+_OPERACOES = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv}
+_FUNCOES_NUMPY = {'+': 'add', '-': 'subtract', '*': 'multiply', '/': 'true_divide'}
+_DTYPES = {'q': 'int64', 'd': 'float64'}
+
+class ErroVetorial(ValueError):
+    pass
+
+# --------------------------------------
+# Conversões
+# --------------------------------------
+def _sequencia(valor):
+    return isinstance(valor, (list, array.array, Matriz))
+
+def _normalizar(valor):
+    """Linha de matriz (uma vista) vira vetor; o resto fica como está."""
+    return valor.valores() if isinstance(valor, LinhaMatriz) else valor
+
+def _numero(valor):
+    return isinstance(valor, (int, float))
+
+def _numerica(valor):
+    """Número, ou lista (também aninhada) só de números."""
+    if isinstance(valor, array.array):
+        return valor.typecode in _DTYPES
+    if isinstance(valor, Matriz):
+        return True
+    if isinstance(valor, list):
+        return all(_numerica(item) for item in valor)
+    return _numero(valor)
+
+def _tem_float(valor):
+    if isinstance(valor, array.array):
+        return valor.typecode == 'd'
+    if isinstance(valor, Matriz):
+        return True
+    if isinstance(valor, list):
+        return any(_tem_float(item) for item in valor)
+    return type(valor) is float
+
+def _tamanho(valor):
+    if isinstance(valor, Matriz):
+        return len(valor.dados)
+    if not _sequencia(valor):
+        return 1
+    return len(valor) * (_tamanho(valor[0]) if len(valor) and _sequencia(valor[0]) else 1)
+
+def vetor(valores):
+    """ListaTipada com os valores ('q' se todos forem int de 64 bits, senão 'd')."""
+    if all(type(valor) is int for valor in valores):
+        try:
+            return ListaTipada('q', valores)
+        except OverflowError:
+            return list(valores)  # Inteiros grandes ficam numa lista comum
+    return ListaTipada('d', valores)
+
+def _resultado(itens):
+    """Vetor de números ou matriz (lista das linhas)."""
+    return itens if itens and _sequencia(itens[0]) else vetor(itens)
+
+def _para_numpy(valor):
+    if isinstance(valor, Matriz):
+        return numpy.frombuffer(valor.dados, dtype='float64').reshape(valor.linhas, valor.colunas)
+    if isinstance(valor, array.array):
+        return numpy.frombuffer(valor, dtype=_DTYPES[valor.typecode])  # Sem cópia
+    if isinstance(valor, list):
+        return numpy.array([_para_numpy(item) for item in valor]) if valor and _sequencia(valor[0]) \
+            else numpy.array(valor, dtype='float64' if _tem_float(valor) else None)
+    return valor
+
+def _de_numpy(valor):
+    if not isinstance(valor, numpy.ndarray):
+        return valor.item() if isinstance(valor, numpy.generic) else valor
+    if valor.ndim == 0:
+        return valor.item()
+    if valor.ndim > 1:
+        return [_de_numpy(linha) for linha in valor]
+    codigo = 'd' if valor.dtype.kind == 'f' else 'q'
+    lista = ListaTipada(codigo)
+    lista.frombytes(numpy.ascontiguousarray(valor, dtype=_DTYPES[codigo]).tobytes())
+    return lista
+
+def _matriz_de_numpy(valor):
+    """Resultado NumPy de uma operação com Matriz: matriz 2-D vira Matriz, o resto como em _de_numpy."""
+    if not isinstance(valor, numpy.ndarray) or valor.ndim != 2:
+        return _de_numpy(valor)
+    dados = array.array('d')
+    dados.frombytes(numpy.ascontiguousarray(valor, dtype='float64').tobytes())
+    return Matriz(valor.shape[0], valor.shape[1], dados)
+
+def _usar_numpy(*valores):
+    return numpy is not None and any(_tem_float(v) for v in valores) and max(map(_tamanho, valores)) >= LIMIAR
+
+def _com_numpy(funcao, *valores):
+    converter = _matriz_de_numpy if any(isinstance(v, Matriz) for v in valores) else _de_numpy
+    with numpy.errstate(divide='raise', over='raise', invalid='raise'):
+        try:
+            return converter(funcao(*map(_para_numpy, valores)))
+        except (FloatingPointError, ValueError) as e:  # Estouro, divisão por zero, dimensões incompatíveis
+            raise ErroVetorial(str(e))
+
+# --------------------------------------
+# Aritmética elemento a elemento
+# --------------------------------------
+def _elementos(funcao, a, b):
+    if _sequencia(a) and _sequencia(b):
+        if len(a) != len(b):
+            raise ErroVetorial(f"listas de tamanhos diferentes ({len(a)} e {len(b)})")
+        itens = [_elementos(funcao, x, y) for x, y in zip(a, b)]
+    elif _sequencia(a):
+        itens = [_elementos(funcao, x, b) for x in a]
+    elif _sequencia(b):
+        itens = [_elementos(funcao, a, y) for y in b]
+    else:
+        return funcao(a, b)
+    return _resultado(itens)
+
+def _como_matriz(valor):
+    """Lista de linhas vira Matriz; vetores e escalares ficam como estão."""
+    if isinstance(valor, list) and valor and _sequencia(valor[0]):
+        return Matriz.de_linhas(valor)
+    return valor
+
+def _dados_alinhados(m, valor):
+    """Valores de `valor` na ordem de m.dados: outra Matriz, vetor repetido por linha ou escalar repetido."""
+    if isinstance(valor, Matriz):
+        if (valor.linhas, valor.colunas) != (m.linhas, m.colunas):
+            raise ErroVetorial(f"matrizes de formatos diferentes ({m.linhas}x{m.colunas} e {valor.linhas}x{valor.colunas})")
+        return valor.dados
+    if _sequencia(valor):
+        if len(valor) != m.colunas:
+            raise ErroVetorial(f"vetor de {len(valor)} valores numa matriz de {m.colunas} colunas")
+        return itertools.chain.from_iterable(itertools.repeat(valor, m.linhas))
+    return itertools.repeat(valor)
+
+def _operar_matriz(op, a, b):
+    """a op b com pelo menos uma Matriz (o outro operando se estende às linhas dela)."""
+    try:
+        a, b = _como_matriz(a), _como_matriz(b)
+    except ErroMatriz as e:  # Linhas de tamanhos diferentes
+        raise ErroVetorial(str(e))
+    if _usar_numpy(a, b):
+        return _com_numpy(getattr(numpy, _FUNCOES_NUMPY[op]), a, b)
+    m = a if isinstance(a, Matriz) else b
+    funcao = _OPERACOES[op]
+    try:
+        if m is a:
+            dados = array.array('d', map(funcao, a.dados, _dados_alinhados(m, b)))
+        else:
+            dados = array.array('d', map(funcao, _dados_alinhados(m, a), b.dados))
+    except ZeroDivisionError:
+        raise ErroVetorial("divisão por zero")
+    except OverflowError as e:
+        raise ErroVetorial(str(e))
+    return Matriz(m.linhas, m.colunas, dados)
+
+def operar(op, a, b):
+    """a op b elemento a elemento; NotImplemented quando não se aplica (sem lista numérica, ou + entre listas)."""
+    a, b = _normalizar(a), _normalizar(b)
+    if isinstance(a, Matriz) or isinstance(b, Matriz):
+        if not (_numerica(a) and _numerica(b)):
+            return NotImplemented
+        return _operar_matriz(op, a, b)
+    if not (_sequencia(a) or _sequencia(b)) or (op == '+' and _sequencia(a) and _sequencia(b)):
+        return NotImplemented
+    if not (_numerica(a) and _numerica(b)):
+        return NotImplemented
+    if _usar_numpy(a, b):
+        return _com_numpy(getattr(numpy, _FUNCOES_NUMPY[op]), a, b)
+    try:
+        return _elementos(_OPERACOES[op], a, b)
+    except ZeroDivisionError:
+        raise ErroVetorial("divisão por zero")
+
+# --------------------------------------
+# Nativas
+# --------------------------------------
+def atualizar(op, m, valor):
+    """m op= valor na própria Matriz (m += v, m *= 0.5...), sem criar outra."""
+    valor = _normalizar(valor)
+    _conferir(valor)
+    try:
+        valor = _como_matriz(valor)
+    except ErroMatriz as e:
+        raise ErroVetorial(str(e))
+    if _usar_numpy(m, valor):
+        destino = _para_numpy(m)  # Vista do próprio buffer: out= escreve em m.dados
+        with numpy.errstate(divide='raise', over='raise', invalid='raise'):
+            try:
+                getattr(numpy, _FUNCOES_NUMPY[op])(destino, _para_numpy(valor), out=destino)
+            except (FloatingPointError, ValueError) as e:
+                raise ErroVetorial(str(e))
+        return m
+    m.dados[:] = _operar_matriz(op, m, valor).dados
+    return m
+
+def _conferir(*valores):
+    for valor in valores:
+        if not _numerica(valor):
+            raise TypeError(f"esperava número ou lista numérica, recebeu {type(valor).__name__}")
+
+def add(a, b):
+    """add(a, b): soma elemento a elemento (o operador + entre listas concatena)."""
+    a, b = _normalizar(a), _normalizar(b)
+    _conferir(a, b)
+    if isinstance(a, Matriz) or isinstance(b, Matriz):
+        return _operar_matriz('+', a, b)
+    if _usar_numpy(a, b):
+        return _com_numpy(numpy.add, a, b)
+    return _elementos(operator.add, a, b)
+
+def dot(a, b):
+    """dot(a, b): produto escalar de dois vetores."""
+    a, b = _normalizar(a), _normalizar(b)
+    _conferir(a, b)
+    if isinstance(a, Matriz) or isinstance(b, Matriz):
+        raise ErroVetorial("dot espera dois vetores (para matrizes, use matmul)")
+    if not (_sequencia(a) and _sequencia(b)) or len(a) != len(b) or (a and (_sequencia(a[0]) or _sequencia(b[0]))):
+        raise ErroVetorial("dot espera dois vetores do mesmo tamanho")
+    if _usar_numpy(a, b):
+        return _com_numpy(numpy.dot, a, b)
+    return sum(x * y for x, y in zip(a, b))
+
+def soma(valor):
+    """sum(lista): soma de todos os elementos (também de matrizes)."""
+    valor = _normalizar(valor)
+    _conferir(valor)
+    if _usar_numpy(valor):
+        return _com_numpy(numpy.sum, valor)
+    if isinstance(valor, Matriz):
+        return sum(valor.dados)
+    if not _sequencia(valor):
+        return valor
+    return sum(soma(item) if _sequencia(item) else item for item in valor)
+
+def matmul(a, b):
+    """matmul(a, b): produto de matrizes (Matriz ou listas de linhas), de matriz por vetor ou de vetor por matriz."""
+    a, b = _normalizar(a), _normalizar(b)
+    _conferir(a, b)
+    if not (_sequencia(a) and _sequencia(b)):
+        raise ErroVetorial("matmul espera matrizes ou vetores")
+    if _usar_numpy(a, b):
+        return _com_numpy(numpy.matmul, a, b)
+    if isinstance(a, Matriz) or isinstance(b, Matriz):
+        # Sem NumPy: produto sobre as linhas e, se o resultado for matriz, de volta a Matriz
+        linhas = lambda v: [linha.valores() for linha in v] if isinstance(v, Matriz) else v
+        resultado = matmul(linhas(a), linhas(b))
+        return Matriz.de_linhas(resultado) if isinstance(resultado, list) else resultado
+    matriz_a = bool(a) and _sequencia(a[0])
+    matriz_b = bool(b) and _sequencia(b[0])
+    if not matriz_b:
+        if not matriz_a:
+            return dot(a, b)
+        if any(len(linha) != len(b) for linha in a):
+            raise ErroVetorial("dimensões incompatíveis para matmul")
+        return vetor([dot(linha, b) for linha in a])  # Matriz x vetor
+    if len(b) != (len(a[0]) if matriz_a else len(a)):
+        raise ErroVetorial("dimensões incompatíveis para matmul")
+    colunas = list(zip(*b))
+    if not matriz_a:
+        return vetor([sum(x * y for x, y in zip(a, coluna)) for coluna in colunas])  # Vetor x matriz
+    return [vetor([sum(x * y for x, y in zip(linha, coluna)) for coluna in colunas]) for linha in a]
+
+def _aplicar(funcao, funcao_numpy, valor):
+    """Aplica uma função de um número a um número ou a cada elemento de uma lista."""
+    valor = _normalizar(valor)
+    _conferir(valor)
+    if not _sequencia(valor):
+        return funcao(valor)
+    if numpy is not None and _tamanho(valor) >= LIMIAR:
+        return _com_numpy(funcao_numpy, valor)
+    if isinstance(valor, Matriz):
+        return Matriz(valor.linhas, valor.colunas, array.array('d', map(funcao, valor.dados)))
+    return _resultado([_aplicar(funcao, funcao_numpy, item) for item in valor])
+
+def _sigmoid(x):
+    if x >= 0:
+        return 1 / (1 + math.exp(-x))
+    e = math.exp(x)  # Forma estável para x muito negativo (exp(-x) estouraria)
+    return e / (1 + e)
+
+def _relu(x):
+    if x > 0:
+        return x
+    return 0.0 if type(x) is float else 0
+
+def exp(valor):
+    """exp(x): e elevado a x, de um número ou de cada elemento."""
+    if type(valor) in (int, float):
+        return math.exp(valor)
+    return _aplicar(math.exp, numpy and numpy.exp, valor)
+
+def relu(valor):
+    """relu(x): max(x, 0) de um número ou de cada elemento."""
+    return _aplicar(_relu, numpy and (lambda v: numpy.maximum(v, 0)), valor)
+
+def sigmoid(valor):
+    """sigmoid(x): 1 / (1 + exp(-x)) de um número ou de cada elemento."""
+    return _aplicar(_sigmoid, numpy and (lambda v: 0.5 * (1 + numpy.tanh(0.5 * v))), valor)